@@ -1,4 +1,4 @@
-import os, shutil, subprocess, sys, re
+import os, shutil, subprocess, sys, re, hashlib
 
 # =======================
 # CONFIG – adjust if needed
@@ -37,14 +37,35 @@ def ensure_dirs():
     os.makedirs(IMAGES_DIR, exist_ok=True)
     os.makedirs(TALKS_DIR, exist_ok=True)
 
+def same_file_content(src_path, dst_path):
+    """True if dst already holds the same bytes (size+mtime, then hash)."""
+    if not os.path.exists(dst_path):
+        return False
+    s, d = os.stat(src_path), os.stat(dst_path)
+    if s.st_size != d.st_size:
+        return False
+    if s.st_mtime_ns == d.st_mtime_ns:
+        return True
+    digests = []
+    for p in (src_path, dst_path):
+        h = hashlib.sha256()
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digests.append(h.hexdigest())
+    return digests[0] == digests[1]
+
 def try_copy(src_path, dst_dir):
     """Copy file if exists; return site-relative url or ''."""
     if not src_path or not os.path.exists(src_path):
         return ""
     os.makedirs(dst_dir, exist_ok=True)
     dst = os.path.join(dst_dir, os.path.basename(src_path))
-    shutil.copy2(src_path, dst)
-    print(f"✅ Copied -> {dst}")
+    if same_file_content(src_path, dst):
+        print(f"⏭️ Unchanged, skipped -> {dst}")
+    else:
+        shutil.copy2(src_path, dst)
+        print(f"✅ Copied -> {dst}")
     if dst_dir.endswith("files"):
         return f"/files/{os.path.basename(dst)}"
     if dst_dir.endswith("images"):
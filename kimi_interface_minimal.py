@@ -5,12 +5,23 @@ Reusable, minimal Kimi (Moonshot) API interface.
 Features
 - Reads your API key from a local file (recommended) or env var.
 - Chat-completions style call via requests.
-- Robust retries (429/5xx) with exponential backoff.
-- Optional on-disk caching keyed by request payload hash.
+- Robust retries (429/5xx, connection errors, timeouts) with exponential
+  backoff; other 4xx errors fail immediately.
+- Configurable transport: connection pool size, keep-alive, urllib3 Retry
+  for connection setup, optional HTTP/2 via httpx.
+- Two-tier response cache keyed by request payload hash: an in-memory LRU
+  in front of an on-disk store with TTL and max-bytes eviction.
+- Identical concurrent requests are coalesced into one HTTP call.
+- chat_many()/achat_many() run batches concurrently under token-bucket
+  requests-per-minute and tokens-per-minute limits, honouring Retry-After.
+- Per-call latency/retry metrics (client.metrics, client.metrics_summary()).
+- SSE streaming (chat_stream) and incremental JSON parsing: chat_json(stream=True)
+  returns as soon as the JSON value closes, or earlier via an ``until`` predicate.
 - Helpers for strict-JSON prompting and parsing.
 
 Install
     pip install requests
+    pip install "httpx[http2]"   # only for KimiConfig(http2=True)
 
 Usage (quick)
     from kimi_interface_minimal import KimiClient
@@ -31,6 +42,22 @@ Usage (quick)
     ])
     print(obj)
 
+    pages = ["page one ...", "page two ..."]
+    summaries = client.chat_many(
+        [[{"role": "user", "content": f"Summarize: {p}"}] for p in pages],
+        parse="text",
+    )
+    print(summaries, client.metrics_summary())
+
+    for token in client.chat_stream([{"role": "user", "content": "Count to five."}]):
+        print(token, end="", flush=True)
+
+    verdict = client.chat_json(
+        [{"role": "user", "content": "Return JSON: {\"published\": true, \"reason\": \"...\"}"}],
+        stream=True,
+        until=lambda fields: "published" in fields,  # stop reading once decided
+    )
+
 Notes
 - If your Kimi deployment uses a different endpoint or response schema, adjust:
     - endpoint path in _chat_completions_url()
@@ -39,13 +66,21 @@ Notes
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import hashlib
 import json
 import os
+import re
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -61,21 +96,442 @@ class KimiConfig:
     backoff_max_s: float = 20.0
     temperature: float = 0.1
     default_max_tokens: int = 512
+    memory_cache_entries: int = 256
+    disk_cache_max_bytes: int = 64 * 1024 * 1024
+    disk_cache_ttl_s: float = 7 * 24 * 3600
+    rpm_limit: int = 0  # requests per minute, 0 = unlimited
+    tpm_limit: int = 0  # tokens per minute (prompt estimate + max_tokens), 0 = unlimited
+    max_concurrency: int = 8
+    retry_after_max_s: float = 120.0
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    keep_alive: bool = True
+    keep_alive_expiry_s: float = 60.0
+    http2: bool = False  # requires httpx[http2]
+    connect_timeout_s: float = 10.0
+    connect_retries: int = 3  # transport-level, before the request is sent
+
+
+TRANSIENT_STATUS_CODES = frozenset((408, 425, 429, 500, 502, 503, 504))
+STREAM_READ_CHUNK = 65536
+
+
+class KimiHTTPError(RuntimeError):
+    """Non-2xx response. ``transient`` marks statuses worth retrying."""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"HTTP {status}: {body[:300]}")
+        self.status = status
+        self.transient = status in TRANSIENT_STATUS_CODES
+
+
+class RequestsTransport:
+    """requests.Session with a sized urllib3 pool and connect-only Retry.
+
+    Status retries are left to KimiClient so that Retry-After, the rate
+    limiter and metrics see every attempt; urllib3 only retries failures to
+    establish a connection, which are always safe for a POST.
+    """
+
+    def __init__(self, cfg: KimiConfig, headers: Dict[str, str]):
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.cfg = cfg
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        if not cfg.keep_alive:
+            self.session.headers["Connection"] = "close"
+        retry = Retry(
+            total=cfg.connect_retries,
+            connect=cfg.connect_retries,
+            read=0,
+            status=0,
+            other=0,
+            redirect=0,
+            backoff_factor=cfg.backoff_base_s / 2,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=cfg.pool_connections, pool_maxsize=cfg.pool_maxsize, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.transient_errors: Tuple[type, ...] = (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        )
+
+    def post(self, url: str, payload: Dict[str, Any], stream: bool = False) -> Any:
+        return self.session.post(
+            url,
+            json=payload,
+            timeout=(self.cfg.connect_timeout_s, self.cfg.timeout_s),
+            stream=stream,
+            headers={"Accept": "text/event-stream"} if stream else None,
+        )
+
+    @staticmethod
+    def body_text(r: Any) -> str:
+        return r.text
+
+    @staticmethod
+    def iter_lines(r: Any) -> Iterator[str]:
+        # Response.iter_lines buffers 512 bytes (or, with chunk_size=None, a
+        # whole close-delimited body) before yielding, which would hold SSE
+        # deltas back; read1 returns whatever has arrived.
+        read1 = getattr(r.raw, "read1", None)
+        if read1 is None:
+            r.encoding = r.encoding or "utf-8"
+            yield from r.iter_lines(chunk_size=None, decode_unicode=True)
+            return
+        decoder = codecs.getincrementaldecoder(r.encoding or "utf-8")(errors="replace")
+        pending = ""
+        while True:
+            chunk = read1(STREAM_READ_CHUNK, decode_content=True)
+            if not chunk:
+                break
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending.rstrip("\r")
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpxTransport:
+    """httpx.Client with HTTP/2 multiplexing (one connection, many streams)."""
+
+    def __init__(self, cfg: KimiConfig, headers: Dict[str, str]):
+        try:
+            import httpx
+        except ImportError as e:
+            raise RuntimeError('KimiConfig(http2=True) requires httpx. Install with: pip install "httpx[http2]"') from e
+
+        self.cfg = cfg
+        limits = httpx.Limits(
+            max_connections=cfg.pool_maxsize,
+            max_keepalive_connections=cfg.pool_maxsize if cfg.keep_alive else 0,
+            keepalive_expiry=cfg.keep_alive_expiry_s,
+        )
+        try:
+            transport = httpx.HTTPTransport(http2=True, limits=limits, retries=cfg.connect_retries)
+        except ImportError as e:
+            raise RuntimeError('HTTP/2 support requires the h2 package. Install with: pip install "httpx[http2]"') from e
+        self.client = httpx.Client(
+            headers=headers,
+            transport=transport,
+            timeout=httpx.Timeout(cfg.timeout_s, connect=cfg.connect_timeout_s),
+        )
+        self.transient_errors: Tuple[type, ...] = (httpx.TransportError,)
+
+    def post(self, url: str, payload: Dict[str, Any], stream: bool = False) -> Any:
+        headers = {"Accept": "text/event-stream"} if stream else None
+        request = self.client.build_request("POST", url, json=payload, headers=headers)
+        return self.client.send(request, stream=stream)
+
+    @staticmethod
+    def body_text(r: Any) -> str:
+        r.read()
+        return r.text
+
+    @staticmethod
+    def iter_lines(r: Any) -> Iterator[str]:
+        return r.iter_lines()
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate_per_minute``.
+
+    ``acquire`` blocks until the requested amount is available. ``adjust``
+    settles the difference between an estimate and the actual usage and may
+    leave the bucket in debt, which delays later callers.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_s = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens, sleeping as needed. Returns seconds waited."""
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate_per_s
+            time.sleep(delay)
+            waited += delay
+
+    def adjust(self, delta: float) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - delta)
+
+
+@dataclass
+class CallMetrics:
+    payload_hash: str
+    latency_s: float
+    retries: int = 0
+    throttled_s: float = 0.0
+    status: int = 0
+    tokens: int = 0
+    first_token_s: float = 0.0
+    cached: bool = False
+    coalesced: bool = False
+    streamed: bool = False
+    error: str = ""
+
+
+class IncrementalJSON:
+    """Incremental scanner for one JSON value embedded in streamed text.
+
+    ``feed`` returns True once the first top-level object/array closes, so the
+    caller can stop reading; leading prose or code fences are skipped.
+    ``fields`` exposes the scalar fields of the outermost object that are
+    already complete (keys inside nested values are ignored), which lets a
+    caller act before the value closes.
+    """
+
+    _FIELD_RE = re.compile(
+        r'"((?:[^"\\]|\\.)*)"\s*:\s*'
+        r'(true|false|null|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|"(?:[^"\\]|\\.)*")\s*(?=[,}])'
+    )
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_str = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        return self.end >= 0
+
+    def feed(self, chunk: str) -> bool:
+        if self.done:
+            return True
+        self.text += chunk
+        for i in range(self._pos, len(self.text)):
+            ch = self.text[i]
+            if self.start < 0:
+                if ch in "{[":
+                    self.start, self._depth = i, 1
+                continue
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = i + 1
+                    return True
+        self._pos = len(self.text)
+        return False
+
+    def value(self) -> Any:
+        if not self.done:
+            raise ValueError("JSON value is not complete yet")
+        return json.loads(self.text[self.start : self.end])
+
+    def fields(self) -> Dict[str, Any]:
+        if self.start < 0 or self.text[self.start] != "{":
+            return {}
+        body = self.text[self.start : self.end if self.done else len(self.text)]
+        out: Dict[str, Any] = {}
+        depth = 0
+        in_str = escape = expect_key = False
+        for i, ch in enumerate(body):
+            if in_str:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_str = False
+                continue
+            if ch == '"':
+                # Only keys of the outermost object count; nested objects
+                # may reuse the same names.
+                if expect_key:
+                    m = self._FIELD_RE.match(body, i)
+                    if m:
+                        out.setdefault(json.loads(f'"{m.group(1)}"'), json.loads(m.group(2)))
+                    expect_key = False
+                in_str = True
+            elif ch in "{[":
+                depth += 1
+                expect_key = depth == 1
+            elif ch in "}]":
+                depth -= 1
+            elif ch == "," and depth == 1:
+                expect_key = True
+        return out
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU keyed by payload hash."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+
+class DiskCache:
+    """One compact JSON file per payload hash with TTL and size-capped eviction.
+
+    Writes go through a temp file + os.replace so a crash never leaves a
+    truncated entry. Hits refresh the file's mtime, so eviction (oldest mtime
+    first) approximates LRU across processes as well.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int, ttl_s: float):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, float]] = {}
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            self._index[path.stem] = (st.st_size, st.st_mtime)
+        self._total = sum(size for size, _ in self._index.values())
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.path(key)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if self.ttl_s > 0 and time.time() - entry[1] > self.ttl_s:
+                self._remove(key)
+                return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            now = time.time()
+            os.utime(path, (now, now))
+        except (OSError, ValueError):
+            with self._lock:
+                self._remove(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index[key] = (self._index[key][0], now)
+        return data
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if self.max_bytes > 0 and len(raw) > self.max_bytes:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(raw)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            old = self._index.get(key)
+            self._total += len(raw) - (old[0] if old else 0)
+            self._index[key] = (len(raw), time.time())
+            self._evict()
+
+    def _remove(self, key: str) -> None:
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._total -= entry[0]
+        self.path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        if self.max_bytes <= 0 or self._total <= self.max_bytes:
+            return
+        for key, _ in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            if self._total <= self.max_bytes:
+                break
+            self._remove(key)
 
 
 class KimiClient:
     def __init__(self, cfg: KimiConfig, cache_dir: str | Path = ".kimi_cache"):
         self.cfg = cfg
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_cache = LRUCache(cfg.memory_cache_entries)
+        self.disk_cache = DiskCache(self.cache_dir, cfg.disk_cache_max_bytes, cfg.disk_cache_ttl_s)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.request_bucket = TokenBucket(cfg.rpm_limit) if cfg.rpm_limit > 0 else None
+        self.token_bucket = TokenBucket(cfg.tpm_limit) if cfg.tpm_limit > 0 else None
+        self.metrics: List[CallMetrics] = []
+        self._metrics_lock = threading.Lock()
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.cfg.api_key}",
-                "Content-Type": "application/json",
-            }
-        )
+        headers = {
+            "Authorization": f"Bearer {self.cfg.api_key}",
+            "Content-Type": "application/json",
+        }
+        self.transport = HttpxTransport(cfg, headers) if cfg.http2 else RequestsTransport(cfg, headers)
+        self.session = getattr(self.transport, "session", None)
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def __enter__(self) -> "KimiClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     # -------------------------
     # Constructors
@@ -134,8 +590,17 @@ class KimiClient:
         raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
         return hashlib.sha256(raw).hexdigest()
 
-    def _cache_path(self, payload_hash: str) -> Path:
-        return self.cache_dir / f"{payload_hash}.json"
+    def _cache_get(self, payload_hash: str) -> Optional[Dict[str, Any]]:
+        data = self.memory_cache.get(payload_hash)
+        if data is None:
+            data = self.disk_cache.get(payload_hash)
+            if data is not None:
+                self.memory_cache.put(payload_hash, data)
+        return data
+
+    def _cache_put(self, payload_hash: str, data: Dict[str, Any]) -> None:
+        self.memory_cache.put(payload_hash, data)
+        self.disk_cache.put(payload_hash, data)
 
     # -------------------------
     # Core call
@@ -151,6 +616,57 @@ class KimiClient:
     ) -> Dict[str, Any]:
         """Low-level call. Returns the raw JSON response."""
 
+        payload = self._build_payload(messages, temperature, max_tokens, extra)
+        h = self._payload_hash(payload)
+        started = time.perf_counter()
+        metric = CallMetrics(payload_hash=h, latency_s=0.0)
+
+        try:
+            if use_cache:
+                cached = self._cache_get(h)
+                if cached is not None:
+                    metric.cached = True
+                    return cached
+
+            # Coalesce identical in-flight payloads: the first caller performs the
+            # request, concurrent callers wait on its result.
+            with self._inflight_lock:
+                pending = self._inflight.get(h)
+                leader = pending is None
+                if leader:
+                    pending = self._inflight[h] = Future()
+            if not leader:
+                metric.coalesced = True
+                return pending.result()
+
+            try:
+                data = self._post_with_retries(payload, metric)
+            except BaseException as e:
+                pending.set_exception(e)
+                raise
+            else:
+                if use_cache:
+                    self._cache_put(h, data)
+                pending.set_result(data)
+                return data
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(h, None)
+        except Exception as e:
+            metric.error = str(e)[:300]
+            raise
+        finally:
+            metric.latency_s = time.perf_counter() - started
+            with self._metrics_lock:
+                self.metrics.append(metric)
+
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        extra: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": self.cfg.model,
             "messages": messages,
@@ -159,38 +675,245 @@ class KimiClient:
         }
         if extra:
             payload.update(extra)
+        return payload
 
-        h = self._payload_hash(payload)
-        cpath = self._cache_path(h)
+    @staticmethod
+    def _estimate_tokens(payload: Dict[str, Any]) -> int:
+        # Rough prompt estimate (~4 chars/token) plus the completion budget.
+        chars = sum(len(str(m.get("content") or "")) for m in payload.get("messages") or [])
+        return chars // 4 + int(payload.get("max_tokens") or 0)
 
-        if use_cache and cpath.exists():
-            return json.loads(cpath.read_text(encoding="utf-8"))
+    def _retry_after_s(self, r: Any) -> Optional[float]:
+        value = (r.headers.get("Retry-After") or "").strip()
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return max(0.0, min(self.cfg.retry_after_max_s, seconds))
+
+    def _throttle(self, estimate: int) -> float:
+        waited = 0.0
+        if self.request_bucket is not None:
+            waited += self.request_bucket.acquire(1)
+        if self.token_bucket is not None:
+            waited += self.token_bucket.acquire(estimate)
+        return waited
+
+    def _send_with_retries(self, payload: Dict[str, Any], metric: CallMetrics, stream: bool = False) -> Any:
+        """POST the payload, retrying only transient failures.
 
+        Transient means connection errors, timeouts and the statuses in
+        TRANSIENT_STATUS_CODES (honouring Retry-After). Any other HTTP error
+        is raised immediately as KimiHTTPError. For streams, only opening the
+        stream is retried; once tokens reach the caller nothing is replayed.
+        """
         url = self._chat_completions_url()
         last_err: Optional[Exception] = None
+        estimate = self._estimate_tokens(payload)
+        body = dict(payload, stream=True) if stream else payload
 
         for attempt in range(self.cfg.max_retries):
+            metric.retries = attempt
+            metric.throttled_s += self._throttle(estimate)
+            retry_after: Optional[float] = None
             try:
-                r = self.session.post(url, json=payload, timeout=self.cfg.timeout_s)
+                r = self.transport.post(url, body, stream=stream)
+                metric.status = r.status_code
+                if r.status_code >= 400:
+                    err = KimiHTTPError(r.status_code, self.transport.body_text(r))
+                    retry_after = self._retry_after_s(r) if err.transient else None
+                    r.close()
+                    raise err
+                return r
+            except KimiHTTPError as e:
+                if not e.transient:
+                    raise
+                last_err = e
+            except self.transport.transient_errors as e:
+                last_err = e
+            if attempt + 1 < self.cfg.max_retries:
+                if retry_after is not None:
+                    sleep_s = retry_after
+                else:
+                    sleep_s = min(self.cfg.backoff_max_s, self.cfg.backoff_base_s * (2**attempt))
+                time.sleep(sleep_s)
 
-                # Retry on common transient conditions
-                if r.status_code in (429, 500, 502, 503, 504):
-                    raise RuntimeError(f"HTTP {r.status_code}: {r.text[:300]}")
+        raise RuntimeError(f"Kimi request failed after retries: {last_err}")
 
-                r.raise_for_status()
-                data = r.json()
+    def _post_with_retries(self, payload: Dict[str, Any], metric: CallMetrics) -> Dict[str, Any]:
+        r = self._send_with_retries(payload, metric)
+        try:
+            data = r.json()
+        except ValueError as e:
+            raise RuntimeError(f"Invalid JSON response: {self.transport.body_text(r)[:300]}") from e
+        used = int((data.get("usage") or {}).get("total_tokens") or 0)
+        if used:
+            metric.tokens = used
+            if self.token_bucket is not None:
+                self.token_bucket.adjust(used - self._estimate_tokens(payload))
+        return data
 
-                if use_cache:
-                    cpath.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    # -------------------------
+    # Streaming
+    # -------------------------
+    def _iter_sse_deltas(self, r: Any, metric: CallMetrics) -> Iterator[str]:
+        for line in self.transport.iter_lines(r):
+            if not line or line.startswith(":") or not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                return
+            try:
+                event = json.loads(data)
+            except ValueError as e:
+                raise RuntimeError(f"Malformed stream event: {data[:200]}") from e
+            usage = event.get("usage") or (event.get("choices") or [{}])[0].get("usage")
+            if usage:
+                metric.tokens = int(usage.get("total_tokens") or 0)
+            for choice in event.get("choices") or []:
+                delta = (choice.get("delta") or {}).get("content")
+                if delta:
+                    yield delta
 
-                return data
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        *,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Yield completion text as it arrives (server-sent events).
 
-            except Exception as e:
-                last_err = e
-                sleep_s = min(self.cfg.backoff_max_s, self.cfg.backoff_base_s * (2**attempt))
-                time.sleep(sleep_s)
+        Closing the generator early aborts the HTTP stream. A stream read to
+        the end is cached under the same key as the equivalent chat() call,
+        and a cache hit is yielded as a single chunk.
+        """
+        payload = self._build_payload(messages, temperature, max_tokens, extra)
+        h = self._payload_hash(payload)
+        started = time.perf_counter()
+        metric = CallMetrics(payload_hash=h, latency_s=0.0, streamed=True)
+        parts: List[str] = []
+        try:
+            if use_cache:
+                cached = self._cache_get(h)
+                if cached is not None:
+                    metric.cached = True
+                    yield self._extract_content(cached)
+                    return
+            r = self._send_with_retries(payload, metric, stream=True)
+            try:
+                for delta in self._iter_sse_deltas(r, metric):
+                    if not parts:
+                        metric.first_token_s = time.perf_counter() - started
+                    parts.append(delta)
+                    yield delta
+            finally:
+                r.close()
+            if use_cache:
+                content = "".join(parts)
+                self._cache_put(h, {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]})
+        except Exception as e:
+            metric.error = str(e)[:300]
+            raise
+        finally:
+            metric.latency_s = time.perf_counter() - started
+            with self._metrics_lock:
+                self.metrics.append(metric)
 
-        raise RuntimeError(f"Kimi request failed after retries: {last_err}")
+    def metrics_summary(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            calls = list(self.metrics)
+        network = sorted(m.latency_s for m in calls if not (m.cached or m.coalesced))
+
+        def pct(q: float) -> Optional[float]:
+            if not network:
+                return None
+            return round(network[min(len(network) - 1, int(q * len(network)))], 3)
+
+        return {
+            "calls": len(calls),
+            "http_calls": len(network),
+            "cache_hits": sum(m.cached for m in calls),
+            "coalesced": sum(m.coalesced for m in calls),
+            "errors": sum(bool(m.error) for m in calls),
+            "retries": sum(m.retries for m in calls),
+            "throttled_s": round(sum(m.throttled_s for m in calls), 3),
+            "tokens": sum(m.tokens for m in calls),
+            "latency_p50_s": pct(0.5),
+            "latency_p95_s": pct(0.95),
+        }
+
+    # -------------------------
+    # Batched / async calls
+    # -------------------------
+    def _call(self, messages: List[Dict[str, str]], parse: str, **kwargs: Any) -> Any:
+        if parse == "json":
+            return self.chat_json(messages, **kwargs)
+        if parse == "text":
+            return self.chat_text(messages, **kwargs)
+        if parse == "raw":
+            return self.chat(messages, **kwargs)
+        raise ValueError(f"Unknown parse mode: {parse!r} (expected raw, text or json)")
+
+    def chat_many(
+        self,
+        batch: List[List[Dict[str, str]]],
+        *,
+        parse: str = "raw",
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run many conversations concurrently; results keep the input order.
+
+        Concurrency is capped by ``max_workers`` (default cfg.max_concurrency)
+        and throughput by the RPM/TPM token buckets. ``parse`` selects chat
+        (raw), chat_text (text) or chat_json (json). With
+        ``return_exceptions`` failed items hold their exception instead of
+        raising the first failure.
+        """
+        if not batch:
+            return []
+        workers = max(1, min(len(batch), max_workers or self.cfg.max_concurrency))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kimi") as pool:
+            futures = [pool.submit(self._call, messages, parse, **kwargs) for messages in batch]
+            results: List[Any] = []
+            for fut in futures:
+                try:
+                    results.append(fut.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+    async def achat(self, messages: List[Dict[str, str]], *, parse: str = "raw", **kwargs: Any) -> Any:
+        return await asyncio.to_thread(self._call, messages, parse, **kwargs)
+
+    async def achat_many(
+        self,
+        batch: List[List[Dict[str, str]]],
+        *,
+        parse: str = "raw",
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Async counterpart of chat_many() for callers already inside an event loop."""
+        limit = asyncio.Semaphore(max(1, max_concurrency or self.cfg.max_concurrency))
+
+        async def one(messages: List[Dict[str, str]]) -> Any:
+            async with limit:
+                return await self.achat(messages, parse=parse, **kwargs)
+
+        return await asyncio.gather(*(one(m) for m in batch), return_exceptions=return_exceptions)
 
     # -------------------------
     # Convenience wrappers
@@ -221,8 +944,39 @@ class KimiClient:
         use_cache: bool = True,
         extra: Optional[Dict[str, Any]] = None,
         allow_code_fence_cleanup: bool = True,
+        stream: bool = False,
+        until: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> Any:
-        """Calls chat_text() then parses strict JSON."""
+        """Calls chat_text() then parses strict JSON.
+
+        With ``stream=True`` the completion is parsed while it streams and the
+        call returns as soon as the JSON value closes. ``until`` is called with
+        the top-level scalar fields completed so far; when it returns True the
+        stream is aborted and those fields are returned as a (partial) dict.
+        """
+        if stream:
+            parser = IncrementalJSON()
+            tokens = self.chat_stream(
+                messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                use_cache=use_cache,
+                extra=extra,
+            )
+            try:
+                for delta in tokens:
+                    if parser.feed(delta):
+                        return parser.value()
+                    if until is not None:
+                        fields = parser.fields()
+                        if fields and until(fields):
+                            return fields
+            finally:
+                tokens.close()
+            if parser.start >= 0:
+                raise ValueError(f"Stream ended before the JSON value closed: {parser.text[-200:]!r}")
+            return json.loads(parser.text.strip())
+
         text = self.chat_text(
             messages,
             temperature=temperature,
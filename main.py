@@ -17,30 +17,128 @@ Quick examples:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import codecs
+import hashlib
 import json
 import os
 import re
+import shutil
+import ssl
 import subprocess
 import sys
 import time
+import threading
 import unicodedata
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from html import unescape
+from html import escape, unescape
+from html.parser import HTMLParser
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
-from urllib.request import Request, urlopen
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlsplit, urlunsplit
 
 
 REPO_ROOT = Path(__file__).resolve().parent
+COPY_CHUNK_SIZE = 1024 * 1024
+FICLONE = 0x40049409
 NAV_FILE = REPO_ROOT / "_data" / "navigation.yml"
 LEARNING_FILE = REPO_ROOT / "_pages" / "learning.md"
 NEWS_FILE = REPO_ROOT / "_pages" / "group-news.md"
 PUBLICATIONS_DIR = REPO_ROOT / "_publications"
 TALKS_DIR = REPO_ROOT / "_talks"
+TEACHING_DIR = REPO_ROOT / "_teaching"
+POSTS_DIR = REPO_ROOT / "_posts"
+PORTFOLIO_DIR = REPO_ROOT / "_portfolio"
 FILES_DIR = REPO_ROOT / "files"
 IMAGES_DIR = REPO_ROOT / "images"
+IMAGE_VARIANTS_DIR = IMAGES_DIR / "responsive"
+DEFAULT_IMAGE_WIDTHS = (480, 960, 1600)
+DEFAULT_IMAGE_FORMATS = ("webp",)
+RASTER_IMAGE_FORMATS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png", ".webp": "webp"}
+IMAGE_FORMAT_SUFFIXES = {"jpeg": ".jpg", "png": ".png", "webp": ".webp", "avif": ".avif"}
+IMAGE_SIZES_ATTR = "(max-width: 768px) 100vw, 768px"
+COLLECTION_DIRS = {
+    "publications": PUBLICATIONS_DIR,
+    "talks": TALKS_DIR,
+    "teaching": TEACHING_DIR,
+    "posts": POSTS_DIR,
+    "portfolio": PORTFOLIO_DIR,
+}
+COLLECTION_SUFFIXES = (".md", ".html")
+SITE_CACHE_DIR = REPO_ROOT / ".site_cache"
+FRONT_MATTER_CACHE_FILE = SITE_CACHE_DIR / "front_matter.json"
+FRONT_MATTER_CACHE_VERSION = 1
+ASSET_CACHE_FILE = SITE_CACHE_DIR / "assets.json"
+ASSET_CACHE_VERSION = 1
+IMAGE_MANIFEST_FILE = SITE_CACHE_DIR / "images.json"
+IMAGE_MANIFEST_VERSION = 2
+IMAGE_VARIANT_STAMPS_FILE = SITE_CACHE_DIR / "image_variants.json"
+IMAGE_VARIANT_STAMPS_VERSION = 1
+PDF_CACHE_DIR = SITE_CACHE_DIR / "pdf"
+SITE_DIR = REPO_ROOT / "_site"
+VERIFY_DIFF_PATHS = (*(d.name for d in COLLECTION_DIRS.values()), "_pages")
+GIT_EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+LINK_CACHE_FILE = SITE_CACHE_DIR / "links.json"
+LINK_CACHE_VERSION = 1
+LINK_FIELDS = ("paperurl", "slidesurl", "link", "header.teaser")
+LINK_BLOCKED_STATUSES = (401, 403, 429)
+BIB_CHUNK_SIZE = 200
+BIB_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+BIB_VENUE_FIELDS = ("journal", "journaltitle", "booktitle", "publisher", "school", "institution", "howpublished")
+BIB_CATEGORY_BY_TYPE = {
+    "article": "manuscripts",
+    "inproceedings": "conferences",
+    "conference": "conferences",
+    "proceedings": "conferences",
+    "book": "books",
+    "inbook": "books",
+    "incollection": "books",
+}
+LATEX_ACCENTS = {
+    "`": "\u0300",
+    "'": "\u0301",
+    "^": "\u0302",
+    "~": "\u0303",
+    "=": "\u0304",
+    "u": "\u0306",
+    ".": "\u0307",
+    '"': "\u0308",
+    "H": "\u030b",
+    "v": "\u030c",
+    "d": "\u0323",
+    "c": "\u0327",
+    "k": "\u0328",
+    "b": "\u0331",
+}
+LATEX_SYMBOLS = {
+    "ss": "ß",
+    "ae": "æ",
+    "AE": "Æ",
+    "oe": "œ",
+    "OE": "Œ",
+    "aa": "å",
+    "AA": "Å",
+    "o": "ø",
+    "O": "Ø",
+    "l": "ł",
+    "L": "Ł",
+    "i": "ı",
+    "j": "ȷ",
+}
+# Text files scanned for asset references: everything Jekyll renders
+# (including assets/ and _sass) plus the docs and notebooks kept beside it.
+ASSET_REFERENCE_SUFFIXES = frozenset(
+    (".md", ".markdown", ".html", ".htm", ".yml", ".yaml", ".json", ".xml", ".js", ".css", ".scss", ".sass", ".txt", ".ipynb")
+)
+ASSET_REFERENCE_SKIP_DIRS = frozenset(
+    ("_site", ".git", ".site_cache", ".jekyll-cache", ".sass-cache", ".bundle", "node_modules", "vendor", "__pycache__")
+)
+# A bare image filename only counts as a reference where the theme expects a
+# URL: a YAML value (front matter, _data, _config.yml) or a src/href attribute.
+_YAML_VALUE_PREFIX = r"(?m)^([ \t]*(?:-[ \t]+)?(?:[\w-]+:[ \t]*)?[\"']?)"
+_ATTRIBUTE_PREFIX = r"(\b(?:src|href)\s*=\s*[\"'])"
 
 
 @dataclass
@@ -58,6 +156,96 @@ def write_text(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def write_text_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class EditSession:
+    """Buffer text-file edits in memory and flush each file once on commit.
+
+    Used as a context manager: a clean exit writes every touched file
+    atomically, an exception discards all pending edits so a failed batch
+    leaves the tree untouched.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Path, str | None] = {}
+
+    def exists(self, path: Path) -> bool:
+        if path in self._pending:
+            return self._pending[path] is not None
+        return path.exists()
+
+    def read(self, path: Path) -> str:
+        if path in self._pending:
+            content = self._pending[path]
+            if content is None:
+                raise FileNotFoundError(f"File deleted in this session: {path}")
+            return content
+        content = read_text(path)
+        self._pending[path] = content
+        return content
+
+    def write(self, path: Path, content: str) -> None:
+        self._pending[path] = content
+
+    def delete(self, path: Path) -> None:
+        self._pending[path] = None
+
+    def pending_paths(self) -> list[Path]:
+        return sorted(self._pending)
+
+    def commit(self) -> int:
+        written = 0
+        for path, content in self._pending.items():
+            if content is None:
+                if path.exists():
+                    path.unlink()
+                continue
+            if path.exists() and read_text(path) == content:
+                continue
+            write_text_atomic(path, content)
+            written += 1
+        self._pending.clear()
+        return written
+
+    def rollback(self) -> None:
+        self._pending.clear()
+        reset_content_index()
+
+    def __enter__(self) -> "EditSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+def _read_for_edit(path: Path, session: EditSession | None) -> str:
+    return session.read(path) if session else read_text(path)
+
+
+def _write_for_edit(path: Path, content: str, session: EditSession | None) -> None:
+    if session:
+        session.write(path, content)
+    else:
+        write_text(path, content)
+
+
 def normalize_url(url: str) -> str:
     if re.match(r"^https?://", url):
         return url
@@ -146,8 +334,8 @@ def parse_nav_items(content: str) -> list[tuple[NavItem, int, int]]:
     return items
 
 
-def add_nav_item(title: str, url: str, after: str | None) -> None:
-    content = read_text(NAV_FILE)
+def add_nav_item(title: str, url: str, after: str | None, session: EditSession | None = None) -> None:
+    content = _read_for_edit(NAV_FILE, session)
     items = parse_nav_items(content)
 
     for item, _, _ in items:
@@ -169,12 +357,12 @@ def add_nav_item(title: str, url: str, after: str | None) -> None:
         f"    url: {url}",
     ]
     lines[insert_at:insert_at] = block
-    write_text(NAV_FILE, "\n".join(lines).rstrip() + "\n")
+    _write_for_edit(NAV_FILE, "\n".join(lines).rstrip() + "\n", session)
     print(f"Added nav item: {title} -> {url}")
 
 
-def ensure_learning_page() -> None:
-    if LEARNING_FILE.exists():
+def ensure_learning_page(session: EditSession | None = None) -> None:
+    if (session.exists(LEARNING_FILE) if session else LEARNING_FILE.exists()):
         return
     initial = """---
 layout: archive
@@ -185,12 +373,12 @@ author_profile: true
 
 ## Recommended Resources
 """
-    write_text(LEARNING_FILE, initial + "\n")
+    _write_for_edit(LEARNING_FILE, initial + "\n", session)
 
 
-def add_learning_resource(title: str, url: str, note: str | None) -> None:
-    ensure_learning_page()
-    content = read_text(LEARNING_FILE)
+def add_learning_resource(title: str, url: str, note: str | None, session: EditSession | None = None) -> None:
+    ensure_learning_page(session)
+    content = _read_for_edit(LEARNING_FILE, session)
     if url in content:
         print(f"Learning resource already exists: {url}")
         return
@@ -203,7 +391,7 @@ def add_learning_resource(title: str, url: str, note: str | None) -> None:
         entry += f"\n  {note.strip()}"
 
     content = content.rstrip() + "\n\n" + entry + "\n"
-    write_text(LEARNING_FILE, content)
+    _write_for_edit(LEARNING_FILE, content, session)
     print(f"Added learning resource: {title}")
 
 
@@ -235,13 +423,13 @@ def _front_matter_end_line(lines: list[str]) -> int:
     return 0
 
 
-def add_group_news(date_raw: str, text: str) -> None:
-    if not NEWS_FILE.exists():
+def add_group_news(date_raw: str, text: str, session: EditSession | None = None) -> None:
+    if not (session.exists(NEWS_FILE) if session else NEWS_FILE.exists()):
         raise FileNotFoundError(f"Missing file: {NEWS_FILE}")
 
     year, label = _normalize_news_date_label(date_raw)
     entry = f"- [{label}] {text.strip()}"
-    content = read_text(NEWS_FILE)
+    content = _read_for_edit(NEWS_FILE, session)
     if entry in content:
         print("News entry already exists.")
         return
@@ -273,44 +461,1161 @@ def add_group_news(date_raw: str, text: str) -> None:
             insert_at = i + 1
         lines[insert_at:insert_at] = ["", year_heading, "", entry, ""]
 
-    write_text(NEWS_FILE, "\n".join(lines).rstrip() + "\n")
+    _write_for_edit(NEWS_FILE, "\n".join(lines).rstrip() + "\n", session)
     print(f"Added group news entry under {year_heading}")
 
 
+def _unquote_yaml_scalar(raw: str) -> str:
+    value = raw.strip()
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+
+def parse_front_matter(text: str) -> dict[str, object]:
+    """Parse the flat subset of YAML front matter used by the collections.
+
+    Top-level scalars map to strings, block lists (``tags:`` followed by
+    ``- item`` lines) map to lists, and one level of nested mappings is
+    flattened to dotted keys such as ``header.teaser``.
+    """
+    lines = text.splitlines()
+    end = _front_matter_end_line(lines)
+    data: dict[str, object] = {}
+    parent = ""
+    for line in lines[1 : end - 1] if end else []:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        indented = line[0] in (" ", "\t")
+        item = re.match(r"^\s*-\s+(.*)$", line)
+        if item and parent:
+            current = data.get(parent)
+            if not isinstance(current, list):
+                current = []
+                data[parent] = current
+            current.append(_unquote_yaml_scalar(item.group(1)))
+            continue
+        m = re.match(r"^\s*([A-Za-z0-9_-]+)\s*:\s*(.*)$", line)
+        if not m:
+            continue
+        key, value = m.group(1), m.group(2).strip()
+        if indented and parent:
+            data[f"{parent}.{key}"] = _unquote_yaml_scalar(value)
+            continue
+        parent = key if not value else ""
+        data[key] = _unquote_yaml_scalar(value) if value else ""
+    return data
+
+
+def normalize_title(title: str) -> str:
+    value = unicodedata.normalize("NFKC", title)
+    return re.sub(r"\s+", " ", value).strip().casefold()
+
+
+class FrontMatterCache:
+    """Persistent parsed-front-matter store under ``.site_cache/``.
+
+    Records are keyed by repo-relative path and reused while the file's
+    mtime and size are unchanged; when only the stat differs, a matching
+    content hash still avoids a reparse.
+    """
+
+    def __init__(self, cache_file: Path = FRONT_MATTER_CACHE_FILE) -> None:
+        self.cache_file = cache_file
+        self.records: dict[str, dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> "FrontMatterCache":
+        if not self.cache_file.exists():
+            return self
+        try:
+            data = json.loads(read_text(self.cache_file))
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("version") == FRONT_MATTER_CACHE_VERSION:
+            records = data.get("files")
+            if isinstance(records, dict):
+                self.records = records
+        return self
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"version": FRONT_MATTER_CACHE_VERSION, "files": self.records}
+        write_text_atomic(self.cache_file, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        self.dirty = False
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        try:
+            return path.resolve().relative_to(REPO_ROOT).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def front_matter(self, path: Path) -> dict[str, object]:
+        key = self._key(path)
+        st = path.stat()
+        record = self.records.get(key)
+        if record and record.get("mtime_ns") == st.st_mtime_ns and record.get("size") == st.st_size:
+            self.hits += 1
+            return record["front_matter"]
+        raw = path.read_bytes()
+        digest = sha256_bytes(raw)
+        if record and record.get("sha256") == digest:
+            self.hits += 1
+            fm = record["front_matter"]
+        else:
+            self.misses += 1
+            fm = parse_front_matter(raw.decode("utf-8"))
+        self.records[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest, "front_matter": fm}
+        self.dirty = True
+        return fm
+
+    def prune(self, live_paths: set[Path]) -> None:
+        live = {self._key(p) for p in live_paths}
+        for key in [k for k in self.records if k not in live]:
+            del self.records[key]
+            self.dirty = True
+
+
+@dataclass
+class ContentEntry:
+    collection: str
+    path: Path
+    title: str
+    slug: str
+    permalink: str
+    date: str
+    front_matter: dict[str, object]
+
+
+class ContentIndex:
+    """In-memory index over the front matter of every Jekyll collection.
+
+    Built once per process and updated in place by add/remove, so batch
+    imports look up duplicates in O(1) instead of rescanning directories.
+    """
+
+    def __init__(
+        self,
+        collection_dirs: dict[str, Path] | None = None,
+        cache: FrontMatterCache | None = None,
+    ) -> None:
+        self.collection_dirs = dict(collection_dirs or COLLECTION_DIRS)
+        self.cache = cache
+        self.entries: dict[Path, ContentEntry] = {}
+        self._by_title: dict[tuple[str, str], set[Path]] = {}
+        self._by_slug: dict[tuple[str, str], set[Path]] = {}
+        self._by_permalink: dict[str, set[Path]] = {}
+        self._by_date: dict[tuple[str, str], set[Path]] = {}
+
+    def build(self) -> "ContentIndex":
+        seen: set[Path] = set()
+        for collection, directory in self.collection_dirs.items():
+            if not directory.exists():
+                continue
+            for path in sorted(directory.iterdir()):
+                if path.is_file() and path.suffix in COLLECTION_SUFFIXES:
+                    seen.add(path)
+                    fm = self.cache.front_matter(path) if self.cache else parse_front_matter(read_text(path))
+                    self._insert(self._entry_from_front_matter(path, collection, fm))
+        if self.cache:
+            self.cache.prune(seen)
+            self.cache.save()
+        return self
+
+    def collection_for_dir(self, directory: Path) -> str:
+        resolved = directory.resolve()
+        for collection, collection_dir in self.collection_dirs.items():
+            if collection_dir.resolve() == resolved:
+                return collection
+        raise ValueError(f"Not a known collection directory: {directory}")
+
+    def collection_for(self, path: Path) -> str:
+        return self.collection_for_dir(path.parent)
+
+    def _entry_from_path(self, path: Path, collection: str) -> ContentEntry:
+        return self._entry_from_front_matter(path, collection, parse_front_matter(read_text(path)))
+
+    @staticmethod
+    def _entry_from_front_matter(path: Path, collection: str, fm: dict[str, object]) -> ContentEntry:
+        date = str(fm.get("date") or "")
+        m = re.match(r"^(\d{4}-\d{2}-\d{2})", date)
+        return ContentEntry(
+            collection=collection,
+            path=path,
+            title=str(fm.get("title") or ""),
+            slug=path.stem,
+            permalink=str(fm.get("permalink") or ""),
+            date=m.group(1) if m else "",
+            front_matter=fm,
+        )
+
+    @staticmethod
+    def _link(table: dict, key: object, path: Path) -> None:
+        table.setdefault(key, set()).add(path)
+
+    @staticmethod
+    def _unlink(table: dict, key: object, path: Path) -> None:
+        bucket = table.get(key)
+        if bucket is None:
+            return
+        bucket.discard(path)
+        if not bucket:
+            del table[key]
+
+    def _insert(self, entry: ContentEntry) -> None:
+        self.remove(entry.path)
+        self.entries[entry.path] = entry
+        c = entry.collection
+        self._link(self._by_title, (c, normalize_title(entry.title)), entry.path)
+        self._link(self._by_slug, (c, entry.slug), entry.path)
+        if entry.permalink:
+            self._link(self._by_permalink, entry.permalink.rstrip("/"), entry.path)
+        if entry.date:
+            self._link(self._by_date, (c, entry.date), entry.path)
+
+    def add(self, path: Path, collection: str | None = None, text: str | None = None) -> ContentEntry:
+        collection = collection or self.collection_for(path)
+        if text is None:
+            entry = self._entry_from_path(path, collection)
+        else:
+            entry = self._entry_from_front_matter(path, collection, parse_front_matter(text))
+        self._insert(entry)
+        return entry
+
+    def remove(self, path: Path) -> ContentEntry | None:
+        entry = self.entries.pop(path, None)
+        if entry is None:
+            return None
+        c = entry.collection
+        self._unlink(self._by_title, (c, normalize_title(entry.title)), path)
+        self._unlink(self._by_slug, (c, entry.slug), path)
+        if entry.permalink:
+            self._unlink(self._by_permalink, entry.permalink.rstrip("/"), path)
+        if entry.date:
+            self._unlink(self._by_date, (c, entry.date), path)
+        return entry
+
+    def find_by_title(self, collection: str, title: str) -> list[Path]:
+        return sorted(self._by_title.get((collection, normalize_title(title)), ()))
+
+    def find_by_slug(self, collection: str, slug: str) -> list[Path]:
+        return sorted(self._by_slug.get((collection, slug), ()))
+
+    def find_by_permalink(self, permalink: str) -> list[Path]:
+        return sorted(self._by_permalink.get(permalink.rstrip("/"), ()))
+
+    def find_by_date(self, collection: str, date_iso: str) -> list[Path]:
+        return sorted(self._by_date.get((collection, date_iso), ()))
+
+    def iter_collection(self, collection: str) -> list[ContentEntry]:
+        return [e for _, e in sorted(self.entries.items()) if e.collection == collection]
+
+
+_CONTENT_INDEX: ContentIndex | None = None
+
+
+def get_content_index() -> ContentIndex:
+    global _CONTENT_INDEX
+    if _CONTENT_INDEX is None:
+        cache = None if os.environ.get("SITE_NO_CACHE") else FrontMatterCache().load()
+        _CONTENT_INDEX = ContentIndex(cache=cache).build()
+    return _CONTENT_INDEX
+
+
+def reset_content_index() -> None:
+    global _CONTENT_INDEX
+    _CONTENT_INDEX = None
+
+
 def find_entries_by_title(collection_dir: Path, title: str) -> list[Path]:
-    result: list[Path] = []
-    title_pattern = re.compile(r'^title:\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
-    for md in collection_dir.glob("*.md"):
-        text = read_text(md)
-        m = title_pattern.search(text)
-        if m and m.group(1).strip() == title.strip():
-            result.append(md)
-    return result
+    index = get_content_index()
+    return index.find_by_title(index.collection_for_dir(collection_dir), title)
 
 
-def copy_asset(src_path: str | None, target_dir: Path, target_name: str | None) -> str:
+def _try_reflink(src_fd: int, dst_fd: int) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy with ``copy_file_range``, else ``sendfile``.
+
+    Returns False if neither copied the whole file. Once a method has
+    written anything, the file positions have moved, so no other method is
+    tried; the caller must truncate and rewind before its own fallback.
+    """
+    for name in ("copy_file_range", "sendfile"):
+        fn = getattr(os, name, None)
+        if fn is None:
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                if name == "copy_file_range":
+                    sent = fn(src_fd, dst_fd, size - offset)
+                else:
+                    sent = fn(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset:
+                raise
+            continue
+        return offset == size
+    return False
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def files_identical(src: Path, dst: Path) -> bool:
+    """Cheap-first equality check: same inode, then size+mtime, then SHA-256."""
+    if not dst.exists():
+        return False
+    if os.path.samefile(src, dst):
+        return True
+    s_st, d_st = src.stat(), dst.stat()
+    if s_st.st_size != d_st.st_size:
+        return False
+    if s_st.st_mtime_ns == d_st.st_mtime_ns:
+        return True
+    return hash_file(src) == hash_file(dst)
+
+
+def stream_copy_file(src: Path, dst: Path, hardlink: bool = False) -> str:
+    """Copy ``src`` to ``dst`` without buffering the whole file in memory.
+
+    Tries, in order: a hardlink (only when requested and on the same
+    filesystem), a copy-on-write reflink, a kernel-side
+    ``copy_file_range``/``sendfile``, and finally a chunked copy. The
+    result is staged next to ``dst`` and moved into place atomically, and
+    the source mtime is preserved. Returns the method that was used.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    st = src.stat()
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if hardlink and st.st_dev == dst.parent.stat().st_dev:
+            try:
+                os.link(src, tmp)
+                os.replace(tmp, dst)
+                return "hardlink"
+            except OSError:
+                pass
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            if st.st_size and _try_reflink(fsrc.fileno(), fdst.fileno()):
+                method = "reflink"
+            elif st.st_size and _kernel_copy(fsrc.fileno(), fdst.fileno(), st.st_size):
+                method = "kernel"
+            else:
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+                method = "chunked"
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, dst)
+        return method
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def asset_url(path: Path) -> str:
+    resolved = path.resolve()
+    for root in (FILES_DIR, IMAGES_DIR):
+        try:
+            rel = resolved.relative_to(root.resolve())
+        except ValueError:
+            continue
+        return f"/{root.name}/{rel.as_posix()}"
+    return ""
+
+
+class AssetStore:
+    """Content-addressed view of ``files/`` and ``images/``.
+
+    File digests are cached in ``.site_cache/assets.json`` and only
+    recomputed when a file's mtime or size changes. ``find`` answers
+    "is this blob already on the site?" so identical uploads can reuse
+    the existing file instead of adding another copy.
+    """
+
+    def __init__(self, roots: tuple[Path, ...] = (FILES_DIR, IMAGES_DIR), cache_file: Path = ASSET_CACHE_FILE) -> None:
+        self.roots = roots
+        self.cache_file = cache_file
+        self.records: dict[str, dict] = {}
+        self.by_digest: dict[str, list[Path]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        try:
+            return path.resolve().relative_to(REPO_ROOT).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def load(self) -> "AssetStore":
+        cached: dict[str, dict] = {}
+        if self.cache_file.exists():
+            try:
+                data = json.loads(read_text(self.cache_file))
+                if isinstance(data, dict) and data.get("version") == ASSET_CACHE_VERSION:
+                    cached = data.get("files") or {}
+            except (OSError, ValueError):
+                cached = {}
+        for root in self.roots:
+            if not root.exists():
+                continue
+            for path in sorted(p for p in root.rglob("*") if p.is_file()):
+                key = self._key(path)
+                st = path.stat()
+                record = cached.get(key)
+                if not (record and record.get("mtime_ns") == st.st_mtime_ns and record.get("size") == st.st_size):
+                    record = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": hash_file(path)}
+                self.records[key] = record
+                self.by_digest.setdefault(record["sha256"], []).append(path)
+        return self
+
+    def save(self) -> None:
+        payload = {"version": ASSET_CACHE_VERSION, "files": self.records}
+        write_text_atomic(self.cache_file, json.dumps(payload, separators=(",", ":")))
+
+    def find(self, digest: str, within: Path | None = None) -> list[Path]:
+        with self._lock:
+            paths = list(self.by_digest.get(digest, ()))
+        if within is None:
+            return paths
+        root = within.resolve()
+        return [p for p in paths if p.resolve().parent == root]
+
+    def record(self, path: Path, digest: str | None = None) -> None:
+        st = path.stat()
+        digest = digest or hash_file(path)
+        with self._lock:
+            self.forget(path, locked=True)
+            self.records[self._key(path)] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+            self.by_digest.setdefault(digest, []).append(path)
+
+    def claim(self, path: Path, digest: str) -> None:
+        with self._lock:
+            bucket = self.by_digest.setdefault(digest, [])
+            if path not in bucket:
+                bucket.append(path)
+
+    def forget(self, path: Path, locked: bool = False) -> None:
+        if not locked:
+            with self._lock:
+                return self.forget(path, locked=True)
+        record = self.records.pop(self._key(path), None)
+        if record:
+            bucket = self.by_digest.get(record["sha256"], [])
+            if path in bucket:
+                bucket.remove(path)
+            if not bucket:
+                self.by_digest.pop(record["sha256"], None)
+
+    def duplicates(self) -> list[list[Path]]:
+        return [sorted(paths) for _, paths in sorted(self.by_digest.items()) if len(paths) > 1]
+
+
+@dataclass
+class AssetCopy:
+    src: Path
+    dst: Path
+    url: str
+    label: str = ""
+    bytes_copied: int = 0
+    bytes_skipped: int = 0
+    seconds: float = 0.0
+    method: str = ""
+
+    @property
+    def throughput(self) -> float:
+        return self.bytes_copied / self.seconds if self.seconds > 0 else 0.0
+
+
+def plan_asset(
+    src_path: str | None,
+    target_dir: Path,
+    target_name: str | None,
+    label: str = "",
+    store: AssetStore | None = None,
+) -> AssetCopy | None:
     if not src_path:
-        return ""
+        return None
     src = Path(src_path)
     if not src.exists():
         raise FileNotFoundError(f"Source file not found: {src}")
-    target_dir.mkdir(parents=True, exist_ok=True)
     filename = target_name.strip() if target_name else src.name
     dst = target_dir / filename
-    dst.write_bytes(src.read_bytes())
-    if target_dir == FILES_DIR:
-        return f"/files/{filename}"
-    if target_dir == IMAGES_DIR:
-        return f"/images/{filename}"
+    plan = AssetCopy(src=src, dst=dst, url=asset_url(dst), label=label)
+    if store is not None:
+        digest = hash_file(src)
+        existing = store.find(digest, within=target_dir)
+        if existing:
+            reuse = dst if dst in existing else existing[0]
+            plan.dst, plan.url, plan.method = reuse, asset_url(reuse), "dedupe"
+            if reuse != dst:
+                print(f"Reusing identical asset {plan.url} for {src.name}")
+        else:
+            store.claim(dst, digest)
+    return plan
+
+
+def run_asset_copy(plan: AssetCopy, hardlink: bool = False) -> AssetCopy:
+    if plan.method == "dedupe":
+        return plan
+    started = time.perf_counter()
+    if files_identical(plan.src, plan.dst):
+        plan.method = "unchanged"
+        plan.bytes_skipped = plan.src.stat().st_size
+    else:
+        plan.method = stream_copy_file(plan.src, plan.dst, hardlink=hardlink)
+        plan.bytes_copied = plan.src.stat().st_size
+    plan.seconds = time.perf_counter() - started
+    return plan
+
+
+def copy_asset(
+    src_path: str | None,
+    target_dir: Path,
+    target_name: str | None,
+    hardlink: bool = False,
+    store: AssetStore | None = None,
+) -> str:
+    plan = plan_asset(src_path, target_dir, target_name, store=store)
+    if plan is None:
+        return ""
+    run_asset_copy(plan, hardlink=hardlink)
+    if plan.method == "unchanged":
+        print(f"Asset unchanged, skipped copy: {plan.url or plan.dst}")
+    return plan.url
+
+
+class AssetCopier:
+    """Run asset copies on a bounded thread pool.
+
+    ``copy`` validates the source and returns the site URL immediately so
+    markdown generation can continue; ``wait`` joins every copy and raises
+    the first failure. Copies to the same destination run in submission
+    order, so the last writer still wins as with serial copies.
+    """
+
+    def __init__(self, max_workers: int = 4, hardlink: bool = False, store: AssetStore | None = None) -> None:
+        self.max_workers = max(1, max_workers)
+        self.hardlink = hardlink
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="asset-copy")
+        self._futures: list[Future] = []
+        self._by_dst: dict[Path, Future] = {}
+        self._lock = threading.Lock()
+
+    def copy(self, src_path: str | None, target_dir: Path, target_name: str | None, label: str = "") -> str:
+        plan = plan_asset(src_path, target_dir, target_name, label, store=self.store)
+        if plan is None:
+            return ""
+        if plan.method == "dedupe":
+            self._futures.append(self._executor.submit(lambda: plan))
+            return plan.url
+        with self._lock:
+            previous = self._by_dst.get(plan.dst)
+
+            def task(plan: AssetCopy = plan, previous: Future | None = previous) -> AssetCopy:
+                if previous is not None:
+                    previous.result()
+                return run_asset_copy(plan, hardlink=self.hardlink)
+
+            future = self._executor.submit(task)
+            self._by_dst[plan.dst] = future
+            self._futures.append(future)
+        return plan.url
+
+    def wait(self) -> list[AssetCopy]:
+        results = [f.result() for f in self._futures]
+        self._futures.clear()
+        self._by_dst.clear()
+        return results
+
+    def __enter__(self) -> "AssetCopier":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+        return False
+
+
+def _copy_item_asset(
+    src_path: str | None,
+    target_dir: Path,
+    target_name: str | None,
+    assets: AssetCopier | None,
+    label: str = "",
+) -> str:
+    if assets:
+        return assets.copy(src_path, target_dir, target_name, label)
+    return copy_asset(src_path, target_dir, target_name)
+
+
+@dataclass(frozen=True)
+class ImageOptions:
+    widths: tuple[int, ...] = DEFAULT_IMAGE_WIDTHS
+    formats: tuple[str, ...] = DEFAULT_IMAGE_FORMATS
+    quality: int = 82
+    fallback_width: int = 960
+
+
+@dataclass
+class ImageVariant:
+    path: Path
+    url: str
+    width: int
+    format: str
+    bytes_written: int = 0
+
+
+def _load_pillow():
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise RuntimeError("Image optimization requires Pillow: pip install pillow") from exc
+    return Image
+
+
+def _pillow_supports(fmt: str) -> bool:
+    from PIL import features
+
+    try:
+        return bool(features.check(fmt))
+    except ValueError:
+        return False
+
+
+def image_variant_base(url: str) -> str:
+    """Variant name prefix for an image URL: its path under ``/images/``, extension kept.
+
+    ``/images/news/foo.png`` -> ``news/foo-png``, so ``foo.png`` and
+    ``foo.jpg``, or ``news/foo.png`` and ``news-foo.png``, never share
+    variant files.
+    """
+    rel = url.split("/images/", 1)[-1].lstrip("/")
+    stem, dot, ext = rel.rpartition(".")
+    return f"{stem}-{ext.lower()}" if dot else rel
+
+
+def plan_image_variants(src: Path, base: str, options: ImageOptions) -> list[ImageVariant]:
+    """Decide which resized/re-encoded variants to produce for ``src``.
+
+    Variants are written to ``images/responsive/{base}-{width}w.{ext}``.
+    Only the image header is read here; widths at or above the source
+    width are dropped (the source width itself is used if nothing is
+    smaller), and animated images and non-raster formats are skipped.
+    """
+    base_format = RASTER_IMAGE_FORMATS.get(src.suffix.lower())
+    if not base_format:
+        return []
+    Image = _load_pillow()
+    with Image.open(src) as im:
+        if getattr(im, "is_animated", False):
+            return []
+        source_width = im.width
+    widths = sorted({w for w in options.widths if w < source_width}) or [source_width]
+    formats = [base_format] + [f for f in options.formats if f != base_format]
+    variants: list[ImageVariant] = []
+    for fmt in formats:
+        if fmt not in IMAGE_FORMAT_SUFFIXES or (fmt in ("webp", "avif") and not _pillow_supports(fmt)):
+            print(f"Warning: image format '{fmt}' is not supported by this Pillow build; skipped")
+            continue
+        for width in widths:
+            dst = IMAGE_VARIANTS_DIR / f"{base}-{width}w{IMAGE_FORMAT_SUFFIXES[fmt]}"
+            variants.append(ImageVariant(path=dst, url=asset_url(dst), width=width, format=fmt))
+    return variants
+
+
+def render_image_variant(src: str, dst: str, width: int, fmt: str, quality: int) -> int:
+    """Resize and re-encode one variant; runs in a worker process."""
+    Image = _load_pillow()
+    from PIL import ImageOps
+
+    src_path, dst_path = Path(src), Path(dst)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    params = {
+        "jpeg": {"quality": quality, "optimize": True, "progressive": True},
+        "png": {"optimize": True},
+        "webp": {"quality": quality, "method": 6},
+        "avif": {"quality": quality},
+    }[fmt]
+    tmp = dst_path.with_name(f".{dst_path.name}.{os.getpid()}.tmp")
+    try:
+        with Image.open(src_path) as opened:
+            im = ImageOps.exif_transpose(opened)
+            if im.width > width:
+                im = im.resize((width, max(1, round(im.height * width / im.width))), Image.LANCZOS)
+            if fmt == "jpeg" and im.mode not in ("RGB", "L"):
+                im = im.convert("RGB")
+            im.save(tmp, format=fmt.upper(), **params)
+        os.replace(tmp, dst_path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return dst_path.stat().st_size
+
+
+class ImageOptimizer:
+    """Produce responsive image variants, on a process pool for batches.
+
+    ``submit`` plans variants from the original source file and returns
+    them immediately, so markdown can reference the final URLs while the
+    encoding runs; ``max_workers=0`` renders inline.
+
+    An existing variant is reused only if its stamp (source SHA-256 plus
+    width, format and quality, kept in ``.site_cache/image_variants.json``)
+    still matches. Copied sources keep their original mtime, so mtime
+    ordering cannot tell whether a variant is stale.
+    """
+
+    def __init__(
+        self,
+        options: ImageOptions | None = None,
+        max_workers: int | None = None,
+        force: bool = False,
+    ) -> None:
+        self.options = options or ImageOptions()
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max(0, max_workers)
+        self.force = force
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[ImageVariant, Future, str]] = []
+        self.variants_by_url: dict[str, list[ImageVariant]] = {}
+        self.source_bytes: dict[str, int] = {}
+        self._stamps: dict[str, str] | None = None
+        self._stamps_dirty = False
+
+    def _load_stamps(self) -> dict[str, str]:
+        if self._stamps is None:
+            self._stamps = {}
+            if IMAGE_VARIANT_STAMPS_FILE.exists():
+                try:
+                    data = json.loads(read_text(IMAGE_VARIANT_STAMPS_FILE))
+                except (OSError, ValueError):
+                    data = {}
+                if isinstance(data, dict) and data.get("version") == IMAGE_VARIANT_STAMPS_VERSION:
+                    self._stamps = data.get("variants") or {}
+        return self._stamps
+
+    def _save_stamps(self) -> None:
+        if not self._stamps_dirty or self._stamps is None:
+            return
+        payload = {"version": IMAGE_VARIANT_STAMPS_VERSION, "variants": self._stamps}
+        write_text_atomic(IMAGE_VARIANT_STAMPS_FILE, json.dumps(payload, separators=(",", ":")))
+        self._stamps_dirty = False
+
+    def _record(self, v: ImageVariant, stamp: str) -> None:
+        self._load_stamps()[v.url] = stamp
+        self._stamps_dirty = True
+
+    def submit(self, src: Path, url: str) -> list[ImageVariant]:
+        if not url:
+            return []
+        variants = plan_image_variants(src, image_variant_base(url), self.options)
+        self.variants_by_url[url] = variants
+        self.source_bytes[url] = src.stat().st_size
+        digest = hash_file(src) if variants else ""
+        stamps = self._load_stamps()
+        for v in variants:
+            stamp = f"{digest}:{v.width}:{v.format}:{self.options.quality}"
+            if not self.force and v.path.exists() and stamps.get(v.url) == stamp:
+                v.bytes_written = v.path.stat().st_size
+                continue
+            args = (str(src), str(v.path), v.width, v.format, self.options.quality)
+            if self.max_workers == 0:
+                v.bytes_written = render_image_variant(*args)
+                self._record(v, stamp)
+                continue
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self._pending.append((v, self._executor.submit(render_image_variant, *args), stamp))
+        self._save_stamps()
+        return variants
+
+    def wait(self) -> list[ImageVariant]:
+        for v, future, stamp in self._pending:
+            v.bytes_written = future.result()
+            self._record(v, stamp)
+        self._pending.clear()
+        self._save_stamps()
+        return [v for variants in self.variants_by_url.values() for v in variants]
+
+    def fallback_url(self, url: str) -> str:
+        variants = self.variants_by_url.get(url) or []
+        base = [v for v in variants if v.format == variants[0].format] if variants else []
+        if not base:
+            return url
+        fitting = [v for v in base if v.width <= self.options.fallback_width]
+        return (fitting[-1] if fitting else base[0]).url
+
+    def responsive(self, url: str) -> tuple[str, str]:
+        return self.fallback_url(url), self.srcset(url)
+
+    def srcset(self, url: str) -> str:
+        variants = self.variants_by_url.get(url) or []
+        if not variants:
+            return ""
+        available = [v.format for v in variants]
+        preferred = next((f for f in self.options.formats if f in available), available[0])
+        return ", ".join(f"{v.url} {v.width}w" for v in variants if v.format == preferred)
+
+    def report(self) -> None:
+        for url, variants in self.variants_by_url.items():
+            if not variants:
+                continue
+            smallest = min(v.bytes_written for v in variants if v.bytes_written) if any(
+                v.bytes_written for v in variants
+            ) else 0
+            print(
+                f"  image {url}: {len(variants)} variants, source {_format_bytes(self.source_bytes[url])}, "
+                f"smallest {_format_bytes(smallest)}"
+            )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ImageOptimizer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+def _image_options_key(options: ImageOptions) -> str:
+    return json.dumps([list(options.widths), list(options.formats), options.quality], separators=(",", ":"))
+
+
+def optimize_images(options: ImageOptions, workers: int | None, min_bytes: int, force: bool) -> int:
+    """Generate responsive variants for every raster image already in ``images/``.
+
+    A manifest in ``.site_cache/images.json`` maps each source (by SHA-256)
+    to its outputs, so reruns only encode new or changed images.
+    """
+    manifest: dict[str, dict] = {}
+    if IMAGE_MANIFEST_FILE.exists() and not force:
+        try:
+            data = json.loads(read_text(IMAGE_MANIFEST_FILE))
+            if isinstance(data, dict) and data.get("version") == IMAGE_MANIFEST_VERSION:
+                manifest = data.get("images") or {}
+        except (OSError, ValueError):
+            manifest = {}
+
+    options_key = _image_options_key(options)
+    variants_root = IMAGE_VARIANTS_DIR.resolve()
+    sources = [
+        p
+        for p in sorted(IMAGES_DIR.rglob("*"))
+        if p.is_file()
+        and p.suffix.lower() in RASTER_IMAGE_FORMATS
+        and variants_root not in p.resolve().parents
+        and p.stat().st_size >= min_bytes
+    ]
+
+    skipped = 0
+    pending: list[tuple[str, Path, str, int, int]] = []
+    with ImageOptimizer(options, max_workers=workers, force=force) as images:
+        for src in sources:
+            key = src.relative_to(REPO_ROOT).as_posix()
+            st = src.stat()
+            record = manifest.get(key)
+            if record and record.get("mtime_ns") == st.st_mtime_ns and record.get("size") == st.st_size:
+                digest = record["sha256"]
+            else:
+                digest = hash_file(src)
+            if (
+                record
+                and record.get("sha256") == digest
+                and record.get("options") == options_key
+                and all((REPO_ROOT / o["path"]).exists() for o in record.get("outputs", []))
+            ):
+                record.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+                skipped += 1
+                continue
+            images.submit(src, asset_url(src))
+            pending.append((key, src, digest, st.st_mtime_ns, st.st_size))
+        images.wait()
+        for key, src, digest, mtime_ns, size in pending:
+            variants = images.variants_by_url.get(asset_url(src), [])
+            manifest[key] = {
+                "sha256": digest,
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "options": options_key,
+                "outputs": [
+                    {
+                        "path": v.path.relative_to(REPO_ROOT).as_posix(),
+                        "width": v.width,
+                        "format": v.format,
+                        "bytes": v.bytes_written,
+                    }
+                    for v in variants
+                ],
+            }
+
+    live = {p.relative_to(REPO_ROOT).as_posix() for p in sources}
+    manifest = {k: v for k, v in manifest.items() if k in live}
+    write_text_atomic(
+        IMAGE_MANIFEST_FILE,
+        json.dumps({"version": IMAGE_MANIFEST_VERSION, "images": manifest}, separators=(",", ":")),
+    )
+
+    totals: dict[str, list[int]] = {}
+    for key, record in sorted(manifest.items()):
+        outputs = record.get("outputs", [])
+        if not outputs:
+            continue
+        preferred = next((f for f in options.formats if any(o["format"] == f for o in outputs)), outputs[0]["format"])
+        candidates = [o for o in outputs if o["format"] == preferred]
+        fitting = [o for o in candidates if o["width"] <= options.fallback_width] or candidates[:1]
+        served = max(fitting, key=lambda o: o["width"])["bytes"]
+        bucket = totals.setdefault(Path(key).suffix.lower().lstrip(".") or "?", [0, 0, 0])
+        bucket[0] += 1
+        bucket[1] += record["size"]
+        bucket[2] += served
+    for suffix, (count, source_bytes, served_bytes) in sorted(totals.items()):
+        saved = source_bytes - served_bytes
+        pct = (saved / source_bytes * 100) if source_bytes else 0.0
+        print(
+            f"  {suffix}: {count} image(s), {_format_bytes(source_bytes)} -> {_format_bytes(served_bytes)} "
+            f"at <= {options.fallback_width}px, saved {_format_bytes(saved)} ({pct:.0f}%)"
+        )
+    print(f"optimize-images completed: processed={len(pending)}, unchanged={skipped}, total={len(sources)}")
+    return 0
+
+
+@dataclass(frozen=True)
+class PdfOptions:
+    linearize: bool = True
+    downsample_dpi: int = 0
+    thumbnail_width: int = 0
+
+
+@dataclass
+class PdfResult:
+    source: Path
+    output: Path
+    thumbnail: Path | None = None
+
+
+def _load_pymupdf():
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf
+        except ImportError:
+            return None
+    return pymupdf
+
+
+def _ghostscript_binary() -> str:
+    for name in ("gs", "gswin64c", "gswin32c"):
+        found = shutil.which(name)
+        if found:
+            return found
     return ""
 
 
+def _downsample_pdf(src: Path, dst: Path, dpi: int) -> None:
+    pymupdf = _load_pymupdf()
+    if pymupdf is not None and hasattr(pymupdf.Document, "rewrite_images"):
+        with pymupdf.open(src) as doc:
+            doc.rewrite_images(dpi_threshold=int(dpi * 1.5), dpi_target=dpi, quality=80)
+            doc.save(dst, garbage=3, deflate=True)
+        return
+    gs = _ghostscript_binary()
+    if gs:
+        cmd = [
+            gs, "-q", "-dNOPAUSE", "-dBATCH", "-dSAFER", "-sDEVICE=pdfwrite",
+            "-dDownsampleColorImages=true", "-dDownsampleGrayImages=true",
+            f"-dColorImageResolution={dpi}", f"-dGrayImageResolution={dpi}",
+            f"-sOutputFile={dst}", str(src),
+        ]
+        if subprocess.run(cmd, capture_output=True).returncode == 0:
+            return
+    raise RuntimeError("PDF downsampling requires PyMuPDF (pip install pymupdf) or Ghostscript")
+
+
+def _linearize_pdf(src: Path, dst: Path) -> None:
+    try:
+        import pikepdf
+    except ImportError:
+        pikepdf = None
+    if pikepdf is not None:
+        with pikepdf.open(src) as pdf:
+            pdf.save(dst, linearize=True, compress_streams=True, object_stream_mode=pikepdf.ObjectStreamMode.generate)
+        return
+    qpdf = shutil.which("qpdf")
+    if qpdf and subprocess.run([qpdf, "--linearize", str(src), str(dst)], capture_output=True).returncode in (0, 3):
+        return
+    raise RuntimeError("PDF linearization requires pikepdf (pip install pikepdf) or the qpdf CLI")
+
+
+def _render_pdf_thumbnail(src: Path, dst: Path, width: int) -> None:
+    pymupdf = _load_pymupdf()
+    if pymupdf is not None:
+        with pymupdf.open(src) as doc:
+            page = doc[0]
+            zoom = width / page.rect.width
+            page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom)).save(dst)
+        return
+    pdftoppm = shutil.which("pdftoppm")
+    if pdftoppm:
+        prefix = dst.with_suffix("")
+        cmd = [pdftoppm, "-png", "-f", "1", "-l", "1", "-singlefile", "-scale-to-x", str(width), "-scale-to-y", "-1"]
+        if subprocess.run([*cmd, str(src), str(prefix)], capture_output=True).returncode == 0:
+            return
+    raise RuntimeError("PDF thumbnails require PyMuPDF (pip install pymupdf) or poppler's pdftoppm")
+
+
+def process_pdf(src: str, linearize: bool, downsample_dpi: int, thumbnail_width: int) -> tuple[str, str]:
+    """Optimize one PDF into the cache; runs in a worker process.
+
+    Outputs are keyed by the input SHA-256 and the settings, so the same
+    upload is only processed once. A downsampled result is only kept when
+    it is actually smaller than its input.
+    """
+    src_path = Path(src)
+    digest = hash_file(src_path)[:32]
+    PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    suffix = f"{'lin' if linearize else 'raw'}-{downsample_dpi or 0}"
+    out = PDF_CACHE_DIR / f"{digest}-{suffix}.pdf"
+    if not out.exists() and (linearize or downsample_dpi):
+        work = src_path
+        staged: list[Path] = []
+        try:
+            if downsample_dpi:
+                candidate = PDF_CACHE_DIR / f".{digest}.{os.getpid()}.ds.pdf"
+                staged.append(candidate)
+                _downsample_pdf(work, candidate, downsample_dpi)
+                if candidate.stat().st_size < work.stat().st_size:
+                    work = candidate
+            if linearize:
+                candidate = PDF_CACHE_DIR / f".{digest}.{os.getpid()}.lin.pdf"
+                staged.append(candidate)
+                _linearize_pdf(work, candidate)
+                work = candidate
+            if work == src_path:
+                shutil.copyfile(src_path, out)
+            else:
+                os.replace(work, out)
+        finally:
+            for p in staged:
+                if p.exists():
+                    p.unlink()
+    thumb = ""
+    if thumbnail_width:
+        thumb_path = PDF_CACHE_DIR / f"{digest}-thumb-{thumbnail_width}.png"
+        if not thumb_path.exists():
+            _render_pdf_thumbnail(src_path, thumb_path, thumbnail_width)
+        thumb = str(thumb_path)
+    return str(out if out.exists() else src_path), thumb
+
+
+class PdfProcessor:
+    """Linearize/downsample uploaded PDFs and render first-page thumbnails.
+
+    ``prefetch`` fans a batch of PDFs out across worker processes; ``prepare``
+    returns the cached result for a single file, processing it inline on a
+    cache miss.
+    """
+
+    def __init__(self, options: PdfOptions, max_workers: int | None = None) -> None:
+        self.options = options
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max(0, max_workers)
+        self._results: dict[Path, PdfResult] = {}
+
+    def _args(self, src: Path) -> tuple[str, bool, int, int]:
+        o = self.options
+        return str(src), o.linearize, o.downsample_dpi, o.thumbnail_width
+
+    def _store(self, src: Path, output: str, thumb: str) -> PdfResult:
+        result = PdfResult(source=src, output=Path(output), thumbnail=Path(thumb) if thumb else None)
+        self._results[src] = result
+        if result.output != src:
+            before, after = src.stat().st_size, result.output.stat().st_size
+            print(f"Optimized PDF {src.name}: {_format_bytes(before)} -> {_format_bytes(after)}")
+        return result
+
+    def prefetch(self, sources: list[Path]) -> None:
+        todo = sorted({p for p in sources if p.suffix.lower() == ".pdf" and p not in self._results})
+        if not todo:
+            return
+        if self.max_workers == 0 or len(todo) == 1:
+            for src in todo:
+                self._store(src, *process_pdf(*self._args(src)))
+            return
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {src: pool.submit(process_pdf, *self._args(src)) for src in todo}
+            for src, future in futures.items():
+                self._store(src, *future.result())
+
+    def prepare(self, src: Path) -> PdfResult | None:
+        if src.suffix.lower() != ".pdf":
+            return None
+        if src not in self._results:
+            self._store(src, *process_pdf(*self._args(src)))
+        return self._results[src]
+
+
+def _prepare_pdf_asset(
+    pdfs: PdfProcessor | None,
+    src_path: str | None,
+    target_name: str | None,
+) -> tuple[str | None, str | None, str | None]:
+    """Swap an uploaded PDF for its optimized version, keeping the target name."""
+    if not pdfs or not src_path:
+        return src_path, target_name, None
+    result = pdfs.prepare(Path(src_path))
+    if result is None:
+        return src_path, target_name, None
+    name = target_name or Path(src_path).name
+    thumb = str(result.thumbnail) if result.thumbnail else None
+    return str(result.output), name, thumb
+
+
+def _responsive_image(images: ImageOptimizer | None, src_path: str | None, url: str) -> tuple[str, str]:
+    """Return (src, srcset) for an image URL, optimizing it when enabled."""
+    if not images or not url or not src_path:
+        return url, ""
+    images.submit(Path(src_path), url)
+    return images.responsive(url)
+
+
 def compose_news_text(
     base_text: str,
     cert_url: str = "",
     cert_label: str = "Certificate",
     image_url: str = "",
     image_alt: str = "News image",
+    image_srcset: str = "",
 ) -> str:
     text = base_text.strip()
     parts = [text] if text else []
@@ -319,7 +1624,13 @@ def compose_news_text(
         parts.append(f"[{label}]({cert_url})")
     if image_url:
         alt = image_alt.strip() if image_alt else "News image"
-        parts.append(f"![{alt}]({image_url})")
+        if image_srcset:
+            parts.append(
+                f'<img src="{image_url}" srcset="{image_srcset}" sizes="{IMAGE_SIZES_ATTR}" '
+                f'alt="{escape(alt)}" loading="lazy">'
+            )
+        else:
+            parts.append(f"![{alt}]({image_url})")
     return "<br>\n".join(parts)
 
 
@@ -332,17 +1643,23 @@ def add_group_news_with_assets(
     cert_name: str | None = None,
     cert_label: str | None = None,
     image_alt: str | None = None,
+    session: EditSession | None = None,
+    assets: AssetCopier | None = None,
+    label: str = "",
+    images: ImageOptimizer | None = None,
 ) -> None:
-    image_url = copy_asset(image_file, IMAGES_DIR, image_name)
-    cert_url = copy_asset(cert_file, FILES_DIR, cert_name)
+    image_url = _copy_item_asset(image_file, IMAGES_DIR, image_name, assets, label)
+    cert_url = _copy_item_asset(cert_file, FILES_DIR, cert_name, assets, label)
+    image_src, image_srcset = _responsive_image(images, image_file, image_url)
     final_text = compose_news_text(
         text,
         cert_url=cert_url,
         cert_label=cert_label or "Certificate",
-        image_url=image_url,
+        image_url=image_src,
         image_alt=image_alt or "News image",
+        image_srcset=image_srcset,
     )
-    add_group_news(date_raw, final_text)
+    add_group_news(date_raw, final_text, session)
 
 
 def add_publication(
@@ -360,6 +1677,10 @@ def add_publication(
     slug_hint: str | None,
     replace_existing: bool,
     normalize_venue_year: bool = True,
+    session: EditSession | None = None,
+    assets: AssetCopier | None = None,
+    label: str = "",
+    pdfs: PdfProcessor | None = None,
 ) -> tuple[Path, str]:
     PUBLICATIONS_DIR.mkdir(parents=True, exist_ok=True)
     FILES_DIR.mkdir(parents=True, exist_ok=True)
@@ -368,14 +1689,22 @@ def add_publication(
     slug = f"{date_iso}-{slugify(slug_hint or title)}"
     md_path = PUBLICATIONS_DIR / f"{slug}.md"
 
-    existing = find_entries_by_title(PUBLICATIONS_DIR, title)
+    index = get_content_index()
+    existing = index.find_by_title("publications", title)
     if existing and not replace_existing:
         raise FileExistsError(f"Publication with same title already exists: {existing[0].name}. Use --replace-existing.")
     for old in existing:
-        old.unlink()
+        if session:
+            session.delete(old)
+        else:
+            old.unlink()
+        index.remove(old)
         print(f"Removed duplicate publication: {old.name}")
 
-    copied_paper_url = copy_asset(paper_file, FILES_DIR, paper_name)
+    paper_file, paper_name, paper_thumb = _prepare_pdf_asset(pdfs, paper_file, paper_name)
+    copied_paper_url = _copy_item_asset(paper_file, FILES_DIR, paper_name, assets, label)
+    thumb_name = f"{Path(paper_name).stem}-thumb.png" if paper_thumb and paper_name else None
+    teaser_url = _copy_item_asset(paper_thumb, IMAGES_DIR, thumb_name, assets, label)
     final_paper_url = paper_url or copied_paper_url or (link or "")
 
     resolved_excerpt = (excerpt or "").strip()
@@ -409,9 +1738,12 @@ def add_publication(
     lines.append(f"citation: {yaml_quote(citation)}")
     if link:
         lines.append(f"link: {yaml_quote(link)}")
+    if teaser_url:
+        lines.extend(["header:", f"  teaser: {teaser_url}"])
     lines.append("---")
     content = "\n".join(lines) + "\n\n" + resolved_body + "\n"
-    write_text(md_path, content)
+    _write_for_edit(md_path, content, session)
+    index.add(md_path, "publications", text=content)
     print(f"Created publication: {md_path}")
     return md_path, final_paper_url
 
@@ -432,6 +1764,11 @@ def add_talk(
     cert_name: str | None,
     slug_hint: str | None,
     replace_existing: bool,
+    session: EditSession | None = None,
+    assets: AssetCopier | None = None,
+    label: str = "",
+    images: ImageOptimizer | None = None,
+    pdfs: PdfProcessor | None = None,
 ) -> tuple[Path, str, str, str]:
     TALKS_DIR.mkdir(parents=True, exist_ok=True)
     FILES_DIR.mkdir(parents=True, exist_ok=True)
@@ -441,16 +1778,25 @@ def add_talk(
     slug = f"{date_iso}-{slugify(slug_hint or title)}"
     md_path = TALKS_DIR / f"{slug}.md"
 
-    existing = find_entries_by_title(TALKS_DIR, title)
+    index = get_content_index()
+    existing = index.find_by_title("talks", title)
     if existing and not replace_existing:
         raise FileExistsError(f"Talk with same title already exists: {existing[0].name}. Use --replace-existing.")
     for old in existing:
-        old.unlink()
+        if session:
+            session.delete(old)
+        else:
+            old.unlink()
+        index.remove(old)
         print(f"Removed duplicate talk: {old.name}")
 
-    slides_url = copy_asset(slides_file, FILES_DIR, slides_name)
-    teaser_url = copy_asset(image_file, IMAGES_DIR, image_name)
-    cert_url = copy_asset(cert_file, FILES_DIR, cert_name)
+    slides_file, slides_name, slides_thumb = _prepare_pdf_asset(pdfs, slides_file, slides_name)
+    slides_url = _copy_item_asset(slides_file, FILES_DIR, slides_name, assets, label)
+    if not image_file and slides_thumb and slides_name:
+        image_file, image_name = slides_thumb, f"{Path(slides_name).stem}-thumb.png"
+    teaser_url = _copy_item_asset(image_file, IMAGES_DIR, image_name, assets, label)
+    cert_url = _copy_item_asset(cert_file, FILES_DIR, cert_name, assets, label)
+    teaser_src, _ = _responsive_image(images, image_file, teaser_url)
 
     resolved_excerpt = (excerpt or "").strip()
     resolved_body = (body or "").strip()
@@ -477,18 +1823,41 @@ def add_talk(
         f"location: {yaml_quote(location)}",
         f"excerpt: {yaml_quote(resolved_excerpt)}",
     ]
-    if teaser_url:
-        lines.extend(["header:", f"  teaser: {teaser_url}"])
+    if teaser_src:
+        lines.extend(["header:", f"  teaser: {teaser_src}"])
     if slides_url:
         lines.append(f"slidesurl: {yaml_quote(slides_url)}")
     lines.append("---")
 
     content = "\n".join(lines) + "\n\n" + resolved_body + "\n"
-    write_text(md_path, content)
+    _write_for_edit(md_path, content, session)
+    index.add(md_path, "talks", text=content)
     print(f"Created talk: {md_path}")
     return md_path, slides_url, cert_url, teaser_url
 
 
+def update_talk_map(paths: list[Path] | None = None, gazetteer: str = "", retry_missing: bool = False) -> int:
+    """Bring talkmap/org-locations.js up to date; ``paths`` limits the work to those talks."""
+    try:
+        import talkmap
+    except Exception as exc:
+        raise RuntimeError(f"Failed to import talkmap.py: {exc}") from exc
+
+    backend = talkmap.open_gazetteer(Path(gazetteer)) if gazetteer else None
+    talkmap.build_talk_map(paths, talks_dir=TALKS_DIR, backend=backend, retry_missing=retry_missing)
+    return 0
+
+
+def refresh_talk_map(paths: list[Path]) -> None:
+    """Best-effort incremental map update after adding talks; never fails the add."""
+    if not paths:
+        return
+    try:
+        update_talk_map(paths)
+    except (RuntimeError, OSError, ValueError) as exc:
+        print(f"Warning: talk map not updated ({exc}). Run `python main.py talkmap` to retry.")
+
+
 def run_command(cmd: list[str]) -> int:
     if os.name == "nt" and cmd:
         win_wrappers = {
@@ -525,16 +1894,20 @@ def run_publish(message: str, branch: str, no_push: bool) -> int:
     return run_command(["git", "push", "origin", branch])
 
 
-def _read_config_site_url() -> str:
+def _read_config_value(key: str) -> str:
     if not (REPO_ROOT / "_config.yml").exists():
         return ""
     content = read_text(REPO_ROOT / "_config.yml")
-    m = re.search(r"^url\s*:\s*([^\s#]+)", content, flags=re.MULTILINE)
+    m = re.search(rf"^{re.escape(key)}\s*:\s*([^\s#]+)", content, flags=re.MULTILINE)
     if not m:
         return ""
     return m.group(1).strip().strip("'\"")
 
 
+def _read_config_site_url() -> str:
+    return _read_config_value("url")
+
+
 def default_group_news_url() -> str:
     base = _read_config_site_url()
     if not base:
@@ -542,6 +1915,23 @@ def default_group_news_url() -> str:
     return base.rstrip("/") + "/group-news/"
 
 
+VERIFY_USER_AGENT = "site-manager/verify-publish"
+LINK_CHECK_USER_AGENT = "Mozilla/5.0 (compatible; site-manager/check-links)"
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+HTTP_READ_CHUNK = 64 * 1024
+# Called with (status, headers) once a response head arrives; may return a
+# chunk sink that receives the body instead of it being buffered.
+BodySinkFactory = Callable[[int, dict[str, str]], "Callable[[bytes], bool] | None"]
+
+
+def site_page_url(path: str) -> str:
+    if re.match(r"^https?://", path):
+        return path
+    base = _read_config_site_url() or "https://yongxie-icmm.github.io"
+    return base.rstrip("/") + normalize_url(path)
+
+
 def _append_cache_bust(url: str) -> str:
     parts = urlsplit(url)
     q = parse_qsl(parts.query, keep_blank_values=True)
@@ -549,46 +1939,368 @@ def _append_cache_bust(url: str) -> str:
     return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(q), parts.fragment))
 
 
-def fetch_page_html(url: str, timeout_seconds: int, cache_bust: bool) -> tuple[int, str, str]:
+def content_charset(content_type: str, default: str = "utf-8") -> str:
+    m = re.search(r"charset=[\"']?([\w.-]+)", content_type, flags=re.IGNORECASE)
+    return m.group(1) if m else default
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def header(self, name: str, default: str = "") -> str:
+        return self.headers.get(name.lower(), default)
+
+
+class AsyncHttpClient:
+    """Minimal asyncio HTTP/1.1 client with per-host keep-alive pools.
+
+    ``limit`` caps requests in flight across all hosts, ``per_host`` caps open
+    connections to one host, and every request (including redirects) is bounded
+    by ``timeout_seconds``. Idle connections are reused by later requests, so a
+    batch of pages and assets on the same site shares a few TCP/TLS sessions.
+    """
+
+    def __init__(self, timeout_seconds: float = 20, limit: int = 16, per_host: int = 6) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.per_host = max(1, per_host)
+        self._limit = asyncio.Semaphore(max(1, limit))
+        self._host_limits: dict[tuple[str, str, int], asyncio.Semaphore] = {}
+        self._idle: dict[tuple[str, str, int], list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self._ssl: ssl.SSLContext | None = None
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        pools = list(self._idle.values())
+        self._idle.clear()
+        for pool in pools:
+            for _, writer in pool:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except (OSError, ssl.SSLError):
+                    pass
+
+    async def _open(self, key: tuple[str, str, int]) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        scheme, host, port = key
+        if scheme != "https":
+            return await asyncio.open_connection(host, port)
+        if self._ssl is None:
+            self._ssl = ssl.create_default_context()
+        return await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> tuple[str, int, dict[str, str]]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        parts = status_line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise ValueError(f"Malformed status line: {status_line!r}")
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            headers[name] = f"{headers[name]}, {value.strip()}" if name in headers else value.strip()
+        return parts[0], int(parts[1]), headers
+
+    @staticmethod
+    async def _read_body(
+        reader: asyncio.StreamReader,
+        method: str,
+        version: str,
+        status: int,
+        headers: dict[str, str],
+        on_headers: BodySinkFactory | None,
+    ) -> tuple[bytes, bool]:
+        """Read the response body, handing it to a sink chunk by chunk if one is given.
+
+        A sink returning True stops the read early; the connection is then
+        dropped instead of being returned to the pool.
+        """
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return b"", keep_alive
+        sink = on_headers(status, headers) if on_headers else None
+        chunks: list[bytes] = []
+
+        def take(data: bytes) -> bool:
+            if sink is None:
+                chunks.append(data)
+                return False
+            return bool(sink(data))
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                data = await reader.readexactly(size)
+                await reader.readexactly(2)
+                if take(data):
+                    return b"".join(chunks), False
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining > 0:
+                data = await reader.read(min(HTTP_READ_CHUNK, remaining))
+                if not data:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                remaining -= len(data)
+                if take(data):
+                    return b"".join(chunks), False
+        else:
+            keep_alive = False
+            while data := await reader.read(HTTP_READ_CHUNK):
+                if take(data):
+                    break
+        return b"".join(chunks), keep_alive
+
+    async def _exchange(
+        self,
+        key: tuple[str, str, int],
+        method: str,
+        raw_request: bytes,
+        on_headers: BodySinkFactory | None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        # A pooled connection may have been closed by the server while idle;
+        # retry exactly once on a fresh connection before giving up. Only the
+        # request and status line are retried so a body sink is never fed twice.
+        for attempt in range(2):
+            pool = self._idle.get(key)
+            reused = bool(pool) and attempt == 0
+            reader, writer = pool.pop() if reused else await self._open(key)
+            try:
+                writer.write(raw_request)
+                await writer.drain()
+                version, status, headers = await self._read_head(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if not reused:
+                    raise
+                continue
+            except BaseException:
+                writer.close()
+                raise
+            try:
+                body, keep_alive = await self._read_body(reader, method, version, status, headers, on_headers)
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self._idle.setdefault(key, []).append((reader, writer))
+            else:
+                writer.close()
+            return status, headers, body
+        raise AssertionError("unreachable")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        on_headers: BodySinkFactory | None = None,
+    ) -> HttpResponse:
+        async with self._limit:
+            try:
+                return await asyncio.wait_for(self._request(method, url, headers, on_headers), self.timeout_seconds)
+            except asyncio.TimeoutError as exc:
+                raise RuntimeError(f"Timed out after {self.timeout_seconds}s fetching {url}") from exc
+            except (OSError, ssl.SSLError, ValueError, asyncio.IncompleteReadError) as exc:
+                raise RuntimeError(f"Network error while fetching {url}: {exc}") from exc
+
+    async def _request(
+        self, method: str, url: str, headers: dict[str, str] | None, on_headers: BodySinkFactory | None
+    ) -> HttpResponse:
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise ValueError(f"Unsupported URL: {url}")
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            key = (parts.scheme, parts.hostname, port)
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            send = {
+                "Host": parts.netloc,
+                "User-Agent": VERIFY_USER_AGENT,
+                "Accept-Encoding": "identity",
+                "Connection": "keep-alive",
+            }
+            send.update(headers or {})
+            raw = f"{method} {path} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in send.items()) + "\r\n"
+            host_limit = self._host_limits.setdefault(key, asyncio.Semaphore(self.per_host))
+            async with host_limit:
+                status, resp_headers, body = await self._exchange(key, method, raw.encode("latin-1"), on_headers)
+            location = resp_headers.get("location")
+            if status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                if status == 303:
+                    method = "GET"
+                continue
+            return HttpResponse(url=url, status=status, headers=resp_headers, body=body)
+        raise RuntimeError(f"Too many redirects while fetching {url}")
+
+    async def get(
+        self, url: str, headers: dict[str, str] | None = None, on_headers: BodySinkFactory | None = None
+    ) -> HttpResponse:
+        return await self.request("GET", url, headers, on_headers)
+
+    async def probe(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """HEAD ``url``, falling back to a one-byte ranged GET for servers that reject HEAD."""
+        resp = await self.request("HEAD", url, headers)
+        if resp.status in (403, 405, 501):
+            resp = await self.get(url, {**(headers or {}), "Range": "bytes=0-0"})
+        return resp
+
+
+async def fetch_page(
+    client: AsyncHttpClient,
+    url: str,
+    cache_bust: bool,
+    etag: str = "",
+    last_modified: str = "",
+    on_headers: BodySinkFactory | None = None,
+) -> HttpResponse:
+    headers = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     target = _append_cache_bust(url) if cache_bust else url
-    req = Request(
-        target,
-        headers={
-            "User-Agent": "site-manager/verify-publish",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache",
-        },
-    )
-    try:
-        with urlopen(req, timeout=timeout_seconds) as resp:
-            status = int(getattr(resp, "status", 200))
-            raw = resp.read()
-            charset = resp.headers.get_content_charset() or "utf-8"
-            last_modified = resp.headers.get("Last-Modified", "")
-        return status, raw.decode(charset, errors="replace"), last_modified
-    except HTTPError as exc:
-        raw = exc.read() if hasattr(exc, "read") else b""
-        text = raw.decode("utf-8", errors="replace") if raw else ""
-        return int(exc.code), text, ""
-    except URLError as exc:
-        raise RuntimeError(f"Network error while fetching {target}: {exc}") from exc
+    return await client.get(target, headers, on_headers)
+
+
+class PageScanner(HTMLParser):
+    """Single-pass, incremental extractor for visible text and ``<img src>``.
+
+    Feed raw response bytes with ``feed_bytes`` as they arrive. Text inside
+    ``script``/``style``/``noscript``/``template`` is dropped. When
+    ``stop_early`` is set, ``feed_bytes`` returns True as soon as every
+    expected snippet and image token has been seen, so the caller can stop
+    reading the response.
+    """
+
+    SKIP_TAGS = frozenset(("script", "style", "noscript", "template"))
+
+    def __init__(
+        self,
+        contains: list[str] | None = None,
+        images: list[str] | None = None,
+        charset: str = "utf-8",
+        stop_early: bool = False,
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        try:
+            self._decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+        except LookupError:
+            self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.stop_early = stop_early
+        self._parts: list[str] = []
+        self._pending_data: list[str] = []
+        self._sources: dict[str, None] = {}
+        self._skip_depth = 0
+        self._pending_text = {s.lower() for s in (contains or []) if s}
+        self._pending_images = {s.lower() for s in (images or []) if s}
+        self._window = ""
+        self._window_size = max((len(s) for s in self._pending_text), default=0)
+
+    @property
+    def satisfied(self) -> bool:
+        return not self._pending_text and not self._pending_images
+
+    @property
+    def text(self) -> str:
+        return " ".join(self._parts)
+
+    @property
+    def image_sources(self) -> list[str]:
+        return sorted(self._sources)
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        self.feed(self._decoder.decode(chunk))
+        return self.stop_early and self.satisfied
+
+    def finish(self) -> None:
+        self.feed(self._decoder.decode(b"", final=True))
+        self.close()
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_text()
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "img":
+            self._handle_img(attrs)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_text()
+        if tag == "img":
+            self._handle_img(attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        # A text node can arrive in several calls when it straddles feed()
+        # chunks; buffer it until the next tag so words are not split.
+        if not self._skip_depth:
+            self._pending_data.append(data)
+
+    def _flush_text(self) -> None:
+        if not self._pending_data:
+            return
+        piece = " ".join("".join(self._pending_data).split())
+        self._pending_data.clear()
+        if not piece:
+            return
+        self._parts.append(piece)
+        if not self._pending_text:
+            return
+        # Snippets may straddle text nodes or feed() chunks, so match against
+        # the tail of the text seen so far rather than the new piece alone.
+        self._window = f"{self._window} {piece.lower()}"[-(self._window_size + len(piece) + 1) :]
+        self._pending_text = {s for s in self._pending_text if s not in self._window}
+
+    def _handle_img(self, attrs: list[tuple[str, str | None]]) -> None:
+        src = (dict(attrs).get("src") or "").strip()
+        if not src:
+            return
+        self._sources[src] = None
+        if self._pending_images:
+            lowered = src.lower()
+            self._pending_images = {t for t in self._pending_images if t not in lowered}
+
+
+def scan_html(html: str) -> PageScanner:
+    scanner = PageScanner()
+    scanner.feed(html)
+    scanner.close()
+    return scanner
 
 
 def html_to_text(html: str) -> str:
-    cleaned = re.sub(r"(?is)<(script|style).*?>.*?</\\1>", " ", html)
-    cleaned = re.sub(r"(?s)<[^>]+>", " ", cleaned)
-    cleaned = unescape(cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    return scan_html(html).text
 
 
 def extract_image_sources(html: str) -> list[str]:
-    seen: set[str] = set()
-    for m in re.finditer(r'(?is)<img[^>]+src=["\']([^"\']+)["\']', html):
-        src = m.group(1).strip()
-        if src:
-            seen.add(src)
-    return sorted(seen)
+    return scan_html(html).image_sources
 
 
 def strip_markdown(text: str) -> str:
@@ -600,16 +2312,30 @@ def strip_markdown(text: str) -> str:
     return value
 
 
+def _clip_snippet(text: str, limit: int = 80) -> str:
+    if len(text) > limit:
+        text = text[:limit].rsplit(" ", 1)[0].strip()
+    return text
+
+
+def news_entry_snippet(line: str) -> str:
+    s = line.strip()
+    m = re.match(r"-\s*\[[^\]]+\]\s*(.*)$", s)
+    return _clip_snippet(strip_markdown(m.group(1) if m else s))
+
+
+def markdown_image_source(line: str) -> str:
+    img_m = re.search(r"!\[[^\]]*\]\(([^)]+)\)", line) or re.search(r'<img[^>]+src="([^"]+)"', line)
+    return img_m.group(1).strip() if img_m else ""
+
+
 def latest_local_news_expectations() -> tuple[list[str], list[str]]:
     lines = read_text(NEWS_FILE).splitlines()
     for i, line in enumerate(lines):
         s = line.strip()
         if not s.startswith("- ["):
             continue
-        m = re.match(r"-\s*\[[^\]]+\]\s*(.*)$", s)
-        text = strip_markdown(m.group(1) if m else s)
-        if len(text) > 80:
-            text = text[:80].rsplit(" ", 1)[0].strip()
+        text = news_entry_snippet(s)
         must_contain = [text] if text else []
 
         images: list[str] = []
@@ -621,14 +2347,173 @@ def latest_local_news_expectations() -> tuple[list[str], list[str]]:
                 continue
             if nxt.startswith("- [") or nxt.startswith("## "):
                 break
-            img_m = re.search(r"!\[[^\]]*\]\(([^)]+)\)", nxt)
-            if img_m:
-                images.append(img_m.group(1).strip())
+            src = markdown_image_source(nxt)
+            if src:
+                images.append(src)
             j += 1
         return must_contain, images
     return [], []
 
 
+def _git(*args: str) -> str:
+    proc = subprocess.run(
+        ["git", "-c", "core.quotePath=false", *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {proc.stderr.strip()}")
+    return proc.stdout
+
+
+def resolve_diff_base(spec: str) -> str:
+    """``auto`` means the working tree if content is dirty, otherwise the last commit.
+
+    When that commit has no parent (or there is no commit yet), the empty
+    tree is used, so every content file counts as added.
+    """
+    if spec != "auto":
+        return spec
+    dirty = _git("status", "--porcelain", "--", *VERIFY_DIFF_PATHS).strip()
+    base = "HEAD" if dirty else "HEAD~1"
+    try:
+        _git("rev-parse", "--verify", "--quiet", f"{base}^{{commit}}")
+    except RuntimeError:
+        return GIT_EMPTY_TREE
+    return base
+
+
+def git_added_lines(base: str) -> dict[Path, list[str]]:
+    """Added, modified or renamed content files between ``base`` and the working tree, with their added lines.
+
+    Untracked files count as entirely added; a pure rename has no added lines.
+    """
+    changed: dict[Path, list[str]] = {}
+    current: Path | None = None
+    in_hunk = False
+    diff = _git(
+        "diff", "-U0", "-M", "--no-color", "--no-ext-diff", "--diff-filter=AMR", base, "--", *VERIFY_DIFF_PATHS
+    )
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            current, in_hunk = None, False
+        elif not in_hunk and line.startswith("rename to "):
+            current = REPO_ROOT / line[len("rename to ") :]
+            changed.setdefault(current, [])
+        elif not in_hunk and line.startswith("+++ "):
+            name = line[4:]
+            current = REPO_ROOT / name[2:] if name.startswith("b/") else None
+            if current is not None:
+                changed.setdefault(current, [])
+        elif line.startswith("@@"):
+            in_hunk = True
+        elif in_hunk and current is not None and line.startswith("+"):
+            changed[current].append(line[1:])
+    for name in _git("ls-files", "--others", "--exclude-standard", "--", *VERIFY_DIFF_PATHS).splitlines():
+        path = REPO_ROOT / name
+        if path.is_file():
+            changed[path] = read_text(path).splitlines()
+    return changed
+
+
+def entry_permalink(entry: ContentEntry) -> str:
+    if entry.permalink:
+        return normalize_url(entry.permalink)
+    if entry.collection == "posts":
+        categories = entry.front_matter.get("categories") or ""
+        if isinstance(categories, list):
+            categories = "/".join(str(c) for c in categories)
+        title = re.sub(r"^\d{4}-\d{2}-\d{2}-", "", entry.slug)
+        return normalize_url("/".join(p for p in (str(categories).strip("/"), title) if p))
+    return f"/{entry.collection}/{entry.slug}/"
+
+
+def _page_permalinks() -> dict[str, Path]:
+    pages: dict[str, Path] = {}
+    pages_dir = REPO_ROOT / "_pages"
+    if pages_dir.exists():
+        for path in sorted(pages_dir.iterdir()):
+            if path.is_file() and path.suffix in COLLECTION_SUFFIXES:
+                permalink = str(parse_front_matter(read_text(path)).get("permalink") or "")
+                if permalink:
+                    pages[normalize_url(permalink)] = path
+    return pages
+
+
+def _front_matter_lines(text: str) -> set[str]:
+    lines = text.splitlines()
+    return set(lines[: _front_matter_end_line(lines)])
+
+
+def diff_verify_targets(spec: str, max_snippets: int = 5) -> list[VerifyTarget]:
+    """Derive one target per page touched since the diff base.
+
+    - collection entries: the entry title on its permalink, plus on the
+      collection's listing page (e.g. ``/publications/``) when one exists;
+    - ``group-news.md``: every added ``- [date]`` entry and added image;
+    - other ``_pages``: up to ``max_snippets`` added text lines and images.
+    """
+    base = resolve_diff_base(spec)
+    changed = git_added_lines(base)
+    index = get_content_index()
+    pages = _page_permalinks()
+    page_urls = {path: url for url, path in pages.items()}
+    targets: dict[str, VerifyTarget] = {}
+
+    def target_for(permalink: str) -> VerifyTarget:
+        url = site_page_url(permalink)
+        return targets.setdefault(url, VerifyTarget(url=url))
+
+    def expect(target: VerifyTarget, text: str = "", image: str = "") -> None:
+        if text and text not in target.contains:
+            target.contains.append(text)
+        if image and image not in target.images:
+            target.images.append(image)
+
+    for path, added in sorted(changed.items()):
+        if path.suffix not in COLLECTION_SUFFIXES or not path.exists():
+            continue
+        if path.parent.resolve() in {d.resolve() for d in COLLECTION_DIRS.values()}:
+            entry = index.entries.get(path) or index.add(path)
+            title = entry.title.strip()
+            if not title:
+                continue
+            expect(target_for(entry_permalink(entry)), _clip_snippet(title))
+            listing = normalize_url(f"/{entry.collection}/")
+            if listing in pages:
+                expect(target_for(listing), _clip_snippet(title))
+            continue
+
+        permalink = page_urls.get(path)
+        if not permalink:
+            continue
+        target = target_for(permalink)
+        skip = _front_matter_lines(read_text(path))
+        snippets = 0
+        for line in added:
+            s = line.strip()
+            if not s or line in skip or s == "---":
+                continue
+            src = markdown_image_source(s)
+            if src:
+                expect(target, image=src)
+            if path == NEWS_FILE:
+                if s.startswith("- ["):
+                    expect(target, news_entry_snippet(s))
+                continue
+            text = _clip_snippet(strip_markdown(re.sub(r"^(?:[-*+]|\d+\.)\s+", "", s)))
+            if len(text) >= 4 and snippets < max_snippets and not s.startswith("<"):
+                expect(target, text)
+                snippets += 1
+
+    result = [t for t in targets.values() if t.contains or t.images]
+    print(f"Derived expectations for {len(result)} page(s) from git diff against {base}.")
+    return result
+
+
 def verify_with_kimi(
     page_text: str,
     image_sources: list[str],
@@ -654,16 +2539,21 @@ def verify_with_kimi(
         f"Required text snippets: {json.dumps(must_contain, ensure_ascii=False)}\n"
         f"Required image tokens: {json.dumps(expect_images, ensure_ascii=False)}\n"
         f"Detected image src list: {json.dumps(clipped_images, ensure_ascii=False)}\n"
-        "Return JSON with fields:\n"
-        '{"published": boolean, "confidence": number, "missing_text": string[], "missing_images": string[], "reason": string}\n'
+        "Return JSON with exactly these fields, in this order:\n"
+        '{"confidence": number, "reason": string, "published": boolean}\n'
         f"Page text (truncated):\n{clipped_text}"
     )
+    # Stream the verdict and stop reading once "published" arrives; it is
+    # requested last so confidence and reason are already complete for the
+    # log line.
     result = client.chat_json(
         [
             {"role": "system", "content": client.strict_json_system_prompt()},
             {"role": "user", "content": prompt},
         ],
         use_cache=False,
+        stream=True,
+        until=lambda fields: "published" in fields,
     )
     if not isinstance(result, dict):
         raise RuntimeError(f"Unexpected Kimi JSON result type: {type(result)}")
@@ -674,6 +2564,330 @@ def verify_with_kimi(
     return published, message
 
 
+@dataclass
+class VerifyTarget:
+    url: str
+    contains: list[str] = field(default_factory=list)
+    images: list[str] = field(default_factory=list)
+    etag: str = ""
+    last_modified: str = ""
+    digest: str = ""
+    status: int = 0
+    page_text: str = ""
+    image_sources: list[str] = field(default_factory=list)
+    missing_text: list[str] = field(default_factory=list)
+    missing_images: list[str] = field(default_factory=list)
+    broken_images: list[str] = field(default_factory=list)
+    attempts: int = 0
+    not_modified: int = 0
+    bytes_read: int = 0
+    delay: float = 0.0
+    next_due: float = 0.0
+    passed: bool = False
+    error: str = ""
+
+    @property
+    def label(self) -> str:
+        parts = urlsplit(self.url)
+        return parts.path or self.url
+
+    @property
+    def deterministic_ok(self) -> bool:
+        return self.status == 200 and not (self.missing_text or self.missing_images or self.broken_images)
+
+
+def parse_page_target(spec: str) -> VerifyTarget:
+    """Parse ``--page`` values: ``URL`` or ``URL::required text``.
+
+    Site-relative paths such as ``/publication/foo/`` are joined with the
+    ``url`` from ``_config.yml``.
+    """
+    url, sep, text = spec.partition("::")
+    url = url.strip()
+    if not url:
+        raise ValueError(f"Invalid --page value: {spec!r}")
+    contains = [text.strip()] if sep and text.strip() else []
+    return VerifyTarget(url=site_page_url(url), contains=contains)
+
+
+def evaluate_target(target: VerifyTarget) -> None:
+    page_text_lower = target.page_text.lower()
+    image_sources_lower = [s.lower() for s in target.image_sources]
+    target.missing_text = [s for s in target.contains if s.lower() not in page_text_lower]
+    target.missing_images = [
+        token for token in target.images if not any(token.lower() in src for src in image_sources_lower)
+    ]
+    target.broken_images = []
+
+
+def build_verify_targets(
+    url: str | None,
+    contains: list[str],
+    expect_images: list[str],
+    pages: list[str] | None,
+    diff: str = "",
+) -> list[VerifyTarget]:
+    must_contain = [s.strip() for s in contains if s and s.strip()]
+    image_tokens = [s.strip() for s in expect_images if s and s.strip()]
+    targets = [parse_page_target(spec) for spec in (pages or []) if spec.strip()]
+    if diff:
+        known = {t.url for t in targets}
+        targets.extend(t for t in diff_verify_targets(diff) if t.url not in known)
+        if not targets and not ((url or "").strip() or must_contain or image_tokens):
+            raise ValueError("No content changes found in the git diff; nothing to verify.")
+
+    if (url or "").strip() or must_contain or image_tokens or not targets:
+        if not must_contain and not image_tokens:
+            auto_text, auto_images = latest_local_news_expectations()
+            must_contain = auto_text
+            image_tokens = auto_images
+            print("Auto expectations derived from latest local news entry.")
+        if not must_contain and not image_tokens:
+            raise ValueError("No verification targets found. Provide --contains/--expect-image or add local news first.")
+        target_url = site_page_url((url or "").strip()) if (url or "").strip() else default_group_news_url()
+        targets.insert(0, VerifyTarget(url=target_url, contains=must_contain, images=image_tokens))
+    return targets
+
+
+def format_target_result(target: VerifyTarget, kimi_ok: bool = True, kimi_note: str = "", note: str = "") -> str:
+    lines = [
+        f"[verify {target.label} attempt {target.attempts}] status={target.status or '-'}, "
+        f"deterministic_ok={target.deterministic_ok}, kimi_ok={kimi_ok}, "
+        f"last_modified={target.last_modified or '-'}{note}"
+    ]
+    if target.error:
+        lines.append(f"  Error: {target.error}")
+    if target.missing_text:
+        lines.append("  Missing text: " + "; ".join(target.missing_text))
+    if target.missing_images:
+        lines.append("  Missing images: " + "; ".join(target.missing_images))
+    if target.broken_images:
+        lines.append("  Broken images: " + "; ".join(target.broken_images))
+    if kimi_note:
+        lines.append(f"  Kimi: {kimi_note}")
+    return "\n".join(lines)
+
+
+def print_verify_failures(pending: list[VerifyTarget]) -> None:
+    for t in pending:
+        print(f"  {t.url} (status={t.status or '-'})")
+        if t.error:
+            print("    Error:", t.error)
+        if t.missing_text:
+            print("    Still missing text:", "; ".join(t.missing_text))
+        if t.missing_images:
+            print("    Still missing images:", "; ".join(t.missing_images))
+        if t.broken_images:
+            print("    Broken images:", "; ".join(t.broken_images))
+
+
+def site_output_path(url: str, site_dir: Path = SITE_DIR) -> Path | None:
+    """Map a page or asset URL to the file Jekyll generated for it in ``_site/``.
+
+    Returns None for URLs on other hosts or when no generated file exists.
+    """
+    parts = urlsplit(url)
+    if parts.netloc and parts.netloc != urlsplit(site_page_url("/")).netloc:
+        return None
+    path = unquote(parts.path or "/")
+    baseurl = _read_config_value("baseurl").rstrip("/")
+    if baseurl and (path == baseurl or path.startswith(baseurl + "/")):
+        path = path[len(baseurl) :] or "/"
+    rel = path.lstrip("/")
+    candidates = [site_dir / rel / "index.html"] if path.endswith("/") else [
+        site_dir / rel,
+        site_dir / f"{rel}.html",
+        site_dir / rel / "index.html",
+    ]
+    root = site_dir.resolve()
+    for candidate in candidates:
+        resolved = candidate.resolve()
+        if resolved.is_file() and (resolved == root or root in resolved.parents):
+            return resolved
+    return None
+
+
+def check_target_local(target: VerifyTarget, site_dir: Path, check_images: bool, all_images: bool) -> None:
+    """Check one target against the generated ``_site/`` tree, streaming the file through PageScanner."""
+    target.attempts += 1
+    path = site_output_path(target.url, site_dir)
+    if path is None:
+        target.status = 404
+        target.error = f"No generated page for {target.label} in {site_dir.name}/"
+        target.page_text = ""
+        target.image_sources = []
+        evaluate_target(target)
+        return
+    scanner = PageScanner(target.contains, target.images, stop_early=not all_images)
+    with path.open("rb") as fh:
+        while chunk := fh.read(HTTP_READ_CHUNK):
+            target.bytes_read += len(chunk)
+            if scanner.feed_bytes(chunk):
+                break
+    scanner.finish()
+    target.status = 200
+    target.error = ""
+    target.last_modified = datetime.fromtimestamp(path.stat().st_mtime).isoformat(timespec="seconds")
+    target.page_text = scanner.text
+    target.image_sources = scanner.image_sources
+    evaluate_target(target)
+    if check_images and target.deterministic_ok:
+        tokens = [t.lower() for t in target.images]
+        for src in target.image_sources:
+            if src.startswith("data:") or not (all_images or any(t in src.lower() for t in tokens)):
+                continue
+            asset = urljoin(target.url, src)
+            if urlsplit(asset).netloc != urlsplit(target.url).netloc:
+                continue
+            if site_output_path(asset, site_dir) is None:
+                target.broken_images.append(f"{src} (not in {site_dir.name}/)")
+
+
+def verify_local_build(
+    targets: list[VerifyTarget], site_dir: Path, check_images: bool, all_images: bool, build: bool
+) -> bool:
+    if build:
+        print("Building site for local verification...")
+        if run_command(["bundle", "exec", "jekyll", "build", "--destination", str(site_dir)]) != 0:
+            raise RuntimeError("Jekyll build failed; fix the build or re-run with --no-build to reuse the existing _site/.")
+    if not site_dir.is_dir():
+        raise FileNotFoundError(f"Generated site not found: {site_dir} (run without --no-build)")
+
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=min(8, len(targets)) or 1) as pool:
+        list(pool.map(lambda t: check_target_local(t, site_dir, check_images, all_images), targets))
+    for t in targets:
+        t.passed = t.deterministic_ok
+        print(format_target_result(t, note=" (local build)"))
+    pending = [t for t in targets if not t.passed]
+    print(
+        f"Checked {len(targets)} page(s) in {site_dir.name}/ in {time.time() - started:.2f}s "
+        f"({_format_bytes(sum(t.bytes_read for t in targets))} read)."
+    )
+    if pending:
+        print("Local verification failed:")
+        print_verify_failures(pending)
+        return False
+    print("Local verification passed.")
+    return True
+
+
+async def check_target(client: AsyncHttpClient, target: VerifyTarget, cache_bust: bool, stop_early: bool) -> bool:
+    """Fetch one target with conditional headers and re-evaluate it.
+
+    The body is parsed while it streams in; with ``stop_early`` the read ends
+    as soon as every expectation has been seen. Returns True when the page
+    changed since the previous attempt. A ``304`` keeps the previously parsed
+    text and image list.
+    """
+    target.attempts += 1
+    hasher = hashlib.sha256()
+    scanner: PageScanner | None = None
+    received = 0
+
+    def on_headers(status: int, headers: dict[str, str]) -> Callable[[bytes], bool] | None:
+        nonlocal scanner
+        if status != 200:
+            return None
+        scanner = PageScanner(
+            target.contains,
+            target.images,
+            charset=content_charset(headers.get("content-type", "")),
+            stop_early=stop_early,
+        )
+
+        def sink(chunk: bytes) -> bool:
+            nonlocal received
+            received += len(chunk)
+            hasher.update(chunk)
+            return scanner.feed_bytes(chunk)
+
+        return sink
+
+    try:
+        resp = await fetch_page(
+            client,
+            target.url,
+            cache_bust,
+            etag=target.etag,
+            last_modified=target.last_modified,
+            on_headers=on_headers,
+        )
+    except RuntimeError as exc:
+        target.error = str(exc)
+        target.status = 0
+        return False
+    target.error = ""
+    if resp.status == 304 and target.status == 200:
+        target.not_modified += 1
+        return False
+    digest = hasher.hexdigest() if scanner else sha256_bytes(resp.body)
+    changed = resp.status != target.status or digest != target.digest
+    target.status = resp.status
+    target.digest = digest
+    target.bytes_read += received + len(resp.body)
+    if resp.status == 200 and scanner:
+        scanner.finish()
+        target.etag = resp.header("ETag")
+        target.last_modified = resp.header("Last-Modified")
+        target.page_text = scanner.text
+        target.image_sources = scanner.image_sources
+    else:
+        target.etag = ""
+        target.last_modified = ""
+        target.page_text = ""
+        target.image_sources = []
+    evaluate_target(target)
+    return changed
+
+
+async def check_image_assets(
+    client: AsyncHttpClient, target: VerifyTarget, all_images: bool, verified: set[str]
+) -> None:
+    """Probe the page's ``<img src>`` assets concurrently.
+
+    Only sources matching an expected image token are probed unless
+    ``all_images`` is set. ``verified`` is shared by every target in the run so
+    an image used on several pages is fetched once; failures are re-probed on
+    the next attempt because the asset may still be deploying.
+    """
+    tokens = [t.lower() for t in target.images]
+    sources = [
+        src
+        for src in target.image_sources
+        if not src.startswith("data:") and (all_images or any(t in src.lower() for t in tokens))
+    ]
+    urls = sorted({urljoin(target.url, src) for src in sources} - verified)
+
+    async def probe(url: str) -> str:
+        try:
+            resp = await client.probe(url)
+        except RuntimeError as exc:
+            return f"{url} ({exc})"
+        if resp.status not in (200, 206):
+            return f"{url} (status {resp.status})"
+        verified.add(url)
+        return ""
+
+    results = await asyncio.gather(*(probe(url) for url in urls))
+    target.broken_images = [r for r in results if r]
+
+
+def schedule_next_check(target: VerifyTarget, changed: bool, base: float, ceiling: float, deadline: float) -> None:
+    """Adaptive per-target backoff.
+
+    A page that just changed (deployment in progress) is polled again at the
+    base interval; an unchanged or erroring page backs off geometrically up to
+    ``ceiling``. The next check is never scheduled past the deadline so every
+    target gets a final look before giving up.
+    """
+    if changed or not target.delay:
+        target.delay = base
+    else:
+        target.delay = min(ceiling, target.delay * 2)
+    target.next_due = min(time.time() + target.delay, deadline)
+
+
 def verify_publish(
     url: str | None,
     contains: list[str],
@@ -685,78 +2899,246 @@ def verify_publish(
     use_kimi: bool,
     kimi_key_file: str,
     kimi_model: str,
+    pages: list[str] | None = None,
+    max_interval_seconds: int = 60,
+    concurrency: int = 8,
+    check_images: bool = True,
+    all_images: bool = False,
+    local: str = "",
+    build: bool = True,
+    diff: str = "",
 ) -> int:
-    target_url = (url or "").strip() or default_group_news_url()
-    must_contain = [s.strip() for s in contains if s and s.strip()]
-    image_tokens = [s.strip() for s in expect_images if s and s.strip()]
-
-    if not must_contain and not image_tokens:
-        auto_text, auto_images = latest_local_news_expectations()
-        must_contain = auto_text
-        image_tokens = auto_images
-        print("Auto expectations derived from latest local news entry.")
+    targets = build_verify_targets(url, contains, expect_images, pages, diff)
 
-    if not must_contain and not image_tokens:
-        raise ValueError("No verification targets found. Provide --contains/--expect-image or add local news first.")
+    if local:
+        if not verify_local_build(targets, SITE_DIR, check_images, all_images, build):
+            return 2
+        if local == "only":
+            return 0
+        print("Local build looks correct; polling the live site to confirm deployment.")
+        targets = [VerifyTarget(url=t.url, contains=t.contains, images=t.images) for t in targets]
 
+    base = max(1, interval_seconds)
+    ceiling = max(base, max_interval_seconds)
     deadline = time.time() + max(0, max_wait_seconds)
-    attempt = 0
-    last_missing_text: list[str] = []
-    last_missing_images: list[str] = []
+    started = time.time()
+    verified_images: set[str] = set()
+
+    async def poll(client: AsyncHttpClient, target: VerifyTarget) -> None:
+        while True:
+            changed = await check_target(client, target, cache_bust, stop_early=not (use_kimi or all_images))
+            if target.deterministic_ok and check_images:
+                await check_image_assets(client, target, all_images, verified_images)
+            kimi_ok = True
+            kimi_note = ""
+            if target.deterministic_ok and use_kimi and (target.contains or target.images):
+                kimi_ok, kimi_note = await asyncio.to_thread(
+                    verify_with_kimi,
+                    page_text=target.page_text,
+                    image_sources=target.image_sources,
+                    must_contain=target.contains,
+                    expect_images=target.images,
+                    key_file=kimi_key_file,
+                    model=kimi_model,
+                )
+            target.passed = target.deterministic_ok and kimi_ok
+            note = ", not modified" if not changed and target.not_modified else ""
+            print(format_target_result(target, kimi_ok, kimi_note, note))
+            if target.passed or time.time() >= deadline:
+                return
+            schedule_next_check(target, changed, base, ceiling, deadline)
+            await asyncio.sleep(max(0.0, target.next_due - time.time()))
+
+    async def run() -> None:
+        async with AsyncHttpClient(timeout_seconds=timeout_seconds, limit=concurrency) as client:
+            await asyncio.gather(*(poll(client, t) for t in targets))
+
+    asyncio.run(run())
+    pending = [t for t in targets if not t.passed]
+
+    elapsed = time.time() - started
+    requests_made = sum(t.attempts for t in targets)
+    not_modified = sum(t.not_modified for t in targets)
+    downloaded = sum(t.bytes_read for t in targets)
+    print(
+        f"Checked {len(targets)} page(s) with {requests_made} request(s) in {elapsed:.1f}s "
+        f"({not_modified} not modified, {_format_bytes(downloaded)} downloaded)."
+    )
+    if not pending:
+        for t in targets:
+            print(f"Publish verification passed: {t.url}")
+        return 0
+    print(f"Publish verification failed after waiting {max_wait_seconds}s:")
+    print_verify_failures(pending)
+    return 2
 
-    while True:
-        attempt += 1
-        status, html, last_modified = fetch_page_html(target_url, timeout_seconds=timeout_seconds, cache_bust=cache_bust)
-        page_text = html_to_text(html)
-        page_text_lower = page_text.lower()
-        image_sources = extract_image_sources(html)
-        image_sources_lower = [s.lower() for s in image_sources]
-
-        missing_text = [s for s in must_contain if s.lower() not in page_text_lower]
-        missing_images: list[str] = []
-        for token in image_tokens:
-            t = token.lower()
-            if not any((t in src) for src in image_sources_lower):
-                missing_images.append(token)
-
-        deterministic_ok = status == 200 and not missing_text and not missing_images
-        kimi_ok = True
-        kimi_note = ""
-        if deterministic_ok and use_kimi:
-            kimi_ok, kimi_note = verify_with_kimi(
-                page_text=page_text,
-                image_sources=image_sources,
-                must_contain=must_contain,
-                expect_images=image_tokens,
-                key_file=kimi_key_file,
-                model=kimi_model,
-            )
 
-        print(
-            f"[verify attempt {attempt}] status={status}, deterministic_ok={deterministic_ok}, "
-            f"kimi_ok={kimi_ok}, last_modified={last_modified or '-'}"
+@dataclass
+class LinkReference:
+    source: Path
+    field: str
+    url: str
+    line: int = 0
+
+    @property
+    def where(self) -> str:
+        rel = self.source.relative_to(REPO_ROOT).as_posix()
+        return f"{rel}:{self.line} {self.field}" if self.line else f"{rel} {self.field}"
+
+
+def collect_link_references() -> list[LinkReference]:
+    refs: list[LinkReference] = []
+    index = get_content_index()
+    for collection in ("publications", "talks"):
+        for entry in index.iter_collection(collection):
+            for key in LINK_FIELDS:
+                value = str(entry.front_matter.get(key) or "").strip()
+                if value:
+                    refs.append(LinkReference(entry.path, key, value))
+    if NEWS_FILE.exists():
+        text = read_text(NEWS_FILE)
+        patterns = (
+            (r"(!?)\[[^\]]*\]\(\s*<?([^)\s>]+)>?[^)]*\)", None),
+            (r'(?i)<img[^>]+src=["\']([^"\']+)["\']', "image"),
+            (r'(?i)<a[^>]+href=["\']([^"\']+)["\']', "link"),
         )
-        if missing_text:
-            print("  Missing text:", "; ".join(missing_text))
-        if missing_images:
-            print("  Missing images:", "; ".join(missing_images))
-        if kimi_note:
-            print(f"  Kimi: {kimi_note}")
-
-        if deterministic_ok and kimi_ok:
-            print(f"Publish verification passed: {target_url}")
-            return 0
-
-        last_missing_text = missing_text
-        last_missing_images = missing_images
-        if time.time() >= deadline:
-            print(f"Publish verification failed after waiting {max_wait_seconds}s: {target_url}")
-            if last_missing_text:
-                print("Still missing text:", "; ".join(last_missing_text))
-            if last_missing_images:
-                print("Still missing images:", "; ".join(last_missing_images))
-            return 2
-        time.sleep(max(1, interval_seconds))
+        for pattern, kind in patterns:
+            for m in re.finditer(pattern, text):
+                if kind is None:
+                    field_name, url = ("image" if m.group(1) else "link"), m.group(2)
+                else:
+                    field_name, url = kind, m.group(1)
+                line = text.count("\n", 0, m.start()) + 1
+                refs.append(LinkReference(NEWS_FILE, field_name, url.strip(), line))
+    return refs
+
+
+def classify_link(url: str, field_name: str) -> tuple[str, str]:
+    """Return ``("local", path)``, ``("external", url)`` or ``("skip", reason)``.
+
+    Links to this site's own domain are treated as local, and a bare
+    ``header.teaser`` filename resolves under ``images/`` as the theme does.
+    """
+    value = unescape(url.strip())
+    if not value or value.startswith(("#", "mailto:", "tel:", "javascript:", "data:")):
+        return "skip", "not a fetchable link"
+    base = _read_config_site_url().rstrip("/")
+    if base and value.startswith(base + "/"):
+        value = value[len(base):]
+    if re.match(r"^https?://", value):
+        return "external", value
+    if value.startswith("//"):
+        return "external", "https:" + value
+    if field_name == "header.teaser" and not value.startswith("/"):
+        value = f"/{IMAGES_DIR.name}/{value}"
+    path = unquote(urlsplit(value).path)
+    if path.startswith((f"/{FILES_DIR.name}/", f"/{IMAGES_DIR.name}/")):
+        return "local", path
+    return "skip", "site page"
+
+
+def _load_link_cache() -> dict[str, dict]:
+    if not LINK_CACHE_FILE.exists():
+        return {}
+    try:
+        data = json.loads(read_text(LINK_CACHE_FILE))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != LINK_CACHE_VERSION:
+        return {}
+    return data.get("links") or {}
+
+
+def _save_link_cache(records: dict[str, dict]) -> None:
+    payload = {"version": LINK_CACHE_VERSION, "links": records}
+    write_text_atomic(LINK_CACHE_FILE, json.dumps(payload, separators=(",", ":")))
+
+
+def _link_state(status: int) -> str:
+    if 200 <= status < 400:
+        return "ok"
+    if status in LINK_BLOCKED_STATUSES:
+        return "blocked"
+    return "broken"
+
+
+async def probe_links(urls: list[str], timeout_seconds: int, concurrency: int) -> dict[str, dict]:
+    async def one(client: AsyncHttpClient, url: str) -> tuple[str, dict]:
+        record: dict[str, object] = {"checked": int(time.time()), "status": 0, "error": ""}
+        try:
+            resp = await client.probe(url, headers={"User-Agent": LINK_CHECK_USER_AGENT})
+            record["status"] = resp.status
+            if resp.url != url:
+                record["final_url"] = resp.url
+        except RuntimeError as exc:
+            record["error"] = str(exc)
+        record["state"] = _link_state(int(record["status"]))
+        return url, record
+
+    async with AsyncHttpClient(timeout_seconds=timeout_seconds, limit=concurrency, per_host=2) as client:
+        return dict(await asyncio.gather(*(one(client, url) for url in urls)))
+
+
+def check_links(
+    ttl_hours: float,
+    refresh: bool,
+    external: bool,
+    timeout_seconds: int,
+    concurrency: int,
+) -> int:
+    refs = collect_link_references()
+    broken: list[tuple[LinkReference, str]] = []
+    blocked: list[tuple[LinkReference, str]] = []
+    external_refs: dict[str, list[LinkReference]] = {}
+    local_count = skipped = 0
+
+    for ref in refs:
+        kind, value = classify_link(ref.url, ref.field)
+        if kind == "skip":
+            skipped += 1
+        elif kind == "local":
+            local_count += 1
+            if not (REPO_ROOT / value.lstrip("/")).is_file():
+                broken.append((ref, "missing file"))
+        elif external:
+            external_refs.setdefault(value, []).append(ref)
+        else:
+            skipped += 1
+
+    cache = _load_link_cache()
+    now = time.time()
+    ttl = max(0.0, ttl_hours) * 3600
+    stale = [
+        url
+        for url in external_refs
+        if refresh
+        or url not in cache
+        or cache[url].get("state") == "broken"
+        or now - float(cache[url].get("checked") or 0) > ttl
+    ]
+    if stale:
+        print(f"Probing {len(stale)} external link(s) ({len(external_refs) - len(stale)} cached)...")
+        cache.update(asyncio.run(probe_links(stale, timeout_seconds, concurrency)))
+        _save_link_cache(cache)
+
+    for url, url_refs in external_refs.items():
+        record = cache.get(url) or {}
+        detail = record.get("error") or f"status {record.get('status')}"
+        for ref in url_refs:
+            if record.get("state") == "broken":
+                broken.append((ref, str(detail)))
+            elif record.get("state") == "blocked":
+                blocked.append((ref, str(detail)))
+
+    for ref, reason in blocked:
+        print(f"Unverified [{ref.where}]: {ref.url} ({reason}, server refused automated requests)")
+    for ref, reason in broken:
+        print(f"Broken [{ref.where}]: {ref.url} ({reason})")
+    print(
+        f"check-links completed: references={len(refs)}, local={local_count}, external={len(external_refs)} "
+        f"(probed={len(stale)}), skipped={skipped}, unverified={len(blocked)}, broken={len(broken)}"
+    )
+    return 2 if broken else 0
 
 
 def quick_add_learning(
@@ -794,6 +3176,7 @@ def quick_add_news(
     preview: bool,
     host: str,
     port: int,
+    images: ImageOptimizer | None = None,
 ) -> int:
     add_group_news_with_assets(
         date_raw=date_raw,
@@ -804,6 +3187,7 @@ def quick_add_news(
         cert_name=cert_name,
         cert_label=cert_label,
         image_alt=image_alt,
+        images=images,
     )
     if preview:
         return run_preview(host=host, port=port, drafts=False, incremental=True)
@@ -831,6 +3215,7 @@ def quick_add_paper(
     preview: bool,
     host: str,
     port: int,
+    pdfs: PdfProcessor | None = None,
 ) -> int:
     _, final_paper_url = add_publication(
         title=title,
@@ -847,6 +3232,7 @@ def quick_add_paper(
         slug_hint=slug_hint,
         replace_existing=replace_existing,
         normalize_venue_year=not keep_venue_year,
+        pdfs=pdfs,
     )
     if not no_news:
         d = news_date or date_raw
@@ -880,8 +3266,11 @@ def quick_add_talk(
     preview: bool,
     host: str,
     port: int,
+    images: ImageOptimizer | None = None,
+    pdfs: PdfProcessor | None = None,
+    update_map: bool = True,
 ) -> int:
-    _, slides_url, cert_url, teaser_url = add_talk(
+    md_path, slides_url, cert_url, teaser_url = add_talk(
         title=title,
         date_raw=date_raw,
         venue=venue,
@@ -897,7 +3286,11 @@ def quick_add_talk(
         cert_name=cert_name,
         slug_hint=slug_hint,
         replace_existing=replace_existing,
+        images=images,
+        pdfs=pdfs,
     )
+    if update_map:
+        refresh_talk_map([md_path])
     if not no_news:
         d = news_date or date_raw
         if news_text:
@@ -911,7 +3304,11 @@ def quick_add_talk(
                 links.append(f"[Certificate]({cert_url})")
             if links:
                 auto_news += " " + " | ".join(links)
-            add_group_news(d, compose_news_text(auto_news, image_url=teaser_url, image_alt=title))
+            image_src, image_srcset = images.responsive(teaser_url) if images else (teaser_url, "")
+            add_group_news(
+                d,
+                compose_news_text(auto_news, image_url=image_src, image_alt=title, image_srcset=image_srcset),
+            )
     if preview:
         return run_preview(host=host, port=port, drafts=False, incremental=True)
     return 0
@@ -983,8 +3380,44 @@ def _section_list(data: dict, key: str) -> list[dict]:
     return result
 
 
-def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> int:
-    data, manifest_dir = _load_manifest(manifest_path)
+def _manifest_pdf_sources(data: dict, manifest_dir: Path) -> list[Path]:
+    sources: list[Path] = []
+    for section, key in (("papers", "paper_file"), ("talks", "slides_file")):
+        for item in _section_list(data, section):
+            src = _resolve_source_path(_optional_str(item, key), manifest_dir)
+            if src and src.lower().endswith(".pdf"):
+                sources.append(Path(src))
+    return sources
+
+
+def _plan_manifest_assets(data: dict, manifest_dir: Path) -> int:
+    fields = {
+        "papers": ("paper_file",),
+        "talks": ("slides_file", "image_file", "cert_file"),
+        "news": ("image_file", "cert_file"),
+    }
+    planned = 0
+    for section, keys in fields.items():
+        for idx, item in enumerate(_section_list(data, section)):
+            for key in keys:
+                src = _resolve_source_path(_optional_str(item, key), manifest_dir)
+                if src and not Path(src).is_file():
+                    raise FileNotFoundError(f"Source file not found for {section}[{idx}].{key}: {src}")
+                planned += 1 if src else 0
+    return planned
+
+
+def _apply_manifest(
+    data: dict,
+    manifest_dir: Path,
+    session: EditSession,
+    assets: AssetCopier | None = None,
+    timings: dict[str, float] | None = None,
+    images: ImageOptimizer | None = None,
+    pdfs: PdfProcessor | None = None,
+    talk_paths: list[Path] | None = None,
+) -> dict[str, int]:
+    timings = {} if timings is None else timings
     defaults_raw = data.get("defaults", {})
     if defaults_raw is None:
         defaults_raw = {}
@@ -1002,6 +3435,7 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
             title=_require_str(nav, "title", "nav"),
             url=normalize_url(_require_str(nav, "url", "nav")),
             after=_optional_str(nav, "after"),
+            session=session,
         )
 
     counts = {"learning": 0, "papers": 0, "talks": 0, "news": 0}
@@ -1017,19 +3451,21 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
                 title=_optional_str(item, "nav_title") or "Learning",
                 url=normalize_url(_optional_str(item, "nav_url") or "/learning/"),
                 after=_optional_str(item, "after") or "Teaching",
+                session=session,
             )
 
-        add_learning_resource(title, url, note)
+        add_learning_resource(title, url, note, session)
         counts["learning"] += 1
 
         if _as_bool(item.get("add_news"), default_add_news):
             date_raw = _optional_str(item, "date") or datetime.now().strftime("%Y.%m")
             news_text = _optional_str(item, "news_text") or f"Added a new learning resource: [{title}]({url})."
-            add_group_news(date_raw, news_text)
+            add_group_news(date_raw, news_text, session)
             counts["news"] += 1
 
     for idx, item in enumerate(_section_list(data, "papers")):
         context = f"papers[{idx}]"
+        item_started = time.perf_counter()
         title = _require_str(item, "title", context)
         date_raw = _require_str(item, "date", context)
         venue = _require_str(item, "venue", context)
@@ -1060,6 +3496,10 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
             slug_hint=slug_hint,
             replace_existing=replace_existing,
             normalize_venue_year=not keep_venue_year,
+            session=session,
+            assets=assets,
+            label=context,
+            pdfs=pdfs,
         )
         counts["papers"] += 1
 
@@ -1069,11 +3509,13 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
             target = final_paper_url or link
             if target:
                 default_news = f"New publication: [{title}]({target})."
-            add_group_news(news_date, _optional_str(item, "news_text") or default_news)
+            add_group_news(news_date, _optional_str(item, "news_text") or default_news, session)
             counts["news"] += 1
+        timings[context] = time.perf_counter() - item_started
 
     for idx, item in enumerate(_section_list(data, "talks")):
         context = f"talks[{idx}]"
+        item_started = time.perf_counter()
         title = _require_str(item, "title", context)
         date_raw = _require_str(item, "date", context)
         venue = _require_str(item, "venue", context)
@@ -1090,7 +3532,7 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
         slug_hint = _optional_str(item, "slug")
         replace_existing = _as_bool(item.get("replace_existing"), default_replace)
 
-        _, slides_url, cert_url, teaser_url = add_talk(
+        md_path, slides_url, cert_url, teaser_url = add_talk(
             title=title,
             date_raw=date_raw,
             venue=venue,
@@ -1106,14 +3548,21 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
             cert_name=cert_name,
             slug_hint=slug_hint,
             replace_existing=replace_existing,
+            session=session,
+            assets=assets,
+            label=context,
+            images=images,
+            pdfs=pdfs,
         )
         counts["talks"] += 1
+        if talk_paths is not None:
+            talk_paths.append(md_path)
 
         if _as_bool(item.get("add_news"), default_add_news):
             news_date = _optional_str(item, "news_date") or date_raw
             explicit_news = _optional_str(item, "news_text")
             if explicit_news:
-                add_group_news(news_date, explicit_news)
+                add_group_news(news_date, explicit_news, session)
             else:
                 default_news = f"New talk: {title}."
                 links: list[str] = []
@@ -1123,11 +3572,18 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
                     links.append(f"[Certificate]({cert_url})")
                 if links:
                     default_news += " " + " | ".join(links)
-                add_group_news(news_date, compose_news_text(default_news, image_url=teaser_url, image_alt=title))
+                image_src, image_srcset = images.responsive(teaser_url) if images else (teaser_url, "")
+                add_group_news(
+                    news_date,
+                    compose_news_text(default_news, image_url=image_src, image_alt=title, image_srcset=image_srcset),
+                    session,
+                )
             counts["news"] += 1
+        timings[context] = time.perf_counter() - item_started
 
     for idx, item in enumerate(_section_list(data, "news")):
         context = f"news[{idx}]"
+        item_started = time.perf_counter()
         date_raw = _require_str(item, "date", context)
         text = _require_str(item, "text", context)
         image_file = _resolve_source_path(_optional_str(item, "image_file"), manifest_dir)
@@ -1145,9 +3601,101 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
             cert_name=cert_name,
             cert_label=cert_label,
             image_alt=image_alt,
+            session=session,
+            assets=assets,
+            label=context,
+            images=images,
         )
         counts["news"] += 1
+        timings[context] = time.perf_counter() - item_started
+
+    return counts
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _print_ingest_report(timings: dict[str, float], copies: list[AssetCopy], wall_seconds: float) -> None:
+    by_item: dict[str, list[AssetCopy]] = {}
+    for c in copies:
+        by_item.setdefault(c.label, []).append(c)
+    for label, seconds in timings.items():
+        item_copies = by_item.get(label, [])
+        line = f"  {label}: markdown {seconds * 1000:.1f} ms"
+        if item_copies:
+            total = sum(c.bytes_copied + c.bytes_skipped for c in item_copies)
+            slowest = max(c.seconds for c in item_copies)
+            methods = ",".join(sorted({c.method for c in item_copies}))
+            line += f", assets {len(item_copies)} ({_format_bytes(total)}, {methods}) in {slowest * 1000:.1f} ms"
+        print(line)
+    copied = [c for c in copies if c.method not in ("dedupe", "unchanged")]
+    unchanged = [c for c in copies if c.method == "unchanged"]
+    reused = len(copies) - len(copied) - len(unchanged)
+    total_bytes = sum(c.bytes_copied for c in copied)
+    skipped_bytes = sum(c.bytes_skipped for c in unchanged)
+    copy_seconds = sum(c.seconds for c in copied)
+    rate = _format_bytes(total_bytes / copy_seconds) + "/s" if copy_seconds > 0 else "-"
+    print(
+        f"  assets: {len(copied)} copied ({_format_bytes(total_bytes)}), "
+        f"{len(unchanged)} unchanged ({_format_bytes(skipped_bytes)} skipped), {reused} reused, "
+        f"{rate} per worker, wall {wall_seconds:.2f}s"
+    )
 
+
+def quick_add_all(
+    manifest_path: str,
+    preview: bool,
+    host: str,
+    port: int,
+    asset_workers: int = 4,
+    hardlink_assets: bool = False,
+    reuse_identical_assets: bool = False,
+    image_options: ImageOptions | None = None,
+    image_workers: int | None = None,
+    pdf_options: PdfOptions | None = None,
+    update_map: bool = True,
+) -> int:
+    data, manifest_dir = _load_manifest(manifest_path)
+    _plan_manifest_assets(data, manifest_dir)
+    store = AssetStore().load() if reuse_identical_assets else None
+    timings: dict[str, float] = {}
+    talk_paths: list[Path] = []
+    started = time.perf_counter()
+    copier = AssetCopier(max_workers=asset_workers, hardlink=hardlink_assets, store=store)
+    images = ImageOptimizer(image_options, max_workers=image_workers) if image_options else None
+    pdfs = PdfProcessor(pdf_options, max_workers=image_workers) if pdf_options else None
+    if pdfs:
+        pdfs.prefetch(_manifest_pdf_sources(data, manifest_dir))
+    with EditSession() as session, copier as assets:
+        try:
+            counts = _apply_manifest(
+                data,
+                manifest_dir,
+                session,
+                assets=assets,
+                timings=timings,
+                images=images,
+                pdfs=pdfs,
+                talk_paths=talk_paths,
+            )
+            copies = assets.wait()
+            if images:
+                images.wait()
+        finally:
+            if images:
+                images.close()
+    if store is not None:
+        store.save()
+    if update_map:
+        refresh_talk_map(talk_paths)
+    _print_ingest_report(timings, copies, time.perf_counter() - started)
+    if images:
+        images.report()
     print(
         "quick-add-all completed: "
         f"learning={counts['learning']}, papers={counts['papers']}, talks={counts['talks']}, news={counts['news']}"
@@ -1157,30 +3705,164 @@ def quick_add_all(manifest_path: str, preview: bool, host: str, port: int) -> in
     return 0
 
 
+def _asset_reference_patterns(path: Path) -> tuple[re.Pattern[str], re.Pattern[str] | None, re.Pattern[str] | None]:
+    """Patterns for ``path``'s URL and, under images/, its bare name in YAML values and attributes."""
+    url_pattern = re.compile(re.escape(asset_url(path)) + r"(?![\w.-])")
+    if path.parent.resolve() != IMAGES_DIR.resolve():
+        return url_pattern, None, None
+    # The theme also accepts bare filenames relative to /images/ (avatar, teaser).
+    name = re.escape(path.name)
+    return (
+        url_pattern,
+        re.compile(_YAML_VALUE_PREFIX + name + r"(?=[\"']?[ \t]*$)"),
+        re.compile(_ATTRIBUTE_PREFIX + name + r"(?=[\"'])"),
+    )
+
+
+def _bare_asset_reference(keep: Path) -> str:
+    """Replacement for a bare-filename reference: the theme prepends ``/images/`` to it."""
+    try:
+        return keep.resolve().relative_to(IMAGES_DIR.resolve()).as_posix()
+    except ValueError:
+        return asset_url(keep)
+
+
+def _rewrite_asset_references(text: str, ref_file: Path, path: Path, keep: Path) -> tuple[str, int]:
+    """Point references to ``path`` in ``text`` at ``keep``; with ``keep == path`` this only counts them."""
+    url_pattern, yaml_pattern, attribute_pattern = _asset_reference_patterns(path)
+    keep_url, keep_bare = asset_url(keep), _bare_asset_reference(keep)
+    text, count = url_pattern.subn(lambda _: keep_url, text)
+    if yaml_pattern is None or attribute_pattern is None:
+        return text, count
+
+    def bare(m: re.Match[str]) -> str:
+        return m.group(1) + keep_bare
+
+    text, n = attribute_pattern.subn(bare, text)
+    count += n
+    if ref_file.suffix.lower() in (".yml", ".yaml"):
+        text, n = yaml_pattern.subn(bare, text)
+        return text, count + n
+    lines = text.splitlines(keepends=True)
+    end = _front_matter_end_line(lines)
+    front, n = yaml_pattern.subn(bare, "".join(lines[:end]))
+    return front + "".join(lines[end:]), count + n
+
+
+def _asset_reference_files() -> list[Path]:
+    files: list[Path] = []
+    for root, dirs, names in os.walk(REPO_ROOT):
+        dirs[:] = sorted(d for d in dirs if d not in ASSET_REFERENCE_SKIP_DIRS)
+        files.extend(Path(root) / name for name in sorted(names) if Path(name).suffix.lower() in ASSET_REFERENCE_SUFFIXES)
+    return files
+
+
+def _read_reference_file(path: Path, session: EditSession | None = None) -> str | None:
+    try:
+        return session.read(path) if session else read_text(path)
+    except UnicodeDecodeError:
+        return None
+
+
+def _count_asset_references(paths: list[Path]) -> dict[Path, int]:
+    counts = {p: 0 for p in paths}
+    for ref_file in _asset_reference_files():
+        text = _read_reference_file(ref_file)
+        if text is None:
+            continue
+        for p in paths:
+            counts[p] += _rewrite_asset_references(text, ref_file, p, p)[1]
+    return counts
+
+
+def dedupe_assets(apply: bool) -> int:
+    store = AssetStore().load()
+    groups = store.duplicates()
+    if not groups:
+        store.save()
+        print("dedupe-assets: no duplicate assets found")
+        return 0
+
+    reclaimed = 0
+    rewrites: list[tuple[Path, Path]] = []
+    removals: list[Path] = []
+    for paths in groups:
+        refs = _count_asset_references(paths)
+        size = _format_bytes(paths[0].stat().st_size)
+        # files/ URLs are published (CV, papers linked from other sites), so
+        # copies there are reported but never deleted or rewritten.
+        image_copies = [p for p in paths if not p.resolve().is_relative_to(FILES_DIR.resolve())]
+        if len(image_copies) < 2:
+            print(f"Duplicate set ({size} each), left in place:")
+            for p in paths:
+                print(f"  {asset_url(p)} ({refs[p]} references)")
+            continue
+        # Bare filenames only resolve under images/, so while any images/ root
+        # copy is referenced, the keeper must be one of those.
+        image_root = [p for p in image_copies if p.parent.resolve() == IMAGES_DIR.resolve()]
+        candidates = image_root if any(refs[p] for p in image_root) else image_copies
+        keep = max(candidates, key=lambda p: (refs[p], -len(p.name), [-ord(ch) for ch in p.name]))
+        print(f"Duplicate set ({size} each), keeping {asset_url(keep)}:")
+        for p in paths:
+            if p == keep:
+                continue
+            if p not in image_copies:
+                print(f"  {asset_url(p)} ({refs[p]} references, left in place)")
+                continue
+            print(f"  {asset_url(p)} ({refs[p]} references)")
+            rewrites.append((p, keep))
+            removals.append(p)
+            reclaimed += p.stat().st_size
+
+    if not apply:
+        store.save()
+        print(
+            f"dedupe-assets: {len(removals)} duplicate image(s), {_format_bytes(reclaimed)} reclaimable. "
+            "Re-run with --apply to collapse them."
+        )
+        return 0
+
+    with EditSession() as session:
+        for path in _asset_reference_files():
+            text = _read_reference_file(path, session)
+            if text is None:
+                continue
+            updated = text
+            for p, keep in rewrites:
+                updated = _rewrite_asset_references(updated, path, p, keep)[0]
+            if updated != text:
+                session.write(path, updated)
+                print(f"Rewrote asset references in {path.relative_to(REPO_ROOT).as_posix()}")
+    for p in removals:
+        p.unlink()
+        store.forget(p)
+    store.save()
+    reset_content_index()
+    print(f"dedupe-assets completed: removed={len(removals)}, reclaimed={_format_bytes(reclaimed)}")
+    return 0
+
+
 def audit_publications(fix_venue_year: bool) -> int:
     if not PUBLICATIONS_DIR.exists():
         print(f"Publication directory does not exist: {PUBLICATIONS_DIR}")
         return 1
 
-    files = sorted(PUBLICATIONS_DIR.glob("*.md"))
     checked = 0
     warnings_count = 0
     fixed_count = 0
 
-    for path in files:
-        text = read_text(path)
-        title_match = re.search(r'^title:\s*["\']?(.*?)["\']?\s*$', text, flags=re.MULTILINE)
-        date_match = re.search(r"^date:\s*([0-9]{4}-[0-9]{2}-[0-9]{2})\s*$", text, flags=re.MULTILINE)
-        venue_match = re.search(r'^venue:\s*(["\']?)(.*?)\1\s*$', text, flags=re.MULTILINE)
-        citation_match = re.search(r'^citation:\s*(["\']?)(.*?)\1\s*$', text, flags=re.MULTILINE)
-        if not date_match or not venue_match:
+    index = get_content_index()
+    for entry in index.iter_collection("publications"):
+        path = entry.path
+        fm = entry.front_matter
+        if not re.match(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$", str(fm.get("date") or "")) or "venue" not in fm:
             continue
 
         checked += 1
-        title = title_match.group(1).strip() if title_match else path.stem
-        date_iso = date_match.group(1).strip()
-        venue = venue_match.group(2).strip()
-        citation = citation_match.group(2).strip() if citation_match else ""
+        title = entry.title.strip() or path.stem
+        date_iso = entry.date
+        venue = str(fm.get("venue") or "").strip()
+        citation = str(fm.get("citation") or "").strip()
 
         warnings = check_publication_metadata(title, date_iso, venue, citation)
         for w in warnings:
@@ -1191,19 +3873,24 @@ def audit_publications(fix_venue_year: bool) -> int:
             normalized_venue, changed = normalize_publication_venue(venue, date_iso)
             if changed:
                 fixed_count += 1
-                quote = venue_match.group(1)
-                if quote:
+                text = read_text(path)
+                venue_match = re.search(r'^venue:\s*(["\']?)(.*?)\1\s*$', text, flags=re.MULTILINE)
+                quote = venue_match.group(1) if venue_match else "'"
+                if quote == "'":
+                    replacement = f"venue: {yaml_quote(normalized_venue)}"
+                elif quote:
                     replacement = f"venue: {quote}{normalized_venue}{quote}"
                 else:
                     replacement = f"venue: {normalized_venue}"
                 updated = re.sub(
                     r'^venue:\s*(["\']?).*?\1\s*$',
-                    replacement,
+                    lambda _: replacement,
                     text,
                     count=1,
                     flags=re.MULTILINE,
                 )
                 write_text(path, updated)
+                index.add(path, "publications")
                 print(f"Fixed [{path.name}]: venue '{venue}' -> '{normalized_venue}'")
 
     print(
@@ -1213,6 +3900,460 @@ def audit_publications(fix_venue_year: bool) -> int:
     return 0
 
 
+@dataclass
+class BibEntry:
+    entry_type: str
+    key: str
+    fields: dict[str, str]
+    line: int
+
+
+@dataclass
+class BibPublication:
+    key: str
+    line: int
+    title: str = ""
+    date_iso: str = ""
+    venue: str = ""
+    citation: str = ""
+    excerpt: str | None = None
+    body: str | None = None
+    category: str = ""
+    link: str | None = None
+    error: str = ""
+
+
+_BIB_ENTRY_START = re.compile(r"@\s*([A-Za-z]+)\s*([{(])")
+_BIB_FIELD_NAME = re.compile(r"\s*([^\s=,{}\"#]+)\s*=\s*")
+_BIB_MACRO_NAME = re.compile(r"[A-Za-z_][\w:.+/-]*")
+_BIB_NUMBER = re.compile(r"\d+")
+
+
+def _bib_braced(text: str, start: int, close: str) -> int:
+    """Index of ``close`` ending the group that opens at ``start``, honouring nested braces."""
+    depth = 0
+    i = start + 1
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+        elif ch == close and depth == 0:
+            return i
+        i += 1
+    raise ValueError("unbalanced braces")
+
+
+def _parse_bib_value(text: str, pos: int, macros: dict[str, str]) -> tuple[str, int]:
+    parts: list[str] = []
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            break
+        ch = text[pos]
+        if ch in "{\"":
+            end = _bib_braced(text, pos, "}" if ch == "{" else '"')
+            parts.append(text[pos + 1 : end])
+            pos = end + 1
+        else:
+            m = _BIB_NUMBER.match(text, pos) or _BIB_MACRO_NAME.match(text, pos)
+            if not m:
+                raise ValueError(f"unexpected {ch!r}")
+            parts.append(macros.get(m.group(0).lower(), m.group(0)))
+            pos = m.end()
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos < len(text) and text[pos] == "#":
+            pos += 1
+            continue
+        break
+    return "".join(parts), pos
+
+
+def parse_bib_fields(body: str, macros: dict[str, str]) -> dict[str, str]:
+    """Parse ``name = value, ...`` (braced, quoted, numeric, macro and ``#`` values)."""
+    fields: dict[str, str] = {}
+    pos = 0
+    while True:
+        while pos < len(body) and (body[pos].isspace() or body[pos] == ","):
+            pos += 1
+        if pos >= len(body):
+            return fields
+        m = _BIB_FIELD_NAME.match(body, pos)
+        if not m:
+            raise ValueError(f"expected a field name near {body[pos:pos + 20]!r}")
+        value, pos = _parse_bib_value(body, m.end(), macros)
+        fields[m.group(1).lower()] = value
+
+
+def iter_bib_entries(path: Path, errors: list[str] | None = None) -> Iterator[BibEntry]:
+    """Stream entries from a .bib file without loading it whole.
+
+    ``@string`` macros are applied to later entries, ``@comment`` and
+    ``@preamble`` are ignored, and text outside entries is treated as a
+    comment, as BibTeX does. Malformed entries are reported into ``errors``
+    and skipped.
+    """
+    macros = {name: str(number) for number, name in enumerate(BIB_MONTHS, start=1)}
+    entry_type = ""
+    closer = ""
+    buf: list[str] = []
+    depth = 0
+    in_quote = False
+    start_line = 0
+    with path.open(encoding="utf-8-sig", errors="replace") as fh:
+        for lineno, line in enumerate(fh, start=1):
+            pos = 0
+            while pos < len(line):
+                if not entry_type:
+                    at = line.find("@", pos)
+                    if at < 0:
+                        break
+                    m = _BIB_ENTRY_START.match(line, at)
+                    if not m:
+                        pos = at + 1
+                        continue
+                    entry_type, closer = m.group(1).lower(), "}" if m.group(2) == "{" else ")"
+                    buf, depth, in_quote, start_line, pos = [], 0, False, lineno, m.end()
+                    continue
+                end = -1
+                i = pos
+                while i < len(line):
+                    ch = line[i]
+                    if ch == "\\":
+                        i += 2
+                        continue
+                    if ch == "{":
+                        depth += 1
+                    elif ch == "}" and depth > 0:
+                        depth -= 1
+                    elif ch == '"' and depth == 0:
+                        in_quote = not in_quote
+                    elif ch == closer and depth == 0 and not in_quote:
+                        end = i
+                        break
+                    i += 1
+                if end < 0:
+                    buf.append(line[pos:])
+                    break
+                buf.append(line[pos:end])
+                body, kind = "".join(buf), entry_type
+                entry_type, pos = "", end + 1
+                if kind in ("comment", "preamble"):
+                    continue
+                try:
+                    if kind == "string":
+                        for name, value in parse_bib_fields(body, macros).items():
+                            macros[name] = value
+                        continue
+                    key, _, rest = body.partition(",")
+                    yield BibEntry(kind, key.strip(), parse_bib_fields(rest, macros), start_line)
+                except ValueError as exc:
+                    if errors is not None:
+                        errors.append(f"{path.name}:{start_line}: malformed @{kind} entry ({exc})")
+    if entry_type and errors is not None:
+        errors.append(f"{path.name}:{start_line}: unterminated @{entry_type} entry")
+
+
+def _latex_accent(m: re.Match[str]) -> str:
+    base = {"\\i": "i", "\\j": "j"}.get(m.group(2), m.group(2))
+    return unicodedata.normalize("NFC", base + LATEX_ACCENTS[m.group(1)])
+
+
+def latex_to_text(value: str) -> str:
+    """Plain text for a BibTeX value: accents resolved, commands and grouping braces dropped."""
+    s = value.replace("\\{", "\x00").replace("\\}", "\x01")
+    s = re.sub(r"\$([^$]*)\$", lambda m: re.sub(r"[_^]", "", m.group(1)), s)
+    s = re.sub(r"\{?\\([`'^\"~=.])\s*\{?\s*(\\[ij]|[A-Za-z])\s*\}?\}?", _latex_accent, s)
+    s = re.sub(r"\{?\\([uvHckdb])\s*\{\s*(\\[ij]|[A-Za-z])\s*\}\}?", _latex_accent, s)
+    s = re.sub(
+        r"\\(ss|ae|AE|oe|OE|aa|AA|o|O|l|L|i|j)(?![A-Za-z])\s*",
+        lambda m: LATEX_SYMBOLS[m.group(1)],
+        s,
+    )
+    s = re.sub(r"\\([&%$#_])", r"\1", s)
+    s = re.sub(r"\\[A-Za-z]+\*?\s*", "", s)
+    s = s.replace("---", "\u2014").replace("--", "\u2013").replace("~", " ")
+    s = s.replace("{", "").replace("}", "").replace("\\", "")
+    s = s.replace("\x00", "{").replace("\x01", "}")
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def _split_bib_names(value: str) -> list[str]:
+    names: list[str] = []
+    depth = 0
+    start = 0
+    for m in re.finditer(r"[{}]|\s+and\s+", value):
+        token = m.group(0)
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            names.append(value[start : m.start()])
+            start = m.end()
+    names.append(value[start:])
+    return [n.strip() for n in names if n.strip()]
+
+
+def format_bib_authors(value: str) -> str:
+    """``Last, First and First Last and others`` -> ``First Last, First Last, et al.``"""
+    authors: list[str] = []
+    for name in _split_bib_names(value):
+        if name.lower() == "others":
+            authors.append("et al.")
+            continue
+        parts = [p.strip() for p in re.split(r",(?![^{]*\})", name)]
+        if len(parts) >= 2:
+            name = " ".join([*parts[2:], parts[1], parts[0]] if len(parts) > 2 else [parts[1], parts[0]])
+        authors.append(latex_to_text(name))
+    return ", ".join(a for a in authors if a)
+
+
+def bib_entry_date(fields: dict[str, str]) -> str:
+    raw_date = fields.get("date", "").strip()
+    m = re.match(r"^(\d{4})(?:-(\d{1,2}))?(?:-(\d{1,2}))?", raw_date)
+    if m:
+        year, month, day = int(m.group(1)), int(m.group(2) or 1), int(m.group(3) or 1)
+    else:
+        year_match = re.search(r"\d{4}", fields.get("year", ""))
+        if not year_match:
+            raise ValueError("missing year")
+        year = int(year_match.group(0))
+        month_raw = latex_to_text(fields.get("month", "")).lower()
+        if month_raw.isdigit():
+            month = int(month_raw)
+        else:
+            month = next((i for i, name in enumerate(BIB_MONTHS, start=1) if month_raw.startswith(name)), 1)
+        day_raw = fields.get("day", "").strip()
+        day = int(day_raw) if day_raw.isdigit() else 1
+    try:
+        return datetime(year, month, day).strftime("%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"invalid date {year:04d}-{month:02d}-{day:02d}") from None
+
+
+def bib_entry_to_publication(
+    entry: BibEntry,
+    category: str = "",
+    normalize_venue_year: bool = True,
+) -> BibPublication:
+    """Map one BibTeX entry onto ``add_publication`` arguments (no side effects).
+
+    The year is stripped from the venue name before volume/issue/pages are
+    appended, since ``normalize_publication_venue`` only sees a trailing year.
+    """
+    pub = BibPublication(key=entry.key, line=entry.line)
+    f = entry.fields
+    try:
+        pub.title = latex_to_text(f.get("title", ""))
+        if not pub.title:
+            raise ValueError("missing title")
+        pub.date_iso = bib_entry_date(f)
+        venue_name = next((latex_to_text(f[k]) for k in BIB_VENUE_FIELDS if f.get(k, "").strip()), "")
+        if not venue_name:
+            raise ValueError("missing journal/booktitle/publisher")
+    except ValueError as exc:
+        pub.error = str(exc)
+        return pub
+    if normalize_venue_year:
+        venue_name, _ = normalize_publication_venue(venue_name, pub.date_iso)
+
+    volume = latex_to_text(f.get("volume", ""))
+    number = latex_to_text(f.get("number", "") or f.get("issue", ""))
+    pages = latex_to_text(f.get("pages", "")).replace("\u2013", "-")
+    article = latex_to_text(f.get("eid", "") or f.get("articleno", "") or f.get("article-number", ""))
+    venue_parts = [venue_name]
+    if volume:
+        venue_parts.append(f"Volume {volume}")
+    if number:
+        venue_parts.append(f"Issue {number}")
+    if pages:
+        venue_parts.append(f"Pages {pages}")
+    elif article:
+        venue_parts.append(f"Article {article}")
+    pub.venue = ", ".join(venue_parts)
+
+    details = ""
+    if volume:
+        details += f", {volume}" + (f"({number})" if number else "")
+    if pages or article:
+        details += f", {pages or article}"
+    authors = format_bib_authors(f.get("author", "") or f.get("editor", ""))
+    year = pub.date_iso[:4]
+    pub.citation = (
+        (f"{authors.rstrip('.')}. " if authors else "")
+        + f"({year}). &quot;{pub.title.rstrip('.')}.&quot; <i>{venue_name}</i>{details}."
+    )
+
+    note = latex_to_text(f.get("note", ""))
+    pub.excerpt = note if len(note) > 5 else None
+    abstract = latex_to_text(f.get("abstract", ""))
+    pub.body = abstract or None
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:)", "", f.get("doi", "").strip(), flags=re.I)
+    url = f.get("url", "").strip()
+    pub.link = url or (f"https://doi.org/{doi}" if doi else None)
+    pub.category = category or BIB_CATEGORY_BY_TYPE.get(entry.entry_type, "manuscripts")
+    return pub
+
+
+def convert_bib_chunk(entries: list[BibEntry], category: str, normalize_venue_year: bool) -> list[BibPublication]:
+    return [bib_entry_to_publication(entry, category, normalize_venue_year) for entry in entries]
+
+
+def _publication_link_key(url: str) -> str:
+    s = url.strip().lower()
+    m = re.search(r"\b(10\.\d{4,9}/\S+)", s)
+    if m:
+        return "doi:" + m.group(1).rstrip("/.")
+    return re.sub(r"^https?://(www\.)?", "", s).rstrip("/")
+
+
+def _chunked(items: Iterator[BibEntry], size: int) -> Iterator[list[BibEntry]]:
+    chunk: list[BibEntry] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_converted_chunks(
+    chunks: Iterator[list[BibEntry]],
+    category: str,
+    normalize_venue_year: bool,
+    workers: int,
+) -> Iterator[list[BibPublication]]:
+    """Convert chunks in worker processes, in order, with a bounded number in flight.
+
+    A file that fits in one chunk is converted inline: starting the pool
+    would cost more than the conversion.
+    """
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if workers <= 1 or second is None:
+        for chunk in (first, second):
+            if chunk is not None:
+                yield convert_bib_chunk(chunk, category, normalize_venue_year)
+        for chunk in chunks:
+            yield convert_bib_chunk(chunk, category, normalize_venue_year)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: list[Future] = [
+            pool.submit(convert_bib_chunk, first, category, normalize_venue_year),
+            pool.submit(convert_bib_chunk, second, category, normalize_venue_year),
+        ]
+        for chunk in chunks:
+            in_flight.append(pool.submit(convert_bib_chunk, chunk, category, normalize_venue_year))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.pop(0).result()
+        for future in in_flight:
+            yield future.result()
+
+
+def import_bib(
+    bib_files: list[str],
+    category: str,
+    replace_existing: bool,
+    normalize_venue_year: bool = True,
+    workers: int | None = None,
+    chunk_size: int = BIB_CHUNK_SIZE,
+    dry_run: bool = False,
+) -> int:
+    paths = [Path(p) for p in bib_files]
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"BibTeX file not found: {path}")
+
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    index = get_content_index()
+    known_links: dict[str, Path] = {}
+    for entry in index.iter_collection("publications"):
+        for name in ("link", "paperurl"):
+            value = str(entry.front_matter.get(name) or "")
+            if value.startswith("http"):
+                known_links.setdefault(_publication_link_key(value), entry.path)
+
+    # Dry runs write nothing to the index, so entries they would import are
+    # tracked here to catch duplicates within the .bib files themselves.
+    planned_titles: dict[str, list[Path]] = {}
+    planned_slugs: dict[str, list[Path]] = {}
+    parse_errors: list[str] = []
+    counts = {"entries": 0, "imported": 0, "duplicates": 0, "skipped": 0}
+    with EditSession() as session:
+        for path in paths:
+            chunks = _chunked(iter_bib_entries(path, parse_errors), chunk_size)
+            for converted in _iter_converted_chunks(chunks, category, normalize_venue_year, workers):
+                for pub in converted:
+                    counts["entries"] += 1
+                    label = f"{path.name}:{pub.line} {pub.key}"
+                    if pub.error:
+                        counts["skipped"] += 1
+                        print(f"Skipped [{label}]: {pub.error}")
+                        continue
+                    slug = f"{pub.date_iso}-{slugify(pub.title)}"
+                    same_title = index.find_by_title("publications", pub.title) or planned_titles.get(
+                        normalize_title(pub.title), []
+                    )
+                    linked = known_links.get(_publication_link_key(pub.link)) if pub.link else None
+                    duplicate = (
+                        same_title
+                        or ([linked] if linked else [])
+                        or index.find_by_slug("publications", slug)
+                        or planned_slugs.get(slug, [])
+                    )
+                    if duplicate and not (replace_existing and same_title):
+                        counts["duplicates"] += 1
+                        print(f"Duplicate [{label}]: already in {duplicate[0].name}")
+                        continue
+                    if dry_run:
+                        md_path = PUBLICATIONS_DIR / f"{slug}.md"
+                        planned_titles[normalize_title(pub.title)] = [md_path]
+                        planned_slugs[slug] = [md_path]
+                        if pub.link:
+                            known_links[_publication_link_key(pub.link)] = md_path
+                        counts["imported"] += 1
+                        print(f"Would import [{label}]: {pub.date_iso} {pub.title}")
+                        continue
+                    md_path, _ = add_publication(
+                        title=pub.title,
+                        date_raw=pub.date_iso,
+                        venue=pub.venue,
+                        citation=pub.citation,
+                        excerpt=pub.excerpt,
+                        body=pub.body,
+                        category=pub.category,
+                        link=pub.link,
+                        paper_file=None,
+                        paper_name=None,
+                        paper_url=None,
+                        slug_hint=None,
+                        replace_existing=replace_existing,
+                        normalize_venue_year=normalize_venue_year,
+                        session=session,
+                    )
+                    if pub.link:
+                        known_links[_publication_link_key(pub.link)] = md_path
+                    counts["imported"] += 1
+
+    for error in parse_errors:
+        print(f"Warning: {error}")
+    print(
+        f"import-bib {'dry run ' if dry_run else ''}completed: entries={counts['entries']}, "
+        f"imported={counts['imported']}, duplicates={counts['duplicates']}, "
+        f"skipped={counts['skipped'] + len(parse_errors)} ({time.perf_counter() - started:.1f}s)"
+    )
+    return 0
+
+
 def run_legacy(task: str) -> int:
     mapping = {
         "add-paper": REPO_ROOT / "add_paper_autonomous_v3.py",
@@ -1247,6 +4388,7 @@ def add_common_paper_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--slug", default="")
     parser.add_argument("--replace-existing", action="store_true")
     parser.add_argument("--keep-venue-year", action="store_true", help="Do not normalize trailing year in venue")
+    add_pdf_optimization_args(parser)
 
 
 def add_common_talk_args(parser: argparse.ArgumentParser) -> None:
@@ -1265,6 +4407,86 @@ def add_common_talk_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--cert-name", default="")
     parser.add_argument("--slug", default="")
     parser.add_argument("--replace-existing", action="store_true")
+    add_image_optimization_args(parser)
+    add_pdf_optimization_args(parser)
+    add_talkmap_update_args(parser)
+
+
+def add_talkmap_update_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--no-talkmap",
+        action="store_true",
+        help="Do not update the talk map markers (talkmap/org-locations.js) for added talks",
+    )
+
+
+def add_image_optimization_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--optimize-images",
+        action="store_true",
+        help="Generate resized/re-encoded responsive variants under images/responsive/ (requires Pillow)",
+    )
+    parser.add_argument(
+        "--image-widths",
+        default=",".join(str(w) for w in DEFAULT_IMAGE_WIDTHS),
+        help="Comma-separated variant widths in pixels",
+    )
+    parser.add_argument(
+        "--image-formats",
+        default=",".join(DEFAULT_IMAGE_FORMATS),
+        help="Comma-separated extra formats besides the source format (webp, avif)",
+    )
+    parser.add_argument("--image-quality", type=int, default=82, help="Encoder quality for JPEG/WebP/AVIF variants")
+
+
+def add_pdf_optimization_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--optimize-pdf",
+        action="store_true",
+        help="Linearize uploaded PDFs for fast web view (requires pikepdf or qpdf)",
+    )
+    parser.add_argument(
+        "--pdf-downsample-dpi",
+        type=int,
+        default=0,
+        help="With --optimize-pdf, also downsample embedded images to this DPI (requires PyMuPDF or Ghostscript)",
+    )
+    parser.add_argument(
+        "--pdf-thumbnail-width",
+        type=int,
+        default=0,
+        help="With --optimize-pdf, render a first-page thumbnail of this width as the teaser image",
+    )
+
+
+def pdf_options_from_args(args: argparse.Namespace) -> PdfOptions | None:
+    if not getattr(args, "optimize_pdf", False):
+        return None
+    return PdfOptions(
+        linearize=True,
+        downsample_dpi=max(0, args.pdf_downsample_dpi),
+        thumbnail_width=max(0, args.pdf_thumbnail_width),
+    )
+
+
+def _inline_pdf_processor(args: argparse.Namespace) -> PdfProcessor | None:
+    options = pdf_options_from_args(args)
+    return PdfProcessor(options, max_workers=0) if options else None
+
+
+def image_options_from_args(args: argparse.Namespace) -> ImageOptions | None:
+    if not getattr(args, "optimize_images", False):
+        return None
+    widths = tuple(sorted({int(w) for w in args.image_widths.split(",") if w.strip()}))
+    formats = tuple(f.strip().lower() for f in args.image_formats.split(",") if f.strip())
+    if not widths or any(w <= 0 for w in widths):
+        raise ValueError(f"Invalid --image-widths: {args.image_widths}")
+    return ImageOptions(widths=widths, formats=formats, quality=args.image_quality)
+
+
+def _inline_image_optimizer(args: argparse.Namespace) -> ImageOptimizer | None:
+    options = image_options_from_args(args)
+    return ImageOptimizer(options, max_workers=0) if options else None
 
 
 def add_common_news_asset_args(parser: argparse.ArgumentParser) -> None:
@@ -1274,6 +4496,7 @@ def add_common_news_asset_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--cert-file", default="", help="Optional certificate/pdf file to copy into files/ and link in news")
     parser.add_argument("--cert-name", default="", help="Optional target filename in files/")
     parser.add_argument("--cert-label", default="Certificate", help="Link label for certificate")
+    add_image_optimization_args(parser)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -1301,9 +4524,47 @@ def build_parser() -> argparse.ArgumentParser:
     p_talk = sub.add_parser("add-talk", help="Add talk markdown (+ optional assets copy)")
     add_common_talk_args(p_talk)
 
+    p_bib = sub.add_parser("import-bib", help="Import publications from BibTeX exports (ORCID, Zotero, ...)")
+    p_bib.add_argument("--bib", action="append", required=True, help="BibTeX file (repeatable)")
+    p_bib.add_argument(
+        "--category",
+        default="",
+        choices=["", "manuscripts", "conferences", "books"],
+        help="Publication category (default: from the entry type)",
+    )
+    p_bib.add_argument("--replace-existing", action="store_true", help="Rewrite publications with the same title")
+    p_bib.add_argument("--keep-venue-year", action="store_true", help="Do not normalize trailing year in venue")
+    p_bib.add_argument("--workers", type=int, default=0, help="Entry conversion worker processes (default: CPU count)")
+    p_bib.add_argument("--chunk-size", type=int, default=BIB_CHUNK_SIZE, help="Entries per worker task")
+    p_bib.add_argument("--dry-run", action="store_true", help="Report what would be imported without writing")
+
     p_audit = sub.add_parser("audit-publications", help="Check publication metadata consistency")
     p_audit.add_argument("--fix-venue-year", action="store_true", help="Normalize trailing year in venue for all publications")
 
+    p_optimize = sub.add_parser("optimize-images", help="Generate responsive variants for existing images/ (requires Pillow)")
+    add_image_optimization_args(p_optimize)
+    p_optimize.add_argument("--workers", type=int, default=0, help="Worker processes (default: CPU count)")
+    p_optimize.add_argument("--min-bytes", type=int, default=100 * 1024, help="Skip source images smaller than this")
+    p_optimize.add_argument("--force", action="store_true", help="Ignore the result manifest and re-encode everything")
+
+    p_dedupe = sub.add_parser("dedupe-assets", help="Find and collapse byte-identical files in files/ and images/")
+    p_dedupe.add_argument("--apply", action="store_true", help="Rewrite references and delete duplicate images (default: report only)")
+
+    p_links = sub.add_parser("check-links", help="Check paper/slides/teaser links and group-news assets resolve")
+    p_links.add_argument("--ttl-hours", type=float, default=24, help="Re-probe external links older than this")
+    p_links.add_argument("--refresh", action="store_true", help="Ignore the link cache and re-probe everything")
+    p_links.add_argument("--no-external", action="store_true", help="Only check local /files/ and /images/ references")
+    p_links.add_argument("--timeout-seconds", type=int, default=20, help="HTTP timeout per request")
+    p_links.add_argument("--concurrency", type=int, default=8, help="Max HTTP requests in flight")
+
+    p_talkmap = sub.add_parser("talkmap", help="Rescan _talks/ and update the talk map markers")
+    p_talkmap.add_argument(
+        "--gazetteer",
+        default="",
+        help="Geocode offline from a compiled gazetteer or name<TAB>lat<TAB>lon file (see talkmap.py)",
+    )
+    p_talkmap.add_argument("--retry-missing", action="store_true", help="Re-query locations cached as not found")
+
     p_legacy = sub.add_parser("legacy", help="Run existing legacy automation script")
     p_legacy.add_argument("--task", required=True, choices=["add-paper", "add-talk", "setup-news"])
 
@@ -1328,12 +4589,46 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_verify = sub.add_parser("verify-publish", help="Crawl webpage and verify whether latest news is published")
     p_verify.add_argument("--url", default="", help="Page URL to verify (default: site /group-news/)")
+    p_verify.add_argument(
+        "--page",
+        action="append",
+        default=[],
+        help="Extra page to verify concurrently: URL or /permalink/, optionally URL::required text (repeatable)",
+    )
     p_verify.add_argument("--contains", action="append", default=[], help="Required text snippet in rendered page (repeatable)")
     p_verify.add_argument("--expect-image", action="append", default=[], help="Required image src token/path (repeatable)")
     p_verify.add_argument("--max-wait-seconds", type=int, default=300, help="Max wait time for deployment")
-    p_verify.add_argument("--interval-seconds", type=int, default=10, help="Retry interval")
+    p_verify.add_argument("--interval-seconds", type=int, default=5, help="Initial retry interval per page")
+    p_verify.add_argument(
+        "--max-interval-seconds", type=int, default=60, help="Backoff ceiling for pages that stay unchanged"
+    )
     p_verify.add_argument("--timeout-seconds", type=int, default=20, help="HTTP timeout per request")
     p_verify.add_argument("--no-cache-bust", action="store_true", help="Disable timestamp query for cache bypass")
+    p_verify.add_argument("--concurrency", type=int, default=8, help="Max HTTP requests in flight")
+    p_verify.add_argument(
+        "--no-image-check", action="store_true", help="Do not fetch expected image assets after the page passes"
+    )
+    p_verify.add_argument("--all-images", action="store_true", help="Fetch every <img src> on verified pages")
+    local_mode = p_verify.add_mutually_exclusive_group()
+    local_mode.add_argument(
+        "--local", action="store_const", const="only", default="", help="Check the generated _site/ instead of the live site"
+    )
+    local_mode.add_argument(
+        "--local-first",
+        action="store_const",
+        const="first",
+        dest="local",
+        help="Check _site/ first, then poll the live site only if the local build passes",
+    )
+    p_verify.add_argument("--no-build", action="store_true", help="With --local/--local-first, reuse the existing _site/")
+    p_verify.add_argument(
+        "--diff",
+        nargs="?",
+        const="auto",
+        default="",
+        metavar="REV",
+        help="Derive page targets from git changes since REV (default: working tree if dirty, else last commit)",
+    )
     p_verify.add_argument("--use-kimi", action="store_true", help="Use kimi_interface_minimal.py for semantic verification")
     p_verify.add_argument("--kimi-key-file", default="moonshot_api_key.txt")
     p_verify.add_argument("--kimi-model", default="moonshot-v1-8k")
@@ -1371,6 +4666,21 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_quick_all = sub.add_parser("quick-add-all", help="Batch add learning/papers/talks/news from a JSON manifest")
     p_quick_all.add_argument("--manifest", required=True, help="Path to JSON manifest file")
+    p_quick_all.add_argument("--asset-workers", type=int, default=4, help="Parallel asset copy workers")
+    p_quick_all.add_argument(
+        "--hardlink-assets",
+        action="store_true",
+        help="Hardlink assets instead of copying when source is on the same filesystem",
+    )
+    p_quick_all.add_argument(
+        "--reuse-identical-assets",
+        action="store_true",
+        help="Link to an existing identical file in files/ or images/ instead of adding a copy",
+    )
+    add_image_optimization_args(p_quick_all)
+    add_pdf_optimization_args(p_quick_all)
+    p_quick_all.add_argument("--image-workers", type=int, default=0, help="Image worker processes (default: CPU count)")
+    add_talkmap_update_args(p_quick_all)
     add_preview_args(p_quick_all)
 
     return parser
@@ -1396,6 +4706,7 @@ def main() -> int:
                 cert_name=args.cert_name.strip() or None,
                 cert_label=args.cert_label.strip() or None,
                 image_alt=args.image_alt.strip() or None,
+                images=_inline_image_optimizer(args),
             )
             return 0
         if args.command == "add-paper":
@@ -1414,10 +4725,11 @@ def main() -> int:
                 slug_hint=args.slug.strip() or None,
                 replace_existing=args.replace_existing,
                 normalize_venue_year=not args.keep_venue_year,
+                pdfs=_inline_pdf_processor(args),
             )
             return 0
         if args.command == "add-talk":
-            add_talk(
+            md_path, _, _, _ = add_talk(
                 title=args.title.strip(),
                 date_raw=args.date.strip(),
                 venue=args.venue.strip(),
@@ -1433,10 +4745,44 @@ def main() -> int:
                 cert_name=args.cert_name.strip() or None,
                 slug_hint=args.slug.strip() or None,
                 replace_existing=args.replace_existing,
+                images=_inline_image_optimizer(args),
+                pdfs=_inline_pdf_processor(args),
             )
+            if not args.no_talkmap:
+                refresh_talk_map([md_path])
             return 0
+        if args.command == "import-bib":
+            return import_bib(
+                bib_files=[b.strip() for b in args.bib],
+                category=args.category,
+                replace_existing=args.replace_existing,
+                normalize_venue_year=not args.keep_venue_year,
+                workers=args.workers or None,
+                chunk_size=max(args.chunk_size, 1),
+                dry_run=args.dry_run,
+            )
         if args.command == "audit-publications":
             return audit_publications(fix_venue_year=args.fix_venue_year)
+        if args.command == "optimize-images":
+            args.optimize_images = True
+            return optimize_images(
+                options=image_options_from_args(args),
+                workers=args.workers or None,
+                min_bytes=args.min_bytes,
+                force=args.force,
+            )
+        if args.command == "dedupe-assets":
+            return dedupe_assets(apply=args.apply)
+        if args.command == "talkmap":
+            return update_talk_map(gazetteer=args.gazetteer.strip(), retry_missing=args.retry_missing)
+        if args.command == "check-links":
+            return check_links(
+                ttl_hours=args.ttl_hours,
+                refresh=args.refresh,
+                external=not args.no_external,
+                timeout_seconds=args.timeout_seconds,
+                concurrency=max(1, args.concurrency),
+            )
         if args.command == "legacy":
             return run_legacy(args.task)
         if args.command == "build":
@@ -1457,6 +4803,14 @@ def main() -> int:
                 use_kimi=args.use_kimi,
                 kimi_key_file=args.kimi_key_file.strip(),
                 kimi_model=args.kimi_model.strip(),
+                pages=args.page,
+                max_interval_seconds=args.max_interval_seconds,
+                concurrency=max(1, args.concurrency),
+                check_images=not args.no_image_check,
+                all_images=args.all_images,
+                local=args.local,
+                build=not args.no_build,
+                diff=args.diff.strip(),
             )
         if args.command == "quick-add-learning":
             return quick_add_learning(
@@ -1485,6 +4839,7 @@ def main() -> int:
                 preview=args.preview,
                 host=args.host,
                 port=args.port,
+                images=_inline_image_optimizer(args),
             )
         if args.command == "quick-add-paper":
             return quick_add_paper(
@@ -1508,6 +4863,7 @@ def main() -> int:
                 preview=args.preview,
                 host=args.host,
                 port=args.port,
+                pdfs=_inline_pdf_processor(args),
             )
         if args.command == "quick-add-talk":
             return quick_add_talk(
@@ -1532,6 +4888,9 @@ def main() -> int:
                 preview=args.preview,
                 host=args.host,
                 port=args.port,
+                images=_inline_image_optimizer(args),
+                pdfs=_inline_pdf_processor(args),
+                update_map=not args.no_talkmap,
             )
         if args.command == "quick-add-all":
             return quick_add_all(
@@ -1539,6 +4898,13 @@ def main() -> int:
                 preview=args.preview,
                 host=args.host,
                 port=args.port,
+                asset_workers=args.asset_workers,
+                hardlink_assets=args.hardlink_assets,
+                reuse_identical_assets=args.reuse_identical_assets,
+                image_options=image_options_from_args(args),
+                image_workers=args.image_workers or None,
+                pdf_options=pdf_options_from_args(args),
+                update_map=not args.no_talkmap,
             )
 
         parser.print_help()
@@ -1,47 +1,807 @@
-
-
 # # Leaflet cluster map of talk locations
 #
 # (c) 2016-2017 R. Stuart Geiger, released under the MIT license
 #
-# Run this from the _talks/ directory, which contains .md files of all your talks. 
-# This scrapes the location YAML field from each .md file, geolocates it with
-# geopy/Nominatim, and uses the getorg library to output data, HTML,
-# and Javascript for a standalone cluster map.
+# This scrapes the location YAML field from each .md file in _talks/,
+# geolocates it and writes the marker data for the standalone Leaflet map in
+# talkmap/map.html: org-locations.js (the flat marker list) and
+# clusters.json (clusters precomputed for every zoom level, which is what
+# the page draws; see build_cluster_tiers). main.py's add-talk /
+# quick-add-talk / quick-add-all update the same data incrementally through
+# TalkMap, so running this script is only needed after editing talks by
+# hand (or use `python main.py talkmap`).
+#
+# Geocoding is a batch stage: locations are deduplicated, looked up in an
+# on-disk cache keyed by the normalized location string
+# (.site_cache/geocode.json), and only new ones are sent to the backend.
+# The default backend is the compiled offline gazetteer when it exists,
+# otherwise geopy/Nominatim (rate limited to 1 request/second);
+# --gazetteer FILE resolves from a local "name<TAB>lat<TAB>lon" file instead,
+# which needs no network and is what tests use.
+#
+# For fully offline runs, compile a GeoNames extract once
+# (https://download.geonames.org/export/dump/cities15000.txt and
+# countryInfo.txt) into .site_cache/gazetteer.bin.
 #
-# Requires: glob, getorg, geopy
+# Usage:
+#   python talkmap.py
+#   python talkmap.py --gazetteer places.tsv
+#   python talkmap.py --build-gazetteer cities15000.txt --country-info countryInfo.txt
+#   python talkmap.py --retry-missing
+#
+# Requires: geopy (Nominatim backend only)
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent
+TALKS_DIR = REPO_ROOT / "_talks"
+TALKMAP_DIR = REPO_ROOT / "talkmap"
+GEOCODE_CACHE_FILE = REPO_ROOT / ".site_cache" / "geocode.json"
+GEOCODE_CACHE_VERSION = 1
+GAZETTEER_FILE = REPO_ROOT / ".site_cache" / "gazetteer.bin"
+ADDRESS_POINTS_FILE = TALKMAP_DIR / "org-locations.js"
+TALKMAP_STATE_FILE = REPO_ROOT / ".site_cache" / "talkmap.json"
+TALKMAP_STATE_VERSION = 1
+CLUSTERS_FILE = TALKMAP_DIR / "clusters.json"
+CLUSTERS_FORMAT_VERSION = 1
+CLUSTER_MAX_ZOOM = 16
+CLUSTER_RADIUS_PX = 60
+NOMINATIM_USER_AGENT = "academicpages-talkmap"
+
+
+@dataclass(frozen=True)
+class GeoPoint:
+    """A resolved location; the attribute names match geopy's Location."""
+
+    address: str
+    latitude: float
+    longitude: float
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def normalize_location(value: str) -> str:
+    """Cache key for a location string: case, width, dash and spacing insensitive."""
+    s = unicodedata.normalize("NFKC", value).casefold()
+    s = re.sub(r"[‐-―−]", "-", s)
+    s = re.sub(r"\s*,\s*", ", ", s)
+    return re.sub(r"\s+", " ", s).strip(" ,")
+
+
+def read_talk_location(path: Path) -> str:
+    """Return the ``location:`` front-matter value of one talk, or ``""``."""
+    text = path.read_text(encoding="utf-8-sig")
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return ""
+    for line in lines[1:]:
+        if line.strip() == "---":
+            break
+        m = re.match(r"^location\s*:\s*(.*?)\s*$", line)
+        if m:
+            value = m.group(1)
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+                value = value[1:-1]
+                if m.group(1)[0] == "'":
+                    value = value.replace("''", "'")
+            return value.strip()
+    return ""
+
+
+def collect_talk_locations(talks_dir: Path = TALKS_DIR) -> dict[Path, str]:
+    """Map each talk file to its location; talks without one are left out."""
+    locations: dict[Path, str] = {}
+    for path in sorted(talks_dir.glob("*.md")):
+        location = read_talk_location(path)
+        if location:
+            locations[path] = location
+    return locations
+
+
+class GeocodeCache:
+    """Persistent ``normalized location -> result`` map.
+
+    Misses are cached too (``{"found": false}``) so an unresolvable location
+    is not re-queried on every run; pass ``retry_missing`` to try them again.
+    """
+
+    def __init__(self, path: Path = GEOCODE_CACHE_FILE) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+
+    def load(self) -> "GeocodeCache":
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if isinstance(data, dict) and data.get("version") == GEOCODE_CACHE_VERSION:
+                self.entries = data.get("locations") or {}
+        return self
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"version": GEOCODE_CACHE_VERSION, "locations": self.entries}
+        write_bytes_atomic(self.path, json.dumps(payload, ensure_ascii=False, indent=1, sort_keys=True).encode("utf-8"))
+        self.dirty = False
+
+    def get(self, key: str) -> dict | None:
+        return self.entries.get(key)
+
+    def put(self, key: str, query: str, point: GeoPoint | None, backend: str) -> None:
+        entry: dict[str, object] = {"query": query, "backend": backend, "resolved_at": int(time.time())}
+        if point is None:
+            entry["found"] = False
+        else:
+            entry.update(found=True, address=point.address, lat=point.latitude, lon=point.longitude)
+        self.entries[key] = entry
+        self.dirty = True
+
+    @staticmethod
+    def point(entry: dict) -> GeoPoint | None:
+        if not entry.get("found"):
+            return None
+        return GeoPoint(str(entry.get("address") or ""), float(entry["lat"]), float(entry["lon"]))
+
+
+class NominatimBackend:
+    """geopy/Nominatim, throttled to the service's 1 request/second policy."""
+
+    name = "nominatim"
+
+    def __init__(self, user_agent: str = NOMINATIM_USER_AGENT, min_delay_seconds: float = 1.0) -> None:
+        try:
+            from geopy.extra.rate_limiter import RateLimiter
+            from geopy.geocoders import Nominatim
+        except ImportError as exc:
+            raise RuntimeError("The Nominatim backend requires geopy. Install with: pip install geopy") from exc
+        geocoder = Nominatim(user_agent=user_agent, timeout=10)
+        self._geocode = RateLimiter(
+            geocoder.geocode,
+            min_delay_seconds=min_delay_seconds,
+            max_retries=3,
+            error_wait_seconds=5.0,
+            swallow_exceptions=False,
+        )
+
+    def geocode(self, query: str) -> GeoPoint | None:
+        from geopy.exc import GeocoderServiceError
+
+        try:
+            loc = self._geocode(query)
+        except GeocoderServiceError as exc:
+            raise RuntimeError(f"Geocoding failed for {query!r}: {exc}") from exc
+        if loc is None:
+            return None
+        return GeoPoint(loc.address, loc.latitude, loc.longitude)
+
+
+class GazetteerBackend:
+    """Exact lookup in a local ``name<TAB>lat<TAB>lon`` file (``#`` comments allowed).
+
+    Names are matched on :func:`normalize_location`, so the file can stand in
+    for the network service in tests and offline runs.
+    """
+
+    name = "gazetteer"
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.places: dict[str, GeoPoint] = {}
+        for lineno, line in enumerate(path.read_text(encoding="utf-8-sig").splitlines(), start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            parts = line.split("\t")
+            if len(parts) < 3:
+                raise ValueError(f"{path}:{lineno}: expected name<TAB>lat<TAB>lon")
+            name = parts[0].strip()
+            self.places[normalize_location(name)] = GeoPoint(name, float(parts[1]), float(parts[2]))
+
+    def geocode(self, query: str) -> GeoPoint | None:
+        return self.places.get(normalize_location(query))
+
+
+# -------------------------
+# Compiled GeoNames gazetteer
+# -------------------------
+#
+# File layout (little endian):
+#   MAGIC | u32 header length | header JSON | u32 record count
+#   | u32 record offsets (relative to the first record) | records
+# Each record is one UTF-8 line "key\tcc\tlat\tlon\tpopulation\tdisplay\n",
+# sorted by key bytes, so an exact match or a prefix range is a binary
+# search over the offset table of the memory-mapped file.
+
+GAZETTEER_MAGIC = b"TALKGAZ1"
+COUNTRY_ALIASES = {
+    "usa": "US",
+    "us": "US",
+    "united states of america": "US",
+    "america": "US",
+    "uk": "GB",
+    "england": "GB",
+    "scotland": "GB",
+    "wales": "GB",
+    "northern ireland": "GB",
+    "great britain": "GB",
+    "korea": "KR",
+    "south korea": "KR",
+    "republic of korea": "KR",
+    "russia": "RU",
+    "czech republic": "CZ",
+    "holland": "NL",
+    "the netherlands": "NL",
+    "prc": "CN",
+    "p r china": "CN",
+    "mainland china": "CN",
+    "uae": "AE",
+    "taiwan": "TW",
+}
+# US state and Canadian province abbreviations, which talk locations use in
+# the country position ("Cambridge, MA") and which often collide with ISO
+# country codes (CA, MA, GA, IN, ...).
+REGION_COUNTRIES = {
+    **dict.fromkeys(
+        "AL AK AZ AR CA CO CT DE DC FL GA HI ID IL IN IA KS KY LA ME MD MA MI MN MS MO MT NE "
+        "NV NH NJ NM NY NC ND OH OK OR PA RI SC SD TN TX UT VT VA WA WV WI WY".split(),
+        "US",
+    ),
+    **dict.fromkeys("AB BC MB NB NL NS NT NU ON PE QC SK YT".split(), "CA"),
+}
+FUZZY_MIN_RATIO = 0.8
+FUZZY_SCAN_LIMIT = 5000
+MAX_GAZETTEER_NAME_CHARS = 64
+
+
+def fold_place_name(value: str) -> str:
+    """Matching form of a place name: accent-free, casefolded, punctuation as spaces."""
+    s = unicodedata.normalize("NFKD", value)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).casefold()
+    s = re.sub(r"['’`]", "", s)
+    s = re.sub(r"[\W_]+", " ", s)
+    return s.strip()
+
+
+def _name_phrases(part: str) -> list[str]:
+    """Contiguous token runs of a folded location part, longest first."""
+    tokens = part.split()
+    return [
+        " ".join(tokens[start : start + size])
+        for size in range(len(tokens), 0, -1)
+        for start in range(len(tokens) - size + 1)
+    ]
+
+
+def build_geonames_gazetteer(cities_file: Path, output: Path, country_info: Path) -> int:
+    """Compile a GeoNames ``cities*.txt`` dump into the mmap gazetteer format.
+
+    Every name, ASCII name and alternate name becomes a key; for each
+    ``(key, country)`` only the most populous place is kept. Country names
+    and ISO3 codes from ``countryInfo.txt`` are stored in the header so that
+    "Valencia, Spain" can be filtered by country.
+    """
+    countries: dict[str, str] = {}
+    for line in country_info.read_text(encoding="utf-8").splitlines():
+        if not line or line.startswith("#"):
+            continue
+        cols = line.split("\t")
+        if len(cols) > 4 and len(cols[0]) == 2:
+            countries[fold_place_name(cols[4])] = cols[0]
+            countries[fold_place_name(cols[1])] = cols[0]
+    if not countries:
+        raise ValueError(f"No countries found in {country_info}; expected GeoNames countryInfo.txt")
+
+    best: dict[tuple[str, str], tuple[int, str, str, str]] = {}
+    with cities_file.open(encoding="utf-8") as fh:
+        for line in fh:
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) < 15 or cols[6] != "P":
+                continue
+            name, cc = cols[1], cols[8]
+            population = int(cols[14] or 0)
+            names = {cols[1], cols[2], *cols[3].split(",")}
+            for raw in names:
+                key = fold_place_name(raw)
+                if not key or len(key) > MAX_GAZETTEER_NAME_CHARS:
+                    continue
+                current = best.get((key, cc))
+                if current is None or population > current[0]:
+                    best[(key, cc)] = (population, f"{float(cols[4]):.5f}", f"{float(cols[5]):.5f}", name)
+
+    records = sorted(
+        (f"{key}\t{cc}\t{lat}\t{lon}\t{population}\t{display}\n".encode("utf-8"))
+        for (key, cc), (population, lat, lon, display) in best.items()
+    )
+    header = json.dumps({"source": cities_file.name, "countries": countries}, ensure_ascii=False).encode("utf-8")
+    offsets = bytearray()
+    position = 0
+    for record in records:
+        offsets += struct.pack("<I", position)
+        position += len(record)
+    data = b"".join(
+        [
+            GAZETTEER_MAGIC,
+            struct.pack("<I", len(header)),
+            header,
+            struct.pack("<I", len(records)),
+            bytes(offsets),
+            *records,
+        ]
+    )
+    write_bytes_atomic(output, data)
+    print(f"Gazetteer written to {output} ({len(records)} names, {len(data) / 1e6:.1f} MB).")
+    return len(records)
+
+
+class GeoNamesBackend:
+    """Offline lookup in a gazetteer compiled by :func:`build_geonames_gazetteer`.
+
+    ``"City, Country"`` strings are split on commas; the last part is used as
+    a country filter when it names one (``"Spain"``, ``"ES"``, ``"USA"``).
+    Token runs of the remaining parts are tried as exact keys, then the best
+    fuzzy match within the key's three-letter prefix range is accepted above
+    :data:`FUZZY_MIN_RATIO`. Ties go to the most populous place.
+    """
+
+    name = "geonames"
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fh = path.open("rb")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(GAZETTEER_MAGIC)] != GAZETTEER_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a compiled gazetteer")
+        pos = len(GAZETTEER_MAGIC)
+        (header_len,) = struct.unpack_from("<I", self._mm, pos)
+        header = json.loads(self._mm[pos + 4 : pos + 4 + header_len].decode("utf-8"))
+        pos += 4 + header_len
+        (self.count,) = struct.unpack_from("<I", self._mm, pos)
+        self._offsets_at = pos + 4
+        self._records_at = self._offsets_at + 4 * self.count
+        self.has_country_names = bool(header.get("countries"))
+        self.countries: dict[str, str] = {**header.get("countries", {}), **COUNTRY_ALIASES}
+
+    def close(self) -> None:
+        self._mm.close()
+        self._fh.close()
+
+    def _record_start(self, index: int) -> int:
+        return self._records_at + struct.unpack_from("<I", self._mm, self._offsets_at + 4 * index)[0]
+
+    def _key(self, index: int) -> bytes:
+        start = self._record_start(index)
+        return self._mm[start : self._mm.find(b"\t", start)]
+
+    def _record(self, index: int) -> tuple[str, str, float, float, int, str]:
+        start = self._record_start(index)
+        key, cc, lat, lon, population, display = (
+            self._mm[start : self._mm.find(b"\n", start)].decode("utf-8").split("\t")
+        )
+        return key, cc, float(lat), float(lon), int(population), display
+
+    def _bisect(self, key: bytes, right: bool = False) -> int:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = self._key(mid)
+            if other < key or (right and other == key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _prefix_range(self, prefix: str) -> range:
+        raw = prefix.encode("utf-8")
+        # 0xff never occurs in UTF-8, so it sorts after every key with this prefix.
+        return range(self._bisect(raw), self._bisect(raw + b"\xff"))
+
+    def _exact(self, key: str) -> list[tuple[str, str, float, float, int, str]]:
+        raw = key.encode("utf-8")
+        return [self._record(i) for i in range(self._bisect(raw), self._bisect(raw, right=True))]
+
+    def _fuzzy(self, key: str) -> list[tuple[str, str, float, float, int, str]]:
+        candidates = self._prefix_range(key[:3])
+        matcher = difflib.SequenceMatcher(None, "", key)
+        best_ratio, best_key = FUZZY_MIN_RATIO, ""
+        for i in candidates[:FUZZY_SCAN_LIMIT]:
+            matcher.set_seq1(self._key(i).decode("utf-8"))
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best_ratio, best_key = ratio, matcher.a
+        return self._exact(best_key) if best_key else []
+
+    def geocode(self, query: str) -> GeoPoint | None:
+        parts = [fold_place_name(p) for p in query.split(",")]
+        parts = [p for p in parts if p]
+        filters = [self.countries.get(parts[-1]) if len(parts) > 1 else None]
+        if filters[0] is None and len(parts) > 1:
+            if len(parts[-1]) != 2:
+                # An unknown trailing part ("Valencia, Spain" against a
+                # gazetteer without that country name) would otherwise fall
+                # back to the most populous Valencia anywhere.
+                return None
+            # Either an ISO code or a state/province ("Cambridge, MA"): try
+            # both readings, then no filter, until one of them matches.
+            code = parts[-1].upper()
+            filters = [code, REGION_COUNTRIES[code], None] if code in REGION_COUNTRIES else [code, None]
+        if filters[0] is not None:
+            parts = parts[:-1]
+
+        def pick(matches, country):
+            if country is not None:
+                matches = [m for m in matches if m[1] == country]
+            if not matches:
+                return None
+            key, cc, lat, lon, _, display = max(matches, key=lambda m: (m[4], m[1]))
+            return GeoPoint(f"{display}, {cc}", lat, lon)
+
+        for country in filters:
+            for part in parts:
+                for phrase in _name_phrases(part):
+                    point = pick(self._exact(phrase), country)
+                    if point is not None:
+                        return point
+        for part in parts:
+            matches = self._fuzzy(part)
+            for country in filters:
+                point = pick(matches, country)
+                if point is not None:
+                    return point
+        return None
+
+
+def open_gazetteer(path: Path):
+    """Backend for a gazetteer file: compiled GeoNames data or a plain TSV."""
+    with path.open("rb") as fh:
+        magic = fh.read(len(GAZETTEER_MAGIC))
+    return GeoNamesBackend(path) if magic == GAZETTEER_MAGIC else GazetteerBackend(path)
+
+
+def default_backend():
+    """The compiled offline gazetteer when one has been built, else Nominatim.
+
+    Gazetteers compiled without ``--country-info`` cannot resolve "City,
+    Country" locations, so they are only used when requested explicitly.
+    """
+    if GAZETTEER_FILE.exists():
+        backend = GeoNamesBackend(GAZETTEER_FILE)
+        if backend.has_country_names:
+            return backend
+        backend.close()
+        print(f"Ignoring {GAZETTEER_FILE.name}: built without --country-info; rebuild it to use it by default.")
+    return NominatimBackend()
+
+
+def geocode_locations(
+    locations: list[str],
+    backend,
+    cache: GeocodeCache,
+    retry_missing: bool = False,
+) -> dict[str, GeoPoint | None]:
+    """Resolve many location strings with one backend call per new normalized key.
+
+    ``backend=None`` defers to :func:`default_backend`, which is only
+    constructed when something is missing from the cache.
+    """
+    keys: dict[str, str] = {}
+    for location in locations:
+        keys.setdefault(normalize_location(location), location)
+
+    pending = [
+        (key, query)
+        for key, query in keys.items()
+        if cache.get(key) is None or (retry_missing and not cache.get(key).get("found"))
+    ]
+    if pending:
+        backend = backend or default_backend()
+        print(f"Geocoding {len(pending)} new location(s) with {backend.name} ({len(keys) - len(pending)} cached)...")
+    try:
+        for key, query in pending:
+            point = backend.geocode(query)
+            cache.put(key, query, point, backend.name)
+            print(f"  {query} -> {point.address if point else 'not found'}")
+    finally:
+        cache.save()
+
+    return {location: GeocodeCache.point(cache.get(normalize_location(location)) or {}) for location in locations}
+
+
+# -------------------------
+# Cluster-map data file
+# -------------------------
+
+def read_address_points(path: Path = ADDRESS_POINTS_FILE) -> list[list]:
+    """Markers from ``org-locations.js`` (``var addressPoints = [[name, lat, lon], ...];``)."""
+    if not path.exists():
+        return []
+    m = re.search(r"=\s*(\[.*\])\s*;?\s*$", path.read_text(encoding="utf-8-sig"), re.S)
+    if not m:
+        raise ValueError(f"Unrecognized talk map data file: {path}")
+    return json.loads(m.group(1))
+
+
+def render_address_points(markers: list[list]) -> str:
+    return "var addressPoints = " + json.dumps(markers, ensure_ascii=False, indent=2) + ";\n"
+
+
+@dataclass
+class _ClusterNode:
+    x: float
+    y: float
+    talks: int
+    members: list[int]
+    expansion_zoom: int
+
+
+def _mercator(lat: float, lon: float) -> tuple[float, float]:
+    """Web Mercator world coordinates in [0, 1)."""
+    sin = math.sin(math.radians(max(-85.0511, min(85.0511, lat))))
+    return (lon + 180.0) / 360.0 % 1.0, 0.5 - math.log((1 + sin) / (1 - sin)) / (4 * math.pi)
+
+
+def _inverse_mercator(x: float, y: float) -> tuple[float, float]:
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+    return lat, x * 360.0 - 180.0
+
+
+def build_cluster_tiers(
+    points: list[list],
+    max_zoom: int = CLUSTER_MAX_ZOOM,
+    radius_px: int = CLUSTER_RADIUS_PX,
+) -> dict:
+    """Precompute the marker clusters for every zoom level from 0 to ``max_zoom``.
+
+    ``points`` are ``[name, lat, lon, talks]``. Clustering runs bottom-up on
+    a Web Mercator grid of ``radius_px`` screen pixels per cell, so each tier
+    merges whole clusters of the tier below. A tier entry is either
+    ``[point_index]`` or ``[lat, lon, talks, expansion_zoom]``, where
+    ``expansion_zoom`` is the first zoom at which the cluster splits.
+    Above ``max_zoom`` every point is drawn on its own.
+    """
+    level = []
+    for i, (_, lat, lon, talks) in enumerate(points):
+        x, y = _mercator(lat, lon)
+        level.append(_ClusterNode(x, y, talks, [i], max_zoom + 1))
+
+    tiers: list[list] = [[] for _ in range(max_zoom + 1)]
+    for zoom in range(max_zoom, -1, -1):
+        cell = radius_px / (256 * 2**zoom)
+        groups: dict[tuple[int, int], list[_ClusterNode]] = {}
+        for node in level:
+            groups.setdefault((int(node.x // cell), int(node.y // cell)), []).append(node)
+        merged = []
+        for key in sorted(groups):
+            children = groups[key]
+            if len(children) == 1:
+                merged.append(children[0])
+                continue
+            talks = sum(c.talks for c in children)
+            merged.append(
+                _ClusterNode(
+                    x=sum(c.x * c.talks for c in children) / talks,
+                    y=sum(c.y * c.talks for c in children) / talks,
+                    talks=talks,
+                    members=[i for c in children for i in c.members],
+                    expansion_zoom=zoom + 1,
+                )
+            )
+        for node in merged:
+            if len(node.members) == 1:
+                tiers[zoom].append([node.members[0]])
+            else:
+                lat, lon = _inverse_mercator(node.x, node.y)
+                tiers[zoom].append([round(lat, 5), round(lon, 5), node.talks, node.expansion_zoom])
+        level = merged
+
+    return {
+        "v": CLUSTERS_FORMAT_VERSION,
+        "maxZoom": max_zoom,
+        "points": [[name, round(lat, 5), round(lon, 5), talks] for name, lat, lon, talks in points],
+        "tiers": tiers,
+    }
+
+
+def _talk_key(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+class TalkMap:
+    """The cluster-map markers plus the ``talk -> location`` map they came from.
+
+    The sidecar state (``.site_cache/talkmap.json``) lets :meth:`update`
+    apply just the talks that changed: only locations that gain their first
+    talk are geocoded and appended, only locations that lose their last talk
+    are dropped, and ``org-locations.js`` is rewritten only when the marker
+    list actually changes. Without state, the first update rescans
+    ``_talks/``.
+    """
+
+    def __init__(
+        self,
+        talks_dir: Path = TALKS_DIR,
+        data_file: Path = ADDRESS_POINTS_FILE,
+        state_file: Path = TALKMAP_STATE_FILE,
+        clusters_file: Path = CLUSTERS_FILE,
+    ) -> None:
+        self.talks_dir = talks_dir
+        self.data_file = data_file
+        self.clusters_file = clusters_file
+        self.state_file = state_file
+        self.talks: dict[str, str] = {}
+        self.markers: list[list] = []
+        self.has_state = False
+
+    def load(self) -> "TalkMap":
+        self.markers = read_address_points(self.data_file)
+        if self.state_file.exists():
+            try:
+                data = json.loads(self.state_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if isinstance(data, dict) and data.get("version") == TALKMAP_STATE_VERSION:
+                self.talks = data.get("talks") or {}
+                self.has_state = True
+        return self
+
+    def _save_state(self) -> None:
+        payload = {"version": TALKMAP_STATE_VERSION, "talks": self.talks}
+        write_bytes_atomic(self.state_file, json.dumps(payload, ensure_ascii=False, indent=1, sort_keys=True).encode("utf-8"))
+        self.has_state = True
+
+    def update(
+        self,
+        paths: list[Path] | None = None,
+        backend=None,
+        cache: GeocodeCache | None = None,
+        retry_missing: bool = False,
+    ) -> tuple[int, int]:
+        """Apply changed talk files (``None``: rescan all); return (added, removed) markers."""
+        if paths is None or not self.has_state:
+            talks = {_talk_key(p): loc for p, loc in collect_talk_locations(self.talks_dir).items()}
+        else:
+            talks = {key: loc for key, loc in self.talks.items() if (REPO_ROOT / key).exists()}
+            for path in paths:
+                location = read_talk_location(path) if path.exists() else ""
+                if location:
+                    talks[_talk_key(path)] = location
+                else:
+                    talks.pop(_talk_key(path), None)
 
-import glob
-import getorg
-from geopy import Nominatim
+        wanted: dict[str, str] = {}
+        for key in sorted(talks):
+            wanted.setdefault(normalize_location(talks[key]), talks[key])
+        current = {normalize_location(str(m[0])): m for m in self.markers}
 
-g = glob.glob("*.md")
+        markers = [m for m in self.markers if normalize_location(str(m[0])) in wanted]
+        removed = len(self.markers) - len(markers)
+        new_locations = [loc for key, loc in wanted.items() if key not in current]
+        added = 0
+        if new_locations:
+            cache = cache or GeocodeCache().load()
+            resolved = geocode_locations(new_locations, backend, cache, retry_missing)
+            for location in new_locations:
+                point = resolved[location]
+                if point is None:
+                    print(f"Warning: could not geocode talk location {location!r}; it is left off the map.")
+                    continue
+                markers.append([location, point.latitude, point.longitude])
+                added += 1
 
+        if markers != self.markers:
+            write_bytes_atomic(self.data_file, render_address_points(markers).encode("utf-8"))
+            self.markers = markers
+        if talks != self.talks or not self.has_state:
+            self.talks = talks
+            self._save_state()
+        self._write_clusters()
+        return added, removed
 
-geocoder = Nominatim()
-location_dict = {}
-location = ""
-permalink = ""
-title = ""
+    def _write_clusters(self) -> None:
+        """Rewrite clusters.json when the markers or their talk counts changed."""
+        counts: dict[str, int] = {}
+        for location in self.talks.values():
+            key = normalize_location(location)
+            counts[key] = counts.get(key, 0) + 1
+        points = [[m[0], m[1], m[2], counts.get(normalize_location(str(m[0])), 1)] for m in self.markers]
+        data = json.dumps(build_cluster_tiers(points), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if not self.clusters_file.exists() or self.clusters_file.read_bytes() != data:
+            write_bytes_atomic(self.clusters_file, data)
 
 
-for file in g:
-    with open(file, 'r') as f:
-        lines = f.read()
-        if lines.find('location: "') > 1:
-            loc_start = lines.find('location: "') + 11
-            lines_trim = lines[loc_start:]
-            loc_end = lines_trim.find('"')
-            location = lines_trim[:loc_end]
-                            
-           
-        location_dict[location] = geocoder.geocode(location)
-        print(location, "\n", location_dict[location])
+def build_talk_map(
+    paths: list[Path] | None = None,
+    talks_dir: Path = TALKS_DIR,
+    output_dir: Path = TALKMAP_DIR,
+    backend=None,
+    cache: GeocodeCache | None = None,
+    retry_missing: bool = False,
+) -> TalkMap:
+    talk_map = TalkMap(
+        talks_dir,
+        data_file=output_dir / ADDRESS_POINTS_FILE.name,
+        clusters_file=output_dir / CLUSTERS_FILE.name,
+    ).load()
+    added, removed = talk_map.update(paths, backend=backend, cache=cache, retry_missing=retry_missing)
+    print(f"Talk map: +{added} / -{removed} marker(s), {len(talk_map.markers)} total ({talk_map.data_file}).")
+    return talk_map
 
 
-m = getorg.orgmap.create_map_obj()
-getorg.orgmap.output_html_cluster_map(location_dict, folder_name="../talkmap", hashed_usernames=False)
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the Leaflet cluster map of talk locations")
+    parser.add_argument("--talks-dir", default=str(TALKS_DIR))
+    parser.add_argument("--output", default=str(TALKMAP_DIR), help="Folder holding map.html and org-locations.js")
+    parser.add_argument("--cache", default=str(GEOCODE_CACHE_FILE), help="Geocode cache file")
+    parser.add_argument(
+        "--gazetteer",
+        default="",
+        help="Resolve offline from a compiled gazetteer or a name<TAB>lat<TAB>lon file instead of Nominatim",
+    )
+    parser.add_argument("--offline", action="store_true", help=f"Shortcut for --gazetteer {GAZETTEER_FILE.relative_to(REPO_ROOT)}")
+    parser.add_argument("--retry-missing", action="store_true", help="Re-query locations cached as not found")
+    parser.add_argument(
+        "--build-gazetteer",
+        metavar="CITIES_TXT",
+        default="",
+        help="Compile a GeoNames cities dump (e.g. cities15000.txt) into the gazetteer file and exit",
+    )
+    parser.add_argument(
+        "--country-info",
+        default="",
+        help="GeoNames countryInfo.txt, for country-name filters (required with --build-gazetteer)",
+    )
+    args = parser.parse_args()
 
+    gazetteer = Path(args.gazetteer) if args.gazetteer else GAZETTEER_FILE
+    if args.build_gazetteer:
+        if not args.country_info:
+            parser.error("--build-gazetteer requires --country-info")
+        build_geonames_gazetteer(Path(args.build_gazetteer), gazetteer, Path(args.country_info))
+        return 0
 
+    backend = open_gazetteer(gazetteer) if args.gazetteer or args.offline else None
+    build_talk_map(
+        None,
+        talks_dir=Path(args.talks_dir),
+        output_dir=Path(args.output),
+        backend=backend,
+        cache=GeocodeCache(Path(args.cache)).load(),
+        retry_missing=args.retry_missing,
+    )
+    return 0
 
 
+if __name__ == "__main__":
+    raise SystemExit(main())